@@ -0,0 +1,87 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures BLE writes saved by batch frames against a simulated gateway.
+
+LED updates like `State.__check_led` (a CLED, then one SLED per buzzer) are sent along with concurrent
+PING. The same run is done against a simulated older firmware, which makes the backend fall back to
+single command writes.
+
+Run from the repository root:
+    python -m backend.Benchmarks.BatchWriteBenchmark
+"""
+
+import asyncio
+import time
+
+from backend.BuzzerLogic.Constants import LED_NB
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import LEDs, Color
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 16
+UPDATE_NB: int = 50
+
+
+async def run(name: str, batch_support: bool) -> int:
+    """Runs the benchmark against a given firmware.
+
+    Args:
+        name (str): Name of the firmware, for display.
+        batch_support (bool): Whether the simulated firmware unpacks batch frames.
+
+    Returns:
+        int: Number of BLE writes done.
+    """
+
+    # No jitter: it would reorder CLED and SLED sent back to back, which ESP-NOW does not do
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, esp_now_jitter=0, batch_support=batch_support, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    writes = gateway.stats["writes"]
+
+    t = time.perf_counter()
+
+    for i in range(UPDATE_NB):
+        leds = LEDs(LED_NB)
+        leds.leds = [Color(i, 255 - i, j) for j in range(LED_NB)]
+
+        await bt_comm.commands.clear_leds()
+        await asyncio.gather(
+            *[bt_comm.commands.set_leds(leds, j.mac) for j in gateway.buzzers],
+            *[bt_comm.commands.ping(j.mac) for j in gateway.buzzers[:4]]
+        )
+
+    elapsed = time.perf_counter() - t
+
+    await asyncio.sleep(0.1)
+
+    commands = UPDATE_NB * (1 + BUZZER_NB + 4)
+    writes = gateway.stats["writes"] - writes
+    valid = all(i.leds == bytes(leds) for i in gateway.buzzers)
+
+    print(f"{name}:")
+    print(f"    batch frames used: {bt_comm.batch_supported}, final LEDs valid: {valid}")
+    print(f"    {commands} commands in {writes} BLE writes ({commands / writes:.1f} commands/write), "
+          f"{elapsed * 1000:.0f} ms, {commands / elapsed:.0f} commands/s")
+
+    await gateway.disconnect()
+
+    return writes
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    single = await run("Older firmware (single command writes)", False)
+    batch = await run("Batch firmware", True)
+
+    print(f"BLE writes saved: {single - batch} ({(1 - batch / single) * 100:.0f} %)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures buzzer clock estimation against a simulated gateway with drifting oscillators.
+
+Clocks are synchronized once with ACLK, then sampled with broadcast GCLK. The estimated offsets are
+compared with the true clocks of the simulated buzzers, and close presses (a few ms apart, on two
+different buzzers) are ranked on raw clocks and on corrected clocks.
+
+Run from the repository root:
+    python -m backend.Benchmarks.ClockEstimatorBenchmark
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+DRIFT_PPM: float = 500.0
+SAMPLE_INTERVAL: float = 0.1
+SAMPLE_DURATION: float = 5.0
+ROUND_NB: int = 40
+PRESS_GAPS: tuple[float, ...] = (0.002, 0.004, 0.008)
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, drift_ppm=DRIFT_PPM, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+    clock_estimator = bt_comm.clock_estimator
+
+    await bt_comm.connect_until_complete()
+    await bt_comm.commands.automatic_set_clock()
+
+    end = time.monotonic() + SAMPLE_DURATION
+
+    while time.monotonic() < end:
+        await clock_estimator.sample()
+        await asyncio.sleep(SAMPLE_INTERVAL)
+
+    # Prediction error: corrected clock of each buzzer against the true computer time it was read at
+    errors = []
+
+    for i in gateway.buzzers:
+        now = time.monotonic() * 1000
+        errors.append(abs(clock_estimator.corrected(i.mac_str, i.get_clock()) - now))
+
+    print(f"Clock models after {SAMPLE_DURATION:.0f} s ({clock_estimator.stats}):")
+    for mac, i in clock_estimator.get_estimates().items():
+        print(f"    {mac}  offset={i['offset_ms']:12.2f} ms  drift={i['drift_ppm']:8.1f} ppm  "
+              f"error bound={i['error_ms']:6.2f} ms  samples={i['samples']}")
+
+    print(f"    true drifts (ppm): {', '.join(f'{i.drift_ppm:.1f}' for i in gateway.buzzers)}")
+    print(f"    corrected clock error  mean={statistics.mean(errors):6.2f} ms  max={max(errors):6.2f} ms")
+    print(f"    highest error bound    {clock_estimator.max_error_bound():6.2f} ms")
+
+    # Ranking of close presses: buzzer clocks are read as BPRS would carry them
+    rand = random.Random(0)
+
+    for gap in PRESS_GAPS:
+        raw_right = corrected_right = 0
+
+        for _ in range(ROUND_NB):
+            first, second = rand.sample(gateway.buzzers, 2)
+
+            first_clock = first.get_clock()
+            await asyncio.sleep(gap)
+            second_clock = second.get_clock()
+
+            raw_right += first_clock < second_clock
+            corrected_right += (clock_estimator.corrected(first.mac_str, first_clock)
+                                < clock_estimator.corrected(second.mac_str, second_clock))
+
+        print(f"Presses {gap * 1000:.0f} ms apart: right order on raw clocks {raw_right}/{ROUND_NB}, "
+              f"on corrected clocks {corrected_right}/{ROUND_NB}")
+
+    await gateway.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
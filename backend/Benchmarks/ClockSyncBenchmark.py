@@ -0,0 +1,104 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures the cost of clock synchronization on press rounds against a simulated gateway.
+
+Each round does what `State.wait_press` does before buzzers can be pressed, then presses a few buzzers
+a few ms apart. The former behavior (ACLK before every round) is run as a baseline, then the background
+clock sync service, which only suspends clock sets during the round.
+
+Run from the repository root:
+    python -m backend.Benchmarks.ClockSyncBenchmark
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+DRIFT_PPM: float = 50.0
+ROUND_NB: int = 20
+PRESSED_NB: int = 3
+PRESS_GAP: float = 0.004
+
+
+async def run(name: str, background: bool) -> None:
+    """Runs press rounds with a given clock synchronization strategy.
+
+    Args:
+        name (str): Name of the strategy, for display.
+        background (bool): Whether the background clock sync service is used instead of ACLK every round.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, drift_ppm=DRIFT_PPM, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    bt_comm.clock_sync.interval = 0.5
+    sync_task = asyncio.create_task(bt_comm.clock_sync.run()) if background else None
+
+    # Let the first clock set and a few sampling rounds happen
+    await asyncio.sleep(3 if background else 0)
+
+    rand = random.Random(0)
+    setups = []
+    right = 0
+    esp_now_sent = gateway.stats["esp_now_sent"]
+
+    for _ in range(ROUND_NB):
+        t = time.perf_counter()
+
+        if background:
+            await bt_comm.clock_sync.suspend()
+
+        else:
+            await bt_comm.commands.automatic_set_clock()
+
+        bt_comm.but_callback.arm([i.mac for i in gateway.buzzers])
+        setups.append(time.perf_counter() - t)
+
+        pressed = rand.sample(gateway.buzzers, PRESSED_NB)
+        waiter = asyncio.create_task(bt_comm.but_callback.get_first_press(timeout=2))
+        await asyncio.sleep(0.01)
+
+        for i, j in enumerate(pressed):
+            asyncio.get_running_loop().call_later(i * PRESS_GAP, gateway.press, j.mac)
+
+        first = await waiter
+        right += first.data[0] == pressed[0].mac_str
+
+        bt_comm.clock_sync.resume()
+
+        # Time between two questions
+        await asyncio.sleep(0.3)
+
+    esp_now_sent = gateway.stats["esp_now_sent"] - esp_now_sent
+
+    print(f"{name}:")
+    print(f"    round setup  mean={statistics.mean(setups) * 1000:7.2f} ms  max={max(setups) * 1000:7.2f} ms")
+    print(f"    right winner {right}/{ROUND_NB} (presses {PRESS_GAP * 1000:.0f} ms apart), "
+          f"{esp_now_sent} ESP-NOW packets")
+    print(f"    {bt_comm.clock_sync.get_stats()}")
+
+    if sync_task is not None:
+        sync_task.cancel()
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("ACLK before every round", False)
+    await run("Background clock sync", True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
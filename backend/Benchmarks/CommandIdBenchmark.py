@@ -0,0 +1,98 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Stress test of command ID allocation against a simulated gateway.
+
+Thousands of concurrent unicast PING are sent, and each response is checked to come from the pinged
+buzzer. The former plain 0–255 counter is run as a baseline.
+
+Run from the repository root:
+    python -m backend.Benchmarks.CommandIdBenchmark
+"""
+
+import asyncio
+import random
+import time
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.CommandIdAllocator import CommandIdAllocator
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 16
+COMMAND_NB: int = 5000
+CONCURRENCY: int = 300
+
+
+class CounterAllocator:
+    """Former allocator: a plain 0–255 counter, kept as a baseline for this benchmark."""
+
+    def __init__(self) -> None:
+        self.__cmd_id: int = 0
+
+    async def allocate(self, track: bool = False) -> int:
+        cmd_id = self.__cmd_id
+        self.__cmd_id = (self.__cmd_id + 1) % 256
+
+        return cmd_id
+
+    def release(self, cmd_id: int, answered: bool = False) -> None:
+        pass
+
+
+async def run(name: str, allocator: CounterAllocator | CommandIdAllocator) -> None:
+    """Runs the stress test with a given allocator.
+
+    Args:
+        name (str): Name of the allocator, for display.
+        allocator (CounterAllocator | CommandIdAllocator): Allocator to use.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, esp_now_latency=0.02, esp_now_jitter=0.03, seed=1)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+    bt_comm.cmd_ids = allocator
+
+    await bt_comm.connect_until_complete()
+
+    rand = random.Random(1)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    results = {"ok": 0, "mismatch": 0, "lost": 0}
+
+    async def ping_one() -> None:
+        buzzer = gateway.buzzers[rand.randrange(BUZZER_NB)]
+
+        async with semaphore:
+            ret = await bt_comm.commands.ping(buzzer.mac)
+
+        if not ret:
+            results["lost"] += 1
+
+        elif len(ret) != 1 or ret[0].data[0] != buzzer.mac_str:
+            results["mismatch"] += 1
+
+        else:
+            results["ok"] += 1
+
+    t = time.perf_counter()
+    await asyncio.gather(*[ping_one() for _ in range(COMMAND_NB)])
+    elapsed = time.perf_counter() - t
+
+    print(f"{name}:")
+    print(f"    {COMMAND_NB / elapsed:9.1f} cmd/s  {results}")
+
+    if isinstance(allocator, CommandIdAllocator):
+        print(f"    allocator stats: {allocator.stats}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Plain counter", CounterAllocator())
+    await run("CommandIdAllocator", CommandIdAllocator())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the stale-while-revalidate connected cache with the former blocking one.
+
+Against a simulated gateway, GUI requests read the connected buzzers (`get_connected_str`) in bursts
+of concurrent callers, like `ApiStatus.get_connected` and `ApiTeams.update_team`, while the roster
+keeps expiring. One buzzer misses the broadcast, so pings wait for their full timeout, like a buzzer
+switched off. Read latencies and broadcast PING sent are measured. Without other traffic (no clock
+sampling), the current cache pings silent buzzers one by one.
+
+Run from the repository root:
+    python -m backend.Benchmarks.ConnectedCacheBenchmark
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List, Iterable
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.RecvPool import RecvObject
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+BURST_NB: int = 10
+CALLERS_PER_BURST: int = 5
+EXPIRES_AFTER: int = 1
+
+
+class BlockingConnectedCache:
+    """Former ConnectedCache implementation, kept as a baseline for this benchmark."""
+
+    def __init__(self, bt_comm: BluetoothCommunication, expires_after: int = 30) -> None:
+        self.bt_comm = bt_comm
+        self.expires_after = expires_after
+
+        self.next_poll: int = 0
+        self.pings: int = 0
+
+        self.__connected: List[str] = []
+
+    async def update_cache(self, force: bool = False, expected: None | Iterable[str] = None) -> None:
+        if not force and self.next_poll > time.time():
+            return
+
+        self.pings += 1
+
+        expected_set = set(self.__connected) | set(expected if expected is not None else [])
+
+        ret: List[RecvObject] = await self.bt_comm.commands.ping(
+            target_mac=b"\xFF\xFF\xFF\xFF\xFF\xFF",
+            expected=expected_set
+        )
+
+        self.__connected = [i.data[0] for i in ret]
+        self.next_poll = int(time.time() + self.expires_after)
+
+    async def get_connected_str(self) -> List[str]:
+        await self.update_cache()
+
+        return self.__connected
+
+
+async def run(name: str, blocking: bool) -> None:
+    """Reads the connected buzzers in bursts.
+
+    Args:
+        name (str): Name of the cache, for display.
+        blocking (bool): Whether the former blocking cache is used.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, esp_now_jitter=0, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    if blocking:
+        cache = BlockingConnectedCache(bt_comm, EXPIRES_AFTER)
+
+    else:
+        # The cache of `bt_comm` is the one receiving the PING answers
+        cache = bt_comm.connected_cache
+        cache.expires_after = EXPIRES_AFTER
+
+    # Loaded once, like the first GUI request does
+    await cache.get_connected_str()
+    gateway.buzzers[-1].powered = False
+
+    latencies = []
+
+    async def read() -> None:
+        t = time.perf_counter()
+        await cache.get_connected_str()
+        latencies.append(time.perf_counter() - t)
+
+    for _ in range(BURST_NB):
+        await asyncio.gather(*[read() for _ in range(CALLERS_PER_BURST)])
+        await asyncio.sleep(0.6)
+
+    pings = cache.pings if blocking else cache.stats["broadcasts"]
+
+    print(f"{name}:")
+    print(f"    read latency  mean={statistics.mean(latencies) * 1000:8.2f} ms  "
+          f"max={max(latencies) * 1000:8.2f} ms, {pings} broadcast PING")
+
+    if not blocking:
+        print(f"    {cache.get_stats()}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Blocking cache", True)
+    await run("Stale-while-revalidate cache", False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
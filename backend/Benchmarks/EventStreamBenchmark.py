@@ -0,0 +1,127 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares scoreboard screens polling the API with following the event stream (`/api/events`).
+
+A game minute is replayed: a state change or a score every second. Polling screens fetch
+`/api/status/get_state` and `/api/teams/get` twice a second, each poll serializing every team.
+Following screens get a snapshot, then the events published by `State` and the team registry,
+encoded once by `EventBus` whatever the number of screens. Serialization and delivery CPU time and
+bytes sent are measured, the HTTP layer is left out of both.
+
+Run from the repository root:
+    python -m backend.Benchmarks.EventStreamBenchmark
+"""
+
+import asyncio
+import json
+import time
+from typing import List
+
+from backend.BuzzerLogic.State import State, StateEnum
+from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import Color
+
+SCREEN_NB: int = 50
+TEAM_NB: int = 16
+GAME_DURATION: int = 60
+POLL_RATE: float = 2.0
+
+
+def poll(state: State, teams: TeamRegistry) -> int:
+    """Serializes the responses of one poll, like the status and teams APIs do.
+
+    Args:
+        state (State): Game state.
+        teams (TeamRegistry): Teams of the game.
+
+    Returns:
+        int: Bytes sent.
+    """
+
+    state_json = json.dumps({'state': str(state.current_state).split(".")[1]})
+    teams_json = json.dumps({i.name: i.to_dict() for i in teams})
+
+    return len(state_json) + len(teams_json)
+
+
+def play_second(state: State, teams: List[Team], second: int) -> None:
+    """Plays one second of the game: a press checked, or a point scored and back to IDLE.
+
+    State changes are published like `State` does, without driving the buzzer LEDs.
+
+    Args:
+        state (State): Game state.
+        teams (List[Team]): Teams of the game.
+        second (int): Second of the game.
+    """
+
+    team = teams[second % len(teams)]
+
+    if second % 2:
+        state.team_check = team
+        state.current_state = StateEnum.CHECK
+
+    else:
+        state.teams.add_point(team.name)
+        state.team_check = None
+        state.current_state = StateEnum.IDLE
+
+    state.bt_comm.events.publish("state", state.to_dict())
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    bt_comm = BluetoothCommunication()
+
+    teams = [Team(f"Team {i}", Color(255, 0, 0), Color(0, 0, 255), bt_comm, 16) for i in range(TEAM_NB)]
+
+    for i, team in enumerate(teams):
+        team.associated_buzzers = [bytes([0x5A, 0x1B, 0, 0, i, j]) for j in range(2)]
+
+    registry = TeamRegistry(bt_comm, teams)
+    state = State(registry, bt_comm)
+
+    # Polling: every screen serializes the whole game on each poll
+    sent = 0
+    t = time.perf_counter()
+
+    for second in range(GAME_DURATION):
+        play_second(state, teams, second)
+
+        for _ in range(int(SCREEN_NB * POLL_RATE)):
+            sent += poll(state, registry)
+
+    polling_time = time.perf_counter() - t
+    polling_sent = sent
+
+    # Event stream: a snapshot per screen, then every event encoded once and queued to every screen
+    events = bt_comm.events
+    sent = 0
+    t = time.perf_counter()
+
+    queues = [events.subscribe() for _ in range(SCREEN_NB)]
+    sent += SCREEN_NB * poll(state, registry)
+
+    for second in range(GAME_DURATION):
+        play_second(state, teams, second)
+
+        for i in queues:
+            while not i.empty():
+                sent += len(i.get_nowait().sse)
+
+    stream_time = time.perf_counter() - t
+
+    print(f"{SCREEN_NB} screens, {TEAM_NB} teams, {GAME_DURATION} s of game")
+    print(f"{'Polling':<14} {polling_time * 1000:9.2f} ms CPU  {polling_sent / 1024:9.1f} KiB sent")
+    print(f"{'Event stream':<14} {stream_time * 1000:9.2f} ms CPU  {sent / 1024:9.1f} KiB sent, {events.get_stats()}")
+    print(f"CPU {polling_time / stream_time:.1f}x lower, {polling_sent / sent:.1f}x fewer bytes")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
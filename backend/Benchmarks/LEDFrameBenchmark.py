@@ -0,0 +1,164 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the bytearray backed LEDs with the former list of Color implementation.
+
+Each frame is built like the game builds it (`Team.set_led_point`, `State.__check_led` and the
+confirm/deny flashes), then serialized with `bytes()`, as `Commands.set_leds` does.
+
+Run from the repository root:
+    python -m backend.Benchmarks.LEDFrameBenchmark
+"""
+
+import time
+import tracemalloc
+from typing import List, Any, Callable
+
+from backend.BuzzerLogic.Constants import LED_NB
+from backend.ESPCommunication.LEDManager import LEDs, Color
+
+FRAME_NB: int = 20000
+
+PRIMARY: Color = Color(0, 0, 255)
+POINTS: List[Color] = [PRIMARY if i % 3 else Color(0, 0, 0) for i in range(8)]
+
+
+class ListLEDs:
+    """Former LEDs implementation, kept as a baseline for this benchmark."""
+
+    def __init__(self, led_nb: int) -> None:
+        self.led_nb = led_nb
+        self.leds: List[Color] = [Color(0, 0, 0) for _ in range(self.led_nb)]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "leds":
+            if not isinstance(value, list) or len(value) != getattr(self, "led_nb", len(value)):
+                raise ValueError(f"Leds must be a list of length {self.led_nb}")
+
+        elif name == "led_nb" and "led_nb" in self.__dict__:
+            raise RuntimeError("This attribute is a constant")
+
+        super().__setattr__(name, value)
+
+    def __bytes__(self) -> bytes:
+        return b"".join([bytes(i) for i in self.leds])
+
+
+def list_point_frame() -> bytes:
+    l = ListLEDs(LED_NB)
+
+    for i, j in enumerate(POINTS):
+        l.leds[i] = j
+        l.leds[i + 8] = j
+
+    for i in range(16, LED_NB):
+        l.leds[i] = PRIMARY
+
+    return bytes(l)
+
+
+def list_check_frame() -> bytes:
+    l = ListLEDs(LED_NB)
+    l.leds = [Color(255, 0, 0) if i % 2 == 0 else Color(0, 255, 0) for i in range(LED_NB)]
+
+    return bytes(l)
+
+
+def list_flash_frame() -> bytes:
+    l = ListLEDs(LED_NB)
+    l.leds = [Color(0, 255, 0) for _ in range(LED_NB)]
+
+    return bytes(l)
+
+
+def array_point_frame() -> bytes:
+    l = LEDs(LED_NB)
+
+    l[0:8] = POINTS
+    l.mirror(0, 8, 8)
+    l.fill(PRIMARY, 16, LED_NB)
+
+    return bytes(l)
+
+
+def array_check_frame() -> bytes:
+    return bytes(LEDs(LED_NB).fill(Color(0, 255, 0)).fill(Color(255, 0, 0), step=2))
+
+
+def array_flash_frame() -> bytes:
+    return bytes(LEDs(LED_NB).fill(Color(0, 255, 0)))
+
+
+def timed(func: Callable[[], bytes]) -> float:
+    """Builds and serializes frames.
+
+    Args:
+        func (Callable[[], bytes]): Function building and serializing a frame.
+
+    Returns:
+        float: Cost per frame, in microseconds.
+    """
+
+    t = time.perf_counter()
+
+    for _ in range(FRAME_NB):
+        func()
+
+    return (time.perf_counter() - t) / FRAME_NB * 1e6
+
+
+def memory(make: Callable[[], object]) -> float:
+    """Measures memory retained per frame object.
+
+    Args:
+        make (Callable[[], object]): Function creating a frame object.
+
+    Returns:
+        float: Retained memory per object, in bytes.
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    objects = [make() for _ in range(1000)]
+
+    cost = (tracemalloc.get_traced_memory()[0] - before) / len(objects)
+    tracemalloc.stop()
+
+    return cost
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    frames = [
+        ("score frame (Team.set_led_point)", list_point_frame, array_point_frame),
+        ("check frame (State.__check_led)", list_check_frame, array_check_frame),
+        ("flash frame (confirm / deny)", list_flash_frame, array_flash_frame)
+    ]
+
+    print(f"{'':<36} {'List[Color]':>14} {'bytearray':>14} {'ratio':>8}")
+
+    for name, former, current in frames:
+        assert former() == current(), f"{name} differs"
+
+        former_cost, current_cost = timed(former), timed(current)
+
+        print(f"{name:<36} {former_cost:11.2f} us {current_cost:11.2f} us {former_cost / current_cost:7.1f}x")
+
+    def list_leds() -> ListLEDs:
+        l = ListLEDs(LED_NB)
+        l.leds = [Color(0, 255, 0) for _ in range(LED_NB)]
+        return l
+
+    former_memory = memory(list_leds)
+    current_memory = memory(lambda: LEDs(LED_NB).fill(Color(0, 255, 0)))
+
+    print(f"{'memory per frame':<36} {former_memory:9.0f} B {current_memory:11.0f} B "
+          f"{former_memory / current_memory:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
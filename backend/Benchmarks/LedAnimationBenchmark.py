@@ -0,0 +1,122 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures confirm/deny responsiveness against a simulated gateway.
+
+A press is confirmed, then the next round is started 0.3 s later, while the confirmation still
+flashes. The former blocking flashes (awaited `asyncio.sleep` between writes) are compared with the
+background animations of `LedAnimator`: time for `confirm_press` to return, time until the buzzers
+show the next round, and whether they still show it once every flash would have been written.
+
+Run from the repository root:
+    python -m backend.Benchmarks.LedAnimationBenchmark
+"""
+
+import asyncio
+import time
+
+from backend.BuzzerLogic.Constants import LED_NB
+from backend.BuzzerLogic.State import State, StateEnum
+from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import LEDs, Color
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+TEAM_NB: int = 4
+BUZZERS_PER_TEAM: int = 2
+NEXT_ROUND_DELAY: float = 0.3
+
+
+async def blocking_confirm_press(state: State) -> None:
+    """Confirms the current press like `State.confirm_press` did before flashes were animated.
+
+    Args:
+        state (State): Game state, in CHECK.
+    """
+
+    state.team_check.point += 1
+
+    frames = {mac: bytes(LEDs(LED_NB).fill(Color(0, 255, 0))) for mac in state.team_check.associated_buzzers}
+
+    await state.bt_comm.commands.clear_leds()
+
+    for i in range(5):
+        await state.bt_comm.commands.commit_frames(frames)
+        await asyncio.sleep(0.25)
+
+        await state.bt_comm.commands.clear_leds()
+        await asyncio.sleep(0.25)
+
+    await state.set_idle()
+
+
+async def run(name: str, blocking: bool) -> None:
+    """Confirms a press then starts the next round.
+
+    Args:
+        name (str): Name of the run, for display.
+        blocking (bool): Whether the former blocking flashes are used.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=TEAM_NB * BUZZERS_PER_TEAM, esp_now_jitter=0, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    teams = []
+
+    for i in range(TEAM_NB):
+        team = Team(f"Team {i}", Color(255, i * 60, 0), Color(0, 0, 255), bt_comm, 8)
+        team.associated_buzzers = [j.mac for j in gateway.buzzers[i * BUZZERS_PER_TEAM:(i + 1) * BUZZERS_PER_TEAM]]
+        teams.append(team)
+
+    state = State(TeamRegistry(bt_comm, teams), bt_comm)
+    white = bytes(LEDs(LED_NB).fill(Color(255, 255, 255)))
+
+    state.current_state = StateEnum.CHECK
+    state.team_check = teams[0]
+    await state.set_led_on_state()
+
+    start = time.perf_counter()
+    returned = []
+
+    # Run in background, so another HTTP request can start the next round while it runs
+    confirm = asyncio.create_task(blocking_confirm_press(state) if blocking else state.confirm_press())
+    confirm.add_done_callback(lambda _: returned.append(time.perf_counter() - start))
+
+    await asyncio.sleep(NEXT_ROUND_DELAY)
+
+    # Next round, like `State.wait_press` does before waiting
+    t = time.perf_counter()
+
+    state.current_state = StateEnum.WAIT
+    await state.set_led_on_state()
+
+    while any(i.leds != white for i in gateway.buzzers):
+        await asyncio.sleep(0.0005)
+
+    shown = time.perf_counter() - t
+
+    await confirm
+    await asyncio.sleep(2.5)
+
+    print(f"{name}:")
+    print(f"    confirm_press returned in {returned[0] * 1000:8.2f} ms, next round shown in {shown * 1000:.2f} ms")
+    print(f"    buzzers still show the next round after the flashes: {all(i.leds == white for i in gateway.buzzers)}, "
+          f"animator {bt_comm.led_animator.stats}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Blocking flashes", True)
+    await run("Animated flashes", False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures the time to display an IDLE refresh of a large room against a simulated gateway.
+
+Every team gets a new score frame, sent to each of its buzzers. Frames are sent one buzzer after the
+other (awaiting each write), then concurrently per team, then committed at once with
+`Commands.commit_frames`. The time until every buzzer shows its frame is measured.
+
+Run from the repository root:
+    python -m backend.Benchmarks.LedFanoutBenchmark
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Dict, Callable, Awaitable
+
+from backend.BuzzerLogic.Team import Team
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import Color
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+TEAM_NB: int = 10
+BUZZERS_PER_TEAM: int = 3
+REFRESH_NB: int = 20
+
+
+async def sequential(bt_comm: BluetoothCommunication, frames: Dict[bytes, Dict[bytes, bytes]]) -> None:
+    for team_frames in frames.values():
+        for mac, frame in team_frames.items():
+            await bt_comm.commands.set_leds(frame, mac)
+
+
+async def per_team(bt_comm: BluetoothCommunication, frames: Dict[bytes, Dict[bytes, bytes]]) -> None:
+    async def team(team_frames: Dict[bytes, bytes]) -> None:
+        await asyncio.gather(*[bt_comm.commands.set_leds(frame, mac) for mac, frame in team_frames.items()])
+
+    await asyncio.gather(*[team(i) for i in frames.values()])
+
+
+async def committed(bt_comm: BluetoothCommunication, frames: Dict[bytes, Dict[bytes, bytes]]) -> None:
+    await bt_comm.commands.commit_frames({mac: frame for i in frames.values() for mac, frame in i.items()})
+
+
+async def run(name: str, send: Callable[[BluetoothCommunication, Dict[bytes, Dict[bytes, bytes]]], Awaitable[None]]) \
+        -> None:
+    """Refreshes every team LEDs with a given sending strategy.
+
+    Args:
+        name (str): Name of the strategy, for display.
+        send (Callable): Coroutine function sending the frames of every team.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=TEAM_NB * BUZZERS_PER_TEAM, esp_now_jitter=0, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    teams = []
+
+    for i in range(TEAM_NB):
+        team = Team(f"Team {i}", Color(255, i * 20, 0), Color(0, 0, 255), bt_comm, 16)
+        team.associated_buzzers = [j.mac for j in gateway.buzzers[i * BUZZERS_PER_TEAM:(i + 1) * BUZZERS_PER_TEAM]]
+        teams.append(team)
+
+    by_mac = {i.mac: i for i in gateway.buzzers}
+    displays = []
+    writes = gateway.stats["writes"]
+
+    for refresh in range(REFRESH_NB):
+        for i in teams:
+            i.point = (refresh + teams.index(i)) % 17
+
+        frames = {i.name.encode(): i.led_frames() for i in teams}
+        expected = {mac: frame for i in frames.values() for mac, frame in i.items()}
+
+        t = time.perf_counter()
+        await send(bt_comm, frames)
+
+        while any(by_mac[mac].leds != frame for mac, frame in expected.items()):
+            await asyncio.sleep(0.0005)
+
+        displays.append(time.perf_counter() - t)
+
+        await asyncio.sleep(0.05)
+
+    writes = gateway.stats["writes"] - writes
+
+    print(f"{name}:")
+    print(f"    time to display  mean={statistics.mean(displays) * 1000:7.2f} ms  "
+          f"max={max(displays) * 1000:7.2f} ms, {writes / REFRESH_NB:.1f} BLE writes/refresh")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    print(f"{TEAM_NB} teams x {BUZZERS_PER_TEAM} buzzers")
+
+    await run("One buzzer after the other", sequential)
+    await run("Concurrent per team", per_team)
+    await run("Committed at once", committed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures LED writes skipped by the LED shadow against a simulated gateway.
+
+A game session is played: LED resets from the GUI (`/api/lights/reset_led_default`), presses being
+checked then denied, and points scored, which all redraw the team LEDs. It is run with the shadow
+disabled, then enabled, and the LEDs shown by the buzzers are checked to be the same.
+
+Run from the repository root:
+    python -m backend.Benchmarks.LedShadowBenchmark
+"""
+
+import asyncio
+import random
+from typing import List
+
+from backend.BuzzerLogic.State import State, StateEnum
+from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import Color
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+TEAM_NB: int = 4
+BUZZERS_PER_TEAM: int = 2
+ROUND_NB: int = 30
+
+
+async def run(name: str, shadow: bool) -> List[bytes]:
+    """Plays a game session.
+
+    Args:
+        name (str): Name of the run, for display.
+        shadow (bool): Whether the LED shadow is enabled.
+
+    Returns:
+        List[bytes]: Final LEDs of every buzzer.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=TEAM_NB * BUZZERS_PER_TEAM, esp_now_jitter=0, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+    bt_comm.led_shadow.enabled = shadow
+
+    await bt_comm.connect_until_complete()
+
+    teams = []
+
+    for i in range(TEAM_NB):
+        team = Team(f"Team {i}", Color(255, i * 60, 0), Color(0, 0, 255), bt_comm, 8)
+        team.associated_buzzers = [j.mac for j in gateway.buzzers[i * BUZZERS_PER_TEAM:(i + 1) * BUZZERS_PER_TEAM]]
+        teams.append(team)
+
+    state = State(TeamRegistry(bt_comm, teams), bt_comm)
+    rand = random.Random(0)
+
+    writes = gateway.stats["writes"]
+    esp_now_sent = gateway.stats["esp_now_sent"]
+
+    await state.set_idle()
+
+    for _ in range(ROUND_NB):
+        match rand.randrange(3):
+            case 0:
+                # LED reset from the GUI
+                await state.set_led_on_state()
+
+            case 1:
+                # Press checked then denied, without the flashes
+                state.current_state = StateEnum.CHECK
+                state.team_check = rand.choice(teams)
+
+                await state.set_led_on_state()
+                await state.set_idle()
+
+            case _:
+                rand.choice(teams).point += 1
+                await state.set_idle()
+
+    await asyncio.sleep(0.1)
+
+    print(f"{name}:")
+    print(f"    {gateway.stats['writes'] - writes} BLE writes, "
+          f"{gateway.stats['esp_now_sent'] - esp_now_sent} ESP-NOW packets, shadow {bt_comm.led_shadow.stats}")
+
+    await gateway.disconnect()
+
+    return [i.leds for i in gateway.buzzers]
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    without_shadow = await run("Without LED shadow", False)
+    with_shadow = await run("With LED shadow", True)
+
+    print(f"Same final LEDs: {without_shadow == with_shadow}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares passive buzzer discovery with a connected cache refreshed by broadcast PING only.
+
+Against a simulated gateway running the background clock sampling (broadcast GCLK), the GUI reads the
+connected buzzers several times a second. Midway, a buzzer is switched off and another one switched on.
+Broadcast PING sent, PING packets sent on the ESP-NOW network, and the time for the roster to notice
+both changes are measured. Roster TTLs are scaled down so the run stays short.
+
+Run from the repository root:
+    python -m backend.Benchmarks.PassiveDiscoveryBenchmark
+"""
+
+import asyncio
+import time
+from typing import List, Iterable
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.ConnectedCache import ConnectedCache
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 20
+EXPIRES_AFTER: int = 1
+SAMPLE_INTERVAL: float = 0.5
+READ_INTERVAL: float = 0.2
+DURATION: float = 8.0
+
+
+class BroadcastConnectedCache:
+    """ConnectedCache refreshed by broadcast PING only, kept as a baseline for this benchmark."""
+
+    def __init__(self, bt_comm: BluetoothCommunication, expires_after: int = 30) -> None:
+        self.bt_comm = bt_comm
+        self.expires_after = expires_after
+
+        self.next_poll: float = 0
+        self.stats = {"broadcasts": 0, "unicasts": 0}
+
+        self.__connected: List[str] = []
+        self.__loaded: bool = False
+        self.__refresh_task: None | asyncio.Task = None
+
+    @property
+    def connected(self) -> List[str]:
+        return self.__connected
+
+    async def update_cache(self, force: bool = False, expected: None | Iterable[str] = None) -> None:
+        if not force and self.next_poll > time.time():
+            return
+
+        if self.__refresh_task is None or self.__refresh_task.done():
+            self.__refresh_task = asyncio.create_task(self.__ping(expected))
+
+        if force or not self.__loaded:
+            await asyncio.shield(self.__refresh_task)
+
+    async def __ping(self, expected: None | Iterable[str]) -> None:
+        self.stats["broadcasts"] += 1
+
+        ret = await self.bt_comm.commands.ping(
+            target_mac=b"\xFF\xFF\xFF\xFF\xFF\xFF",
+            expected=set(self.__connected) | set(expected if expected is not None else [])
+        )
+
+        self.__connected = [i.data[0] for i in ret]
+        self.__loaded = True
+        self.next_poll = time.time() + self.expires_after
+
+    async def get_connected_str(self) -> List[str]:
+        await self.update_cache()
+
+        return self.__connected
+
+
+async def run(name: str, passive: bool) -> None:
+    """Plays the scenario.
+
+    Args:
+        name (str): Name of the cache, for display.
+        passive (bool): Whether passive discovery is used.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, esp_now_jitter=0, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    if passive:
+        bt_comm.connected_cache.expires_after = EXPIRES_AFTER
+        cache = bt_comm.connected_cache
+
+    else:
+        # Notifications still reach `bt_comm.connected_cache`, which is simply not read
+        cache = BroadcastConnectedCache(bt_comm, EXPIRES_AFTER)
+
+    off, on = gateway.buzzers[1], gateway.buzzers[2]
+    on.powered = False
+
+    await bt_comm.connect_until_complete()
+    await cache.get_connected_str()
+
+    pings = 0
+    original_ping = bt_comm.commands.ping
+
+    async def counted_ping(target_mac: bytes | str = None, expected: None | Iterable[str] = None):
+        nonlocal pings
+        pings += BUZZER_NB - 1 if bt_comm.is_broadcast(target_mac) else 1
+
+        return await original_ping(target_mac=target_mac, expected=expected)
+
+    bt_comm.commands.ping = counted_ping
+
+    async def sampling() -> None:
+        while True:
+            await bt_comm.clock_estimator.sample()
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+    sampler = asyncio.create_task(sampling())
+
+    start = time.monotonic()
+    changed_at = None
+    lost_after = found_after = None
+
+    while time.monotonic() - start < DURATION:
+        connected = await cache.get_connected_str()
+
+        if changed_at is None and time.monotonic() - start > DURATION / 4:
+            off.powered, on.powered = False, True
+            changed_at = time.monotonic()
+
+        elif changed_at is not None:
+            if lost_after is None and off.mac_str not in connected:
+                lost_after = time.monotonic() - changed_at
+
+            if found_after is None and on.mac_str in connected:
+                found_after = time.monotonic() - changed_at
+
+        await asyncio.sleep(READ_INTERVAL)
+
+    sampler.cancel()
+    await asyncio.gather(sampler, return_exceptions=True)
+
+    def fmt(value: None | float) -> str:
+        return f"{value * 1000:7.0f} ms" if value is not None else "    never"
+
+    print(f"{name}:")
+    print(f"    {cache.stats['broadcasts']} broadcast PING, {pings} PING packets on ESP-NOW, "
+          f"switched off buzzer dropped after {fmt(lost_after)}, switched on buzzer found after {fmt(found_after)}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    print(f"{BUZZER_NB} buzzers, {DURATION:.0f} s, roster TTL {EXPIRES_AFTER} s")
+
+    await run("Broadcast PING only", False)
+    await run("Passive discovery", True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
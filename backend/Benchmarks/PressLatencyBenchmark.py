@@ -0,0 +1,163 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures button press to decision latency against a simulated gateway.
+
+Each round, a few buzzers are pressed 20 ms apart while `get_first_press` is waiting,
+with clock queries running in the background. The former pool based callback (fixed 150 ms window)
+is run as a baseline, then the adaptive window with and without armed buzzers.
+
+Run from the repository root:
+    python -m backend.Benchmarks.PressLatencyBenchmark
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.ButtonCallback import ButtonCallback
+from backend.ESPCommunication.RecvPool import RecvObject
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+ROUND_NB: int = 30
+PRESSED_NB: int = 3
+PRESS_GAP: float = 0.02
+
+
+class PoolButtonCallback:
+    """Former callback going through the receive pool, kept as a baseline for this benchmark."""
+
+    def __init__(self, bt_comm: BluetoothCommunication) -> None:
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.last_seen: List[RecvObject] = []
+
+        self.__callback_event: asyncio.Event = asyncio.Event()
+        self.__callback_running: bool = False
+
+    def on_press(self, obj: RecvObject) -> None:
+        self.bt_comm.recv_pool.insert_object(obj)
+        self.bprs_callback_maker()
+
+    def on_clock(self, obj: RecvObject) -> None:
+        pass
+
+    def bprs_callback_maker(self) -> None:
+        if self.__callback_running:
+            return
+
+        self.__callback_running = True
+
+        asyncio.create_task(self.__callback())
+
+    async def __callback(self) -> None:
+        try:
+            await asyncio.sleep(0.15)
+
+            presses = list(filter(lambda x: x not in self.last_seen, self.bt_comm.recv_pool.get_object_by_cmd("BPRS")))
+            presses.sort(key=lambda x: int(x.data[1]))
+
+            if not presses:
+                return
+
+            self.__callback_event.set()
+
+            self.last_seen = presses.copy()
+
+        finally:
+            self.bt_comm.recv_pool.clear_by_command("BPRS")
+
+            self.__callback_running = False
+
+    async def get_first_press(self, timeout: None | float = None) -> RecvObject:
+        self.__callback_event.clear()
+
+        try:
+            await asyncio.wait_for(self.__callback_event.wait(), timeout=timeout)
+            return self.last_seen[0]
+
+        finally:
+            self.__callback_event.clear()
+
+
+async def run(name: str, callback_class: type[PoolButtonCallback] | type[ButtonCallback], arm: bool) -> None:
+    """Runs the benchmark with a given button callback.
+
+    Args:
+        name (str): Name of the callback, for display.
+        callback_class (type): Button callback to use.
+        arm (bool): Whether every buzzer is armed, allowing early decisions. Otherwise none is, and
+            windows only close when their latency bound expires.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+    bt_comm.but_callback = callback_class(bt_comm)
+
+    await bt_comm.connect_until_complete()
+    await bt_comm.commands.automatic_set_clock()
+
+    if isinstance(bt_comm.but_callback, ButtonCallback):
+        bt_comm.but_callback.arm([i.mac for i in gateway.buzzers] if arm else [])
+
+    rand = random.Random(0)
+    running = True
+
+    async def background() -> None:
+        while running:
+            await bt_comm.commands.get_clock(gateway.buzzers[rand.randrange(BUZZER_NB)].mac)
+
+    background_task = asyncio.create_task(background())
+
+    latencies = []
+    right = 0
+
+    for _ in range(ROUND_NB):
+        pressed = rand.sample(gateway.buzzers, PRESSED_NB)
+
+        waiter = asyncio.create_task(bt_comm.but_callback.get_first_press(timeout=2))
+        await asyncio.sleep(0.01)
+
+        t = time.perf_counter()
+
+        for i, j in enumerate(pressed):
+            asyncio.get_running_loop().call_later(i * PRESS_GAP, gateway.press, j.mac)
+
+        first = await waiter
+        latencies.append(time.perf_counter() - t)
+
+        right += first.data[0] == pressed[0].mac_str
+
+        await asyncio.sleep(0.2)
+
+    running = False
+    await background_task
+
+    latencies.sort()
+
+    print(f"{name}:")
+    print(f"    press to decision  mean={statistics.mean(latencies) * 1000:7.2f} ms  "
+          f"p50={latencies[len(latencies) // 2] * 1000:7.2f} ms  max={latencies[-1] * 1000:7.2f} ms")
+    print(f"    right winner {right}/{ROUND_NB}")
+
+    if isinstance(bt_comm.but_callback, ButtonCallback):
+        print(f"    {bt_comm.but_callback.get_stats()}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Pool based callback", PoolButtonCallback, False)
+    await run("Adaptive window, latency bound only", ButtonCallback, False)
+    await run("Adaptive window, armed buzzers", ButtonCallback, True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,224 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures the press arbiter against synthetic storms of near-simultaneous presses.
+
+Every buzzer of a storm is armed and presses once, all presses within a few ms (each sent twice, like
+the firmware does), then reports its clock like an answer to the arbitration GCLK. The CPU time spent
+until the decision is measured, along with the tie detection. The former arbiter (earliest press and
+armed buzzers scanned on every packet) is run as a baseline.
+
+Run from the repository root:
+    python -m backend.Benchmarks.PressStormBenchmark
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import time
+from typing import List, Dict, Set, Tuple, Iterable
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.ButtonCallback import ButtonCallback
+from backend.ESPCommunication.RecvPool import RecvObject
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+STORM_SIZES: Tuple[int, ...] = (100, 300, 1000)
+STORM_SPREAD: float = 3.0
+CLEAR_LEAD: float = 40.0
+BASE_CLOCK: int = 1000000
+
+PRESS_IDS: itertools.count = itertools.count()
+
+
+class ScanningButtonCallback:
+    """Former arbiter decision logic, kept as a baseline for this benchmark.
+
+    The earliest press is searched among every press, and every armed buzzer is checked, on each packet.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication) -> None:
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.max_window: float = 0.15
+
+        self.__armed: Set[str] = set()
+        self.__clocks: Dict[str, int] = {}
+        self.__seen: Dict[Tuple[None | str, int], float] = {}
+        self.__window_presses: List[RecvObject] = []
+        self.__window_handle: None | asyncio.TimerHandle = None
+        self.__callback_event: asyncio.Event = asyncio.Event()
+
+        self.last_seen: List[RecvObject] = []
+
+    def arm(self, macs: Iterable[str]) -> None:
+        self.__armed = {i.upper() for i in macs}
+
+    def on_press(self, obj: RecvObject) -> None:
+        key = (obj.mac, obj.cmd_id)
+
+        if key in self.__seen:
+            return
+
+        self.__seen[key] = time.monotonic()
+
+        if self.__window_handle is None:
+            self.__clocks = {}
+            self.__window_handle = asyncio.get_running_loop().call_later(self.max_window, self.__decide)
+
+        self.__window_presses.append(obj)
+        self.on_clock(obj)
+
+    def on_clock(self, obj: RecvObject) -> None:
+        if self.__window_handle is None:
+            return
+
+        mac, clock = obj.mac, obj.clock
+        self.__clocks[mac] = max(clock, self.__clocks.get(mac, clock))
+
+        if self.__can_decide_early():
+            self.__decide()
+
+    def __press_time(self, obj: RecvObject) -> float:
+        return self.bt_comm.clock_estimator.corrected(obj.mac, obj.clock)
+
+    def __can_decide_early(self) -> bool:
+        earliest = min(self.__press_time(i) for i in self.__window_presses)
+        clock_estimator = self.bt_comm.clock_estimator
+
+        return all(i in self.__clocks and clock_estimator.corrected(i, self.__clocks[i]) >= earliest
+                   for i in self.__armed)
+
+    def __decide(self) -> None:
+        if self.__window_handle is None:
+            return
+
+        self.__window_handle.cancel()
+        self.__window_handle = None
+
+        self.last_seen = sorted(self.__window_presses, key=self.__press_time)
+        self.__window_presses = []
+
+        self.__callback_event.set()
+
+    async def wait(self) -> None:
+        await self.__callback_event.wait()
+        self.__callback_event.clear()
+
+
+def make_storm(size: int, rand: random.Random, clear_winner: bool,
+               press_id: int) -> Tuple[List[RecvObject], List[RecvObject]]:
+    """Builds the packets of a press storm.
+
+    Args:
+        size (int): Number of buzzers pressing.
+        rand (random.Random): Random generator.
+        clear_winner (bool): Whether the first buzzer presses well before the others.
+        press_id (int): Firmware press ID of every press, which must differ from the previous storm.
+
+    Returns:
+        Tuple[List[RecvObject], List[RecvObject]]: BPRS packets in arrival order (duplicates included),
+        then the GCLK reports of every buzzer.
+    """
+
+    presses = []
+    reports = []
+
+    for i in range(size):
+        mac = f"5A:1B:00:00:{i >> 8:02X}:{i & 0xFF:02X}"
+        clock = BASE_CLOCK + int(rand.uniform(0, STORM_SPREAD))
+
+        if clear_winner and i == 0:
+            clock -= int(CLEAR_LEAD)
+
+        packet = bytearray(bytes([press_id % 256]) + f"BPRS {mac} {clock}".encode() + b"\x00")
+        presses += [RecvObject(0, packet), RecvObject(0, packet)]
+
+        reports.append(RecvObject(0, bytearray(b"\x00" + f"GCLK {mac} {BASE_CLOCK + 50}".encode() + b"\x00")))
+
+    # Delivery order is not press order
+    rand.shuffle(presses)
+
+    return presses, reports
+
+
+async def storm(bt_comm: BluetoothCommunication, callback: ButtonCallback | ScanningButtonCallback,
+                size: int, clear_winner: bool) -> float:
+    """Runs a storm through an arbiter.
+
+    Args:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance the arbiter uses.
+        callback (ButtonCallback | ScanningButtonCallback): Arbiter to use.
+        size (int): Number of buzzers pressing.
+        clear_winner (bool): Whether the first buzzer presses well before the others.
+
+    Returns:
+        float: CPU time spent handling packets until the decision, in ms.
+    """
+
+    presses, reports = make_storm(size, random.Random(size), clear_winner, next(PRESS_IDS))
+
+    callback.arm([i.mac for i in reports])
+
+    if isinstance(callback, ButtonCallback):
+        waiter = asyncio.create_task(callback.get_result(timeout=2))
+
+    else:
+        waiter = asyncio.create_task(callback.wait())
+
+    await asyncio.sleep(0)
+
+    t = time.perf_counter()
+
+    for i in presses:
+        callback.on_press(i)
+
+    for i in reports:
+        callback.on_clock(i)
+
+    elapsed = (time.perf_counter() - t) * 1000
+
+    await waiter
+
+    # Let the probe GCLK and its responses go before the next storm
+    await asyncio.sleep(0.2)
+
+    return elapsed
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    gateway = SimulatedGateway(buzzer_nb=2, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    scanning = ScanningButtonCallback(bt_comm)
+    callback = ButtonCallback(bt_comm)
+
+    for size in STORM_SIZES:
+        former = await storm(bt_comm, scanning, size, False)
+        current = await storm(bt_comm, callback, size, False)
+        result = callback.last_result
+
+        clear = await storm(bt_comm, callback, size, True)
+        clear_result = callback.last_result
+
+        print(f"Storm of {size} presses within {STORM_SPREAD:.0f} ms:")
+        print(f"    former arbiter  {former:9.2f} ms CPU until decision")
+        print(f"    current arbiter {current:9.2f} ms CPU until decision ({former / current:.1f}x faster)")
+        print(f"    tie: {result.tie}, {len(result.tied)}/{len(result.presses)} tied, "
+              f"spread {max(i.delta for i in result.presses if i.delta != math.inf):.0f} ms")
+        print(f"    with a press {CLEAR_LEAD:.0f} ms ahead ({clear:.2f} ms CPU): tie: {clear_result.tie}, "
+              f"winner {clear_result.winner.mac}")
+
+    print(callback.get_stats())
+
+    await gateway.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
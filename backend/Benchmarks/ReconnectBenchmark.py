@@ -0,0 +1,110 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares reconnection with backoff and LED replay with the former fixed 5 s retry loop.
+
+The BLE link to a simulated gateway drops in the middle of a game, and the gateway stays out of reach
+for a short while. As the firmware does, every buzzer is cleared when the link drops. The game keeps
+setting LED frames meanwhile, either one frame per buzzer, or the same frame broadcast to every buzzer
+as while waiting for a press. The time to reconnect, and the time until every buzzer shows its latest
+frame, are measured. The simulated gateway needs no scan, so only the retry delays are compared.
+
+Run from the repository root:
+    python -m backend.Benchmarks.ReconnectBenchmark
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+LED_NB: int = 20
+OUT_OF_REACH: float = 0.6
+MAX_WAIT: float = 15.0
+
+
+class LegacyBluetoothCommunication(BluetoothCommunication):
+    """BluetoothCommunication retrying every 5 s without replay, as it did before, kept as a baseline."""
+
+    async def connect_until_complete(self) -> None:
+        while not await self.connect_oneshot():
+            await asyncio.sleep(5)
+
+        self.events.publish("connection", {"connected": True})
+
+
+async def run(name: str, legacy: bool, wait: bool) -> None:
+    """Drops the link during a game and waits until buzzers show their latest frame.
+
+    Args:
+        name (str): Name of the reconnection policy, for display.
+        legacy (bool): Whether the former retry loop is used.
+        wait (bool): Whether frames are broadcast, as in WAIT, instead of sent to each buzzer.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, led_nb=LED_NB, seed=0)
+    bt_comm = (LegacyBluetoothCommunication if legacy else BluetoothCommunication)(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    def frames(frame: bytes) -> Dict[None | bytes, bytes]:
+        return {None: frame} if wait else {i.mac: frame for i in gateway.buzzers}
+
+    await bt_comm.commands.commit_frames(frames(b"\x10" * (3 * LED_NB)))
+
+    gateway.reachable = False
+    gateway.simulate_disconnect()
+
+    start = time.perf_counter()
+
+    # The game goes on: a point is scored while the gateway is out of reach
+    latest = b"\x20" * (3 * LED_NB)
+
+    try:
+        await bt_comm.commands.commit_frames(frames(latest))
+
+    except Exception:
+        pass
+
+    await asyncio.sleep(OUT_OF_REACH)
+    gateway.reachable = True
+
+    reconnected = caught_up = None
+
+    while time.perf_counter() - start < MAX_WAIT and caught_up is None:
+        now = time.perf_counter() - start
+
+        if reconnected is None and gateway.is_connected:
+            reconnected = now
+
+        if all(i.leds == latest for i in gateway.buzzers):
+            caught_up = now
+
+        await asyncio.sleep(0.01)
+
+    def show(value: None | float) -> str:
+        return f"{value * 1000:8.0f} ms" if value is not None else f"  > {MAX_WAIT:.0f} s"
+
+    print(f"{name}:")
+    print(f"    reconnected after {show(reconnected)}, every buzzer shows its latest frame after {show(caught_up)}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    for wait in [False, True]:
+        print(f"{'WAIT, broadcast frame' if wait else 'IDLE, one frame per buzzer'}:")
+
+        await run("Retry every 5 s", True, wait)
+        await run("Backoff and replay", False, wait)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the lazy RecvObject with the former eagerly decoded implementation.
+
+Parse cost covers the whole notification path (`BluetoothCommunication.on_notification` used to copy
+and strip the buffer before parsing). Memory is measured per object retained, notification buffer
+included.
+
+Run from the repository root:
+    python -m backend.Benchmarks.RecvObjectBenchmark
+"""
+
+import time
+import tracemalloc
+from typing import List, Callable
+
+from backend.ESPCommunication.RecvPool import RecvObject
+
+PACKET_NB: int = 100000
+
+
+class EagerRecvObject:
+    """Former RecvObject implementation, kept as a baseline for this benchmark."""
+
+    def __init__(self, timestamp: int, raw: bytes) -> None:
+        self.timestamp = timestamp
+        self.cmd_id = int(raw[0])
+        self.cmd = raw[1:].split(b" ")[0].decode(errors="ignore")
+        self.data = raw[1:].decode(errors="ignore").split(" ")[1:]
+        self.raw = raw
+
+
+def make_notifications() -> List[bytearray]:
+    """Builds notification buffers as received from the BLE client, mostly BPRS and GCLK.
+
+    Returns:
+        List[bytearray]: Notification buffers.
+    """
+
+    ret = []
+
+    for i in range(PACKET_NB):
+        mac = f"5A:1B:00:00:{(i >> 8) & 0xFF:02X}:{i & 0xFF:02X}"
+
+        if i % 2:
+            ret.append(bytearray(bytes([i % 256]) + f"BPRS {mac} {i * 3}".encode() + b"\x00"))
+
+        else:
+            ret.append(bytearray(bytes([i % 256]) + f"GCLK {mac} {i * 7}".encode() + b"\x00"))
+
+    return ret
+
+
+def eager(notification: bytearray) -> EagerRecvObject:
+    return EagerRecvObject(0, bytes(notification).rstrip(b"\x00"))
+
+
+def lazy(notification: bytearray) -> RecvObject:
+    return RecvObject(0, notification)
+
+
+def timed(name: str, func: Callable[[], None]) -> float:
+    """Runs a function and prints its cost per packet.
+
+    Args:
+        name (str): Name of the measured operation.
+        func (Callable[[], None]): Function to run, handling `PACKET_NB` packets.
+
+    Returns:
+        float: Cost per packet, in microseconds.
+    """
+
+    t = time.perf_counter()
+    func()
+    cost = (time.perf_counter() - t) / PACKET_NB * 1e6
+
+    print(f"    {name:<32} {cost:9.3f} us/packet")
+
+    return cost
+
+
+def memory(make: Callable[[bytearray], object]) -> float:
+    """Measures memory retained per object, notification buffer included.
+
+    Args:
+        make (Callable[[bytearray], object]): Function creating an object from a notification.
+
+    Returns:
+        float: Retained memory per object, in bytes.
+    """
+
+    notifications = make_notifications()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    objects = []
+
+    for _ in range(PACKET_NB):
+        # The BLE client hands over the buffer, the caller does not keep it
+        objects.append(make(notifications.pop()))
+
+    cost = (tracemalloc.get_traced_memory()[0] - before) / PACKET_NB
+    tracemalloc.stop()
+
+    return cost
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    notifications = make_notifications()
+    results = {}
+
+    for name, make in [("Eager", eager), ("Lazy", lazy)]:
+        print(f"{name} RecvObject:")
+
+        def parse() -> None:
+            for i in notifications:
+                make(i).cmd
+
+        def parse_and_data() -> None:
+            for i in notifications:
+                make(i).data
+
+        results[name] = [
+            timed("parse (cmd_id and cmd)", parse),
+            timed("parse and access data", parse_and_data),
+            memory(make)
+        ]
+
+        print(f"    {'memory per object':<32} {results[name][2]:9.1f} bytes")
+
+    print("Ratio (Eager / Lazy):")
+    for i, j in enumerate(["parse (cmd_id and cmd)", "parse and access data", "memory per object"]):
+        print(f"    {j:<32} {results['Eager'][i] / results['Lazy'][i]:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the indexed RecvPool with the former in-memory SQLite implementation.
+
+Run from the repository root:
+    python -m backend.Benchmarks.RecvPoolBenchmark
+"""
+
+import sqlite3
+import time
+from typing import List, Callable
+
+from backend.ESPCommunication.RecvPool import RecvPool, RecvObject
+
+PACKET_NB: int = 20000
+QUERY_NB: int = 2000
+
+
+class SQLiteRecvPool:
+    """Former RecvPool implementation, kept as a baseline for this benchmark."""
+
+    def __init__(self, clear_garbage_after: int = 60) -> None:
+        self.__sql: sqlite3.Connection = sqlite3.connect(":memory:")
+        self.__clear_garbage_after: int = clear_garbage_after
+
+        self.__sql.execute(
+            "CREATE TABLE pool ("
+            "   ts INTEGER NOT NULL,"
+            "   cmd_id INTEGER NOT NULL,"
+            "   cmd TEXT NOT NULL,"
+            "   raw BLOB NOT NULL,"
+            "   UNIQUE(cmd_id, cmd, raw)"
+            ");"
+        )
+
+    def __clear_garbage(self) -> None:
+        self.__sql.execute("DELETE FROM pool WHERE ts<?;", (time.time() - self.__clear_garbage_after,))
+
+    def insert_object(self, obj: RecvObject) -> None:
+        self.__sql.execute(
+            "INSERT OR IGNORE INTO pool (ts, cmd_id, cmd, raw) VALUES (?,?,?,?);",
+            (obj.timestamp, obj.cmd_id, obj.cmd, obj.raw)
+        )
+
+        self.__clear_garbage()
+
+    def clear_by_command(self, command_name: str) -> None:
+        self.__sql.execute("DELETE FROM pool WHERE cmd=?;", (command_name,))
+
+        self.__clear_garbage()
+
+    def get_object_by_cmd(self, cmd: str) -> List[RecvObject]:
+        self.__clear_garbage()
+
+        c = self.__sql.execute("SELECT ts, raw FROM pool WHERE cmd=?;", (cmd,))
+
+        return [RecvObject(ts, raw) for ts, raw in c.fetchall()]
+
+    def get_object_by_cmd_id_and_cmd(self, cmd_id: int, cmd_name: str) -> List[RecvObject]:
+        self.__clear_garbage()
+
+        c = self.__sql.execute("SELECT ts, raw FROM pool WHERE cmd=? AND cmd_id=?;", (cmd_name, cmd_id))
+
+        return [RecvObject(ts, raw) for ts, raw in c.fetchall()]
+
+
+def make_packets() -> List[RecvObject]:
+    """Builds a realistic mix of PING, GCLK and BPRS packets.
+
+    Returns:
+        List[RecvObject]: Packets to insert.
+    """
+
+    ts = int(time.time())
+    packets = []
+
+    for i in range(PACKET_NB):
+        mac = f"5A:1B:00:00:{(i >> 8) & 0xFF:02X}:{i & 0xFF:02X}"
+
+        match i % 3:
+            case 0:
+                raw = bytes([i % 256]) + f"PING {mac}".encode()
+
+            case 1:
+                raw = bytes([i % 256]) + f"GCLK {mac} {i * 7}".encode()
+
+            case _:
+                raw = bytes([i % 256]) + f"BPRS {mac} {i * 3}".encode()
+
+        packets.append(RecvObject(ts, raw))
+
+    return packets
+
+
+def timed(name: str, func: Callable[[], None], nb: int) -> float:
+    """Runs a function and prints its cost per operation.
+
+    Args:
+        name (str): Name of the measured operation.
+        func (Callable[[], None]): Function to run.
+        nb (int): Number of operations done by `func`.
+
+    Returns:
+        float: Cost per operation, in microseconds.
+    """
+
+    t = time.perf_counter()
+    func()
+    cost = (time.perf_counter() - t) / nb * 1e6
+
+    print(f"    {name:<28} {cost:9.2f} us/op")
+
+    return cost
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    packets = make_packets()
+    results = {}
+
+    for name, pool_class in [("SQLite", SQLiteRecvPool), ("Indexed", RecvPool)]:
+        print(f"{name} pool:")
+
+        pool = pool_class()
+
+        def insert() -> None:
+            for i in packets:
+                pool.insert_object(i)
+
+        def by_cmd_id_and_cmd() -> None:
+            for i in range(QUERY_NB):
+                pool.get_object_by_cmd_id_and_cmd(i % 256, "GCLK")
+
+        def by_cmd() -> None:
+            for _ in range(QUERY_NB // 100):
+                pool.get_object_by_cmd("BPRS")
+
+        def clear() -> None:
+            pool.clear_by_command("BPRS")
+
+        results[name] = [
+            timed("insert_object", insert, PACKET_NB),
+            timed("get_object_by_cmd_id_and_cmd", by_cmd_id_and_cmd, QUERY_NB),
+            timed("get_object_by_cmd", by_cmd, QUERY_NB // 100),
+            timed("clear_by_command", clear, 1)
+        ]
+
+    print("Speedup (SQLite / Indexed):")
+    for i, j in enumerate(["insert_object", "get_object_by_cmd_id_and_cmd", "get_object_by_cmd", "clear_by_command"]):
+        print(f"    {j:<28} {results['SQLite'][i] / results['Indexed'][i]:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
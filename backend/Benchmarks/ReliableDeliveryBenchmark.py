@@ -0,0 +1,90 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares acknowledged LED frames with fire-and-forget frames and with resending every frame.
+
+A simulated gateway loses ESP-NOW packets. Every round, each buzzer gets a new LED frame. Just before
+the next round, and once the last round settled, the frames actually shown by the buzzers are compared
+to the frames sent. ESP-NOW packets sent for it are counted.
+
+Run from the repository root:
+    python -m backend.Benchmarks.ReliableDeliveryBenchmark
+"""
+
+import asyncio
+import random
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 12
+LED_NB: int = 20
+ESP_NOW_LOSS: float = 0.1
+ROUNDS: int = 30
+ROUND_INTERVAL: float = 0.4
+SETTLE: float = 2.0
+
+
+async def run(name: str, mode: str) -> None:
+    """Sends a new frame to every buzzer each round.
+
+    Args:
+        name (str): Name of the delivery mode, for display.
+        mode (str): "plain" (fire-and-forget), "resend" (every frame sent twice a round) or "reliable".
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, led_nb=LED_NB, esp_now_loss=ESP_NOW_LOSS, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+    await bt_comm.connected_cache.update_cache(force=True)
+
+    rand = random.Random(1)
+    reliable = mode == "reliable"
+    wrong = 0
+    frames = {}
+
+    start_packets = gateway.stats["esp_now_sent"]
+
+    for _ in range(ROUNDS):
+        frames = {i.mac: bytes([rand.randrange(256)]) * (3 * LED_NB) for i in gateway.buzzers}
+
+        await bt_comm.commands.commit_frames(frames, reliable=reliable)
+
+        if mode == "resend":
+            await asyncio.sleep(ROUND_INTERVAL / 2)
+            await bt_comm.commands.commit_frames(frames, force=True, reliable=False)
+            await asyncio.sleep(ROUND_INTERVAL / 2)
+
+        else:
+            await asyncio.sleep(ROUND_INTERVAL)
+
+        wrong += sum(i.leds != frames[i.mac] for i in gateway.buzzers)
+
+    await asyncio.sleep(SETTLE)
+
+    left = sum(i.leds != frames[i.mac] for i in gateway.buzzers)
+    packets = gateway.stats["esp_now_sent"] - start_packets
+
+    print(f"{name}:")
+    print(f"    wrong frame before next round {wrong / (ROUNDS * BUZZER_NB):6.1%}, "
+          f"{left} buzzer(s) wrong at the end, {packets} ESP-NOW packets")
+
+    if reliable:
+        print(f"    {bt_comm.reliable.get_stats()}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Fire-and-forget", "plain")
+    await run("Resend every frame", "resend")
+    await run("Acknowledged", "reliable")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures command round trip latency and throughput against a simulated gateway.
+
+Run from the repository root:
+    python -m backend.Benchmarks.RoundTripBenchmark
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+SEQUENTIAL_NB: int = 200
+CONCURRENT_NB: int = 64
+
+
+def print_latencies(name: str, latencies: List[float]) -> None:
+    """Prints latency statistics in milliseconds.
+
+    Args:
+        name (str): Name of the measured operation.
+        latencies (List[float]): Measured latencies, in seconds.
+    """
+
+    latencies = sorted(latencies)
+
+    print(
+        f"{name:<28} n={len(latencies):<5} "
+        f"mean={statistics.mean(latencies) * 1000:7.2f} ms  "
+        f"p50={latencies[len(latencies) // 2] * 1000:7.2f} ms  "
+        f"p99={latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    await bt_comm.connect_until_complete()
+
+    for name, target in [("Unicast PING (gateway)", gateway.gateway.mac),
+                         ("Unicast PING (buzzer)", gateway.buzzers[-1].mac)]:
+        latencies = []
+
+        for _ in range(SEQUENTIAL_NB):
+            t = time.perf_counter()
+            await bt_comm.commands.ping(target)
+            latencies.append(time.perf_counter() - t)
+
+        print_latencies(name, latencies)
+
+    t = time.perf_counter()
+    ret = await bt_comm.commands.ping()
+    print_latencies(f"Broadcast PING ({len(ret)} resp)", [time.perf_counter() - t])
+
+    roster = [i.data[0] for i in ret]
+
+    t = time.perf_counter()
+    ret = await bt_comm.commands.ping(expected=roster)
+    print_latencies(f"Broadcast PING, roster ({len(ret)})", [time.perf_counter() - t])
+
+    t = time.perf_counter()
+    ret = await bt_comm.commands.get_led_number(expected=roster)
+    print_latencies(f"Broadcast GLED, roster ({len(ret)})", [time.perf_counter() - t])
+
+    targets = [gateway.buzzers[i % BUZZER_NB].mac for i in range(CONCURRENT_NB)]
+
+    t = time.perf_counter()
+    await asyncio.gather(*[bt_comm.commands.get_clock(i) for i in targets])
+    elapsed = time.perf_counter() - t
+
+    print(f"{'Concurrent GCLK':<28} n={CONCURRENT_NB:<5} {CONCURRENT_NB / elapsed:9.1f} cmd/s")
+    print(f"Gateway stats: {gateway.stats}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
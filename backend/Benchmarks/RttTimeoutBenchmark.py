@@ -0,0 +1,115 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares response timeouts derived from round trip time estimates with the former fixed 0.75 s timeout.
+
+A simulated gateway serves buzzers close to it, and one distant buzzer behind a slow, noisy ESP-NOW
+link whose round trip often exceeds 0.75 s. Every buzzer is pinged once per round. Then a close buzzer
+is switched off and pinged again. The share of PING answered in time, and how long the computer waits
+before noticing a buzzer did not answer, are measured.
+
+Run from the repository root:
+    python -m backend.Benchmarks.RttTimeoutBenchmark
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Iterable
+
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.RttEstimator import RttEstimator
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+
+BUZZER_NB: int = 8
+ROUNDS: int = 40
+WARMUP_ROUNDS: int = 5
+MISSED_PINGS: int = 5
+
+FAR_LATENCY: float = 0.3
+FAR_JITTER: float = 0.25
+
+
+class FixedRttEstimator(RttEstimator):
+    """RttEstimator waiting 0.75 s for every buzzer, as commands did before, kept as a baseline."""
+
+    def timeout(self, mac: None | str = None) -> float:
+        return 0.75
+
+    def max_timeout_of(self, macs: Iterable[str]) -> float:
+        return 0.75
+
+
+async def run(name: str, fixed: bool) -> None:
+    """Pings every buzzer in rounds, then a switched off one.
+
+    Args:
+        name (str): Name of the timeout policy, for display.
+        fixed (bool): Whether the former fixed timeout is used.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+
+    if fixed:
+        bt_comm.rtt_estimator = FixedRttEstimator()
+
+    far = gateway.buzzers[-1]
+    far.link_latency = FAR_LATENCY
+    far.link_jitter = FAR_JITTER
+
+    close = gateway.buzzers[1:-1]
+
+    await bt_comm.connect_until_complete()
+
+    answered = {"close": 0, "far": 0}
+
+    async def ping(mac: str, kind: str, count: bool) -> None:
+        if await bt_comm.commands.ping(target_mac=mac) and count:
+            answered[kind] += 1
+
+    for i in range(ROUNDS):
+        await asyncio.gather(
+            *[ping(j.mac_str, "close", i >= WARMUP_ROUNDS) for j in close],
+            ping(far.mac_str, "far", i >= WARMUP_ROUNDS)
+        )
+
+    off = close[0]
+    off.powered = False
+
+    waits = []
+
+    for _ in range(MISSED_PINGS):
+        t = time.perf_counter()
+        await bt_comm.commands.ping(target_mac=off.mac_str)
+        waits.append(time.perf_counter() - t)
+
+    rounds = ROUNDS - WARMUP_ROUNDS
+    estimates = bt_comm.rtt_estimator.get_estimates()
+
+    print(f"{name}:")
+    print(f"    answered in time: close {answered['close'] / (rounds * len(close)):6.1%}  "
+          f"far {answered['far'] / rounds:6.1%}")
+    print(f"    switched off buzzer noticed after: first {waits[0] * 1000:7.1f} ms  "
+          f"mean {statistics.mean(waits) * 1000:7.1f} ms")
+
+    for mac in [close[1].mac_str, far.mac_str]:
+        if mac in estimates:
+            e = estimates[mac]
+            print(f"    {mac}: srtt={e['srtt_ms']:6.1f} ms  p50={e['p50_ms']:6.1f}  p90={e['p90_ms']:6.1f}  "
+                  f"p99={e['p99_ms']:6.1f}  timeout={bt_comm.rtt_estimator.timeout(mac) * 1000:6.1f} ms")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Fixed 0.75 s timeout", True)
+    await run("Adaptive timeouts", False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the cached score frames of `Team` with computing them on every refresh.
+
+Every point limit and score is refreshed repeatedly, like the game does when returning to IDLE.
+Frames are checked to be identical.
+
+Run from the repository root:
+    python -m backend.Benchmarks.TeamFrameBenchmark
+"""
+
+import time
+from typing import List, Tuple
+
+from backend.BuzzerLogic.Constants import LED_NB
+from backend.BuzzerLogic.Team import Team
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import LEDs, Color
+
+REFRESH_NB: int = 200
+
+STATES: List[Tuple[int, int]] = [(limit, point) for limit in [5, 8, 10, 16] for point in range(limit + 1)]
+
+
+def computed_frame(team: Team) -> bytes:
+    """Computes the score frame like `Team.set_led_point` did before frames were cached.
+
+    Args:
+        team (Team): Team to display.
+
+    Returns:
+        bytes: SLED payload.
+    """
+
+    l = LEDs(LED_NB)
+
+    l[0:8] = team.calc_led_points()
+    l.mirror(0, 8, 8)
+    l.fill(team.primary_color, 16, LED_NB)
+
+    return bytes(l)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    team = Team("Team", Color(255, 0, 0), Color(0, 0, 255), BluetoothCommunication(), 5)
+
+    results = {}
+
+    for name, func in [("Computed on every refresh", computed_frame), ("Cached frames", Team.led_frame)]:
+        t = time.perf_counter()
+
+        for _ in range(REFRESH_NB):
+            for team.point_limit, team.point in STATES:
+                func(team)
+
+        results[name] = (time.perf_counter() - t) / (REFRESH_NB * len(STATES)) * 1e6
+
+        print(f"{name:<28} {results[name]:8.2f} us/refresh")
+
+    valid = True
+
+    for team.point_limit, team.point in STATES:
+        valid &= computed_frame(team) == team.led_frame()
+
+    team.primary_color = Color(0, 255, 0)
+    valid &= computed_frame(team) == team.led_frame()
+
+    print(f"Speedup {results['Computed on every refresh'] / results['Cached frames']:.1f}x, identical frames: {valid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Compares the MAC index of `TeamRegistry` with scanning every team on each press.
+
+Presses of every buzzer are looked up, as `State.wait_press` does to find the team of the winner and
+the tie policy does for each tied press. Teams found are checked to be identical.
+
+Run from the repository root:
+    python -m backend.Benchmarks.TeamLookupBenchmark
+"""
+
+import time
+from typing import List
+
+from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import Color
+
+TEAM_NB: int = 16
+BUZZERS_PER_TEAM: int = 4
+LOOKUP_NB: int = 200
+
+
+def scanned_team(bt_comm: BluetoothCommunication, teams: List[Team], mac: bytes | str) -> None | Team:
+    """Finds the team of a buzzer like `State.get_team_from_mac` did before the registry.
+
+    Args:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance, used to format MAC addresses.
+        teams (List[Team]): Teams of the game.
+        mac (bytes | str): MAC address of the buzzer.
+
+    Returns:
+        Team | None: The team, None if the buzzer is not associated to any team.
+    """
+
+    mac_f = bt_comm.target_mac_formatter(mac)
+
+    for i in teams:
+        if mac_f in i.associated_buzzers:
+            return i
+
+    return None
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    bt_comm = BluetoothCommunication()
+    teams = []
+
+    for i in range(TEAM_NB):
+        team = Team(f"Team {i}", Color(255, 0, 0), Color(0, 0, 255), bt_comm, 8)
+        team.associated_buzzers = [bytes([0x5A, 0x1B, 0, 0, i, j]) for j in range(BUZZERS_PER_TEAM)]
+        teams.append(team)
+
+    registry = TeamRegistry(bt_comm, teams)
+
+    # Presses are reported with string MAC addresses (see `PressEntry.mac`), plus one unknown buzzer
+    macs = [bt_comm.mac_to_str(j) for i in teams for j in i.associated_buzzers] + ["5A:1B:00:00:FF:FF"]
+
+    t = time.perf_counter()
+
+    for _ in range(LOOKUP_NB):
+        for i in macs:
+            scanned_team(bt_comm, teams, i)
+
+    scanned = (time.perf_counter() - t) / (LOOKUP_NB * len(macs)) * 1e6
+
+    t = time.perf_counter()
+
+    for _ in range(LOOKUP_NB):
+        for i in macs:
+            registry.from_mac(i)
+
+    indexed = (time.perf_counter() - t) / (LOOKUP_NB * len(macs)) * 1e6
+
+    print(f"{TEAM_NB} teams x {BUZZERS_PER_TEAM} buzzers")
+    print(f"{'Scanning every team':<22} {scanned:8.2f} us/lookup")
+    print(f"{'MAC index':<22} {indexed:8.2f} us/lookup")
+    print(f"Speedup {scanned / indexed:.1f}x, "
+          f"identical teams: {all(scanned_team(bt_comm, teams, i) is registry.from_mac(i) for i in macs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Measures clock query latency during an LED write burst against a simulated gateway.
+
+A burst of SLED writes is queued, then GCLK queries are sent while it drains. The same run is done
+with every write in a single FIFO class as a baseline.
+
+Run from the repository root:
+    python -m backend.Benchmarks.WriteSchedulerBenchmark
+"""
+
+import asyncio
+import statistics
+import time
+
+from backend.BuzzerLogic.Constants import LED_NB
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import LEDs, Color
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+from backend.ESPCommunication.WriteScheduler import WriteScheduler, WritePriority
+
+BUZZER_NB: int = 8
+LED_WRITE_NB: int = 400
+CLOCK_QUERY_NB: int = 10
+
+
+class FifoWriteScheduler(WriteScheduler):
+    """Scheduler putting every write in the same class, kept as a baseline for this benchmark."""
+
+    @staticmethod
+    def priority_of(command: bytes) -> WritePriority:
+        return WritePriority.CONTROL
+
+
+async def run(name: str, scheduler_class: type[WriteScheduler]) -> None:
+    """Runs the benchmark with a given scheduler.
+
+    Args:
+        name (str): Name of the scheduler, for display.
+        scheduler_class (type[WriteScheduler]): Scheduler to use.
+    """
+
+    gateway = SimulatedGateway(buzzer_nb=BUZZER_NB, seed=0)
+    bt_comm = BluetoothCommunication(simulated_gateway=gateway)
+    bt_comm.write_scheduler = scheduler_class(bt_comm, bt_comm.write_scheduler.rate, bt_comm.write_scheduler.burst)
+
+    await bt_comm.connect_until_complete()
+
+    leds = LEDs(LED_NB)
+    leds.leds = [Color(255, 0, 0) for _ in range(LED_NB)]
+
+    burst = [
+        asyncio.create_task(bt_comm.commands.set_leds(leds, gateway.buzzers[i % BUZZER_NB].mac))
+        for i in range(LED_WRITE_NB)
+    ]
+
+    latencies = []
+
+    for i in range(CLOCK_QUERY_NB):
+        t = time.perf_counter()
+        await bt_comm.commands.get_clock(gateway.buzzers[i % BUZZER_NB].mac)
+        latencies.append(time.perf_counter() - t)
+
+    t = time.perf_counter()
+    await asyncio.gather(*burst)
+    drain = time.perf_counter() - t
+
+    stats = bt_comm.write_scheduler.get_stats()
+
+    print(f"{name}:")
+    print(f"    GCLK during burst   mean={statistics.mean(latencies) * 1000:8.2f} ms  "
+          f"max={max(latencies) * 1000:8.2f} ms")
+    print(f"    LED burst drained {drain * 1000:8.2f} ms after the last GCLK")
+    print(f"    {stats}")
+
+    await gateway.disconnect()
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+
+    await run("Single FIFO class", FifoWriteScheduler)
+    await run("Priority classes", WriteScheduler)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
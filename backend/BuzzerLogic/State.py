@@ -3,16 +3,17 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-import asyncio
 import logging
 from enum import Enum
-from typing import List
+from typing import Dict, Any
 
 from backend.BuzzerLogic.Constants import LED_NB
 from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry, TeamEvent
+from backend.ESPCommunication.ArbitrationResult import ArbitrationResult
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LedAnimator import Timeline
 from backend.ESPCommunication.LEDManager import LEDs, Color
-from backend.ESPCommunication.RecvPool import RecvObject
 
 logger = logging.getLogger(__name__)
 
@@ -26,27 +27,68 @@ class State:
         - Detection and confirmation/denial of button presses from __teams
 
     Attributes:
-        teams (List[Team]): List of Team instances participating in the game.
+        teams (TeamRegistry): Teams participating in the game.
         bt_comm (BluetoothCommunication): Bluetooth communication interface
             for interacting with team buzzers.
         current_state (StateEnum): Current __state of the system.
         team_check (Optional[Team]): The team currently being checked for a press.
+        last_result (Optional[ArbitrationResult]): Arbitration result of the last press wait.
     """
 
-    def __init__(self, teams: List[Team], bt_comm: BluetoothCommunication) -> None:
+    def __init__(self, teams: TeamRegistry, bt_comm: BluetoothCommunication) -> None:
         """Initializes the State instance.
 
         Args:
-            teams (List[Team]): List of Team instances participating in the game.
+            teams (TeamRegistry): Teams participating in the game.
             bt_comm (BluetoothCommunication): Bluetooth communication interface
                 used to control LEDs and read button presses.
         """
 
-        self.teams: List[Team] = teams
+        self.teams: TeamRegistry = teams
         self.bt_comm: BluetoothCommunication = bt_comm
 
         self.current_state: StateEnum = StateEnum.IDLE
         self.team_check: None | Team = None
+        self.last_result: None | ArbitrationResult = None
+
+        self.teams.subscribe(self.__on_team_change)
+
+    def __switch_state(self, state: StateEnum) -> None:
+        """Sets the current __state and publishes it to the GUI.
+
+        Args:
+            state (StateEnum): New __state.
+        """
+
+        self.current_state = state
+
+        self.bt_comm.events.publish("state", self.to_dict())
+
+    def __on_team_change(self, event: TeamEvent, team: Team) -> None:
+        """Publishes a change of the team registry to the GUI.
+
+        Args:
+            event (TeamEvent): Change that happened.
+            team (Team): Team concerned.
+        """
+
+        self.bt_comm.events.publish("team", {
+            "event": event.value,
+            "team": team.to_dict(),
+            "teams": [i.name for i in self.teams]
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the current __state shown by the GUI.
+
+        Returns:
+            Dict[str, Any]: Name of the __state and name of the team being checked (None if none).
+        """
+
+        return {
+            "state": self.current_state.name,
+            "team": self.team_check.name if self.team_check is not None else None
+        }
 
     async def __wait_press_led(self) -> None:
         """Sets all LEDs to white to indicate the system is waiting for a press.
@@ -54,8 +96,7 @@ class State:
         This is used internally when the __state is WAIT.
         """
 
-        l = LEDs(LED_NB)
-        l.leds = [Color(255, 255, 255) for _ in range(LED_NB)]
+        l = LEDs(LED_NB).fill(Color(255, 255, 255))
 
         await self.bt_comm.commands.set_leds(l, "ff:ff:ff:ff:ff:ff")
 
@@ -72,21 +113,24 @@ class State:
             AttributeError: If `team_check` is None when called.
         """
 
-        l: LEDs = LEDs(LED_NB)
-        l.leds = [Color(255, 0, 0) if i % 2 == 0 else Color(0, 255, 0) for i in range(LED_NB)]
+        l: LEDs = LEDs(LED_NB).fill(Color(0, 255, 0)).fill(Color(255, 0, 0), step=2)
 
         await self.bt_comm.commands.clear_leds()
 
-        for mac in self.team_check.associated_buzzers:
-            await self.bt_comm.commands.set_leds(l, mac)
+        frame = bytes(l)
+
+        await self.bt_comm.commands.commit_frames({mac: frame for mac in self.team_check.associated_buzzers})
 
-    async def __confirm_deny_led(self, confirm: bool) -> None:
-        """Flashes LEDs to indicate confirmation or denial of a press.
+    def __confirm_deny_led(self, confirm: bool) -> None:
+        """Flashes LEDs to indicate confirmation or denial of a press, then shows the current __state.
 
         - If `confirm` is True: LEDs flash green
         - If `confirm` is False: LEDs flash red
         - Flashes 5 times with 0.25 second intervals
 
+        The flashes are played in background by `BluetoothCommunication.led_animator`, and are
+        cancelled as soon as the LEDs of another __state are set.
+
         Args:
             confirm (bool): Whether the press is confirmed (True) or denied (False).
         """
@@ -97,20 +141,12 @@ class State:
         else:
             color: Color = Color(255, 0, 0)
 
-        l: LEDs = LEDs(LED_NB)
-        l.leds = [color for _ in range(LED_NB)]
+        l: LEDs = LEDs(LED_NB).fill(color)
 
-        await self.bt_comm.commands.clear_leds()
-
-        for i in range(5):
-            for mac in self.team_check.associated_buzzers:
-                await self.bt_comm.commands.set_leds(l, mac)
-
-            await asyncio.sleep(0.25)
-
-            await self.bt_comm.commands.clear_leds()
-
-            await asyncio.sleep(0.25)
+        self.bt_comm.led_animator.play(
+            Timeline.flash(self.team_check.associated_buzzers, bytes(l)),
+            then=self.set_led_on_state
+        )
 
     async def set_idle(self) -> None:
         """Switches the system to the IDLE __state and updates LEDs.
@@ -120,17 +156,18 @@ class State:
 
         logger.debug("Switching __state to IDLE")
 
-        self.current_state = StateEnum.IDLE
         self.team_check = None
+        self.__switch_state(StateEnum.IDLE)
 
         await self.set_led_on_state()
 
     async def wait_press(self) -> None:
         """Switches the system to WAIT __state and waits for the first button press.
 
-        Updates LEDs to indicate waiting. When a press is received, the __state
-        switches to CHECK if a valid team is detected; otherwise, it returns
-        to IDLE.
+        Updates LEDs to indicate waiting. When a press is received, the tie policy
+        of `ButtonCallback` picks the winner among presses which can't be told apart,
+        and the __state switches to CHECK if a valid team won; otherwise (no team,
+        or tie rejected), it returns to IDLE.
 
         Raises:
             TimeoutError: If no button press is received (depending on callback).
@@ -138,17 +175,38 @@ class State:
 
         logger.debug("Switching __state to WAIT")
 
-        logger.debug("Performing automatic clock set")
-        await self.bt_comm.commands.automatic_set_clock()
+        # Clocks are kept in sync in background, they must only not be rewritten while waiting
+        await self.bt_comm.clock_sync.suspend()
 
-        self.current_state = StateEnum.WAIT
-        await self.set_led_on_state()
+        try:
+            # Only buzzers of a team can win, the arbitration does not wait for the others
+            self.bt_comm.but_callback.arm(self.teams.macs())
+
+            self.__switch_state(StateEnum.WAIT)
+            await self.set_led_on_state()
+
+            result: ArbitrationResult = await self.bt_comm.but_callback.get_result(timeout=None)
+
+        finally:
+            # Presses made outside WAIT must not open an arbitration window
+            self.bt_comm.but_callback.disarm()
+            self.bt_comm.clock_sync.resume()
+
+        self.last_result = result
 
-        recv: RecvObject = await self.bt_comm.but_callback.get_first_press(timeout=None)
+        # Presses of the same team are never a tie
+        entry = result.apply(self.bt_comm.but_callback.tie_policy, self.get_team_from_mac)
 
-        mac: str = recv.data[0]
+        if result.tie:
+            logger.info(f"Tie between {[i.mac for i in result.tied]}, "
+                        f"{self.bt_comm.but_callback.tie_policy.value} policy picked {entry.mac if entry else None}")
 
-        self.team_check = self.get_team_from_mac(mac)
+        self.team_check = None if entry is None else self.get_team_from_mac(entry.mac)
+
+        self.bt_comm.events.publish("press", {
+            "team": self.team_check.name if self.team_check is not None else None,
+            "result": result.to_dict()
+        })
 
         if self.team_check is None:
             await self.set_idle()
@@ -156,14 +214,14 @@ class State:
         else:
             logger.debug("Switching __state to CHECK")
 
-            self.current_state = StateEnum.CHECK
+            self.__switch_state(StateEnum.CHECK)
             await self.set_led_on_state()
 
     async def confirm_press(self) -> None:
         """Confirms the current press and updates the team's score.
 
-        Updates LEDs to indicate confirmation, increments the team's point,
-        and returns the system to IDLE.
+        Increments the team's point and returns the system to IDLE right away.
+        LEDs flash to indicate confirmation in background, then show the points.
 
         Does nothing if the current __state is WAIT or no team is selected.
         """
@@ -175,15 +233,18 @@ class State:
 
         logger.debug(f"Press for {self.team_check.associated_buzzers} confirmed")
 
-        self.team_check.point += 1
+        self.teams.add_point(self.team_check.name)
+
+        self.__confirm_deny_led(confirm=True)
 
-        await self.__confirm_deny_led(confirm=True)
-        await self.set_idle()
+        self.team_check = None
+        self.__switch_state(StateEnum.IDLE)
 
     async def deny_press(self) -> None:
         """Denies the current press and updates LEDs to indicate denial.
 
-        Flashes red on the buzzer LEDs and returns the system to IDLE.
+        Returns the system to IDLE right away. Buzzer LEDs flash red in
+        background, then show the points.
 
         Does nothing if the current __state is WAIT or no team is selected.
         """
@@ -195,8 +256,10 @@ class State:
 
         logger.debug(f"Press for {self.team_check.associated_buzzers} denied")
 
-        await self.__confirm_deny_led(confirm=False)
-        await self.set_idle()
+        self.__confirm_deny_led(confirm=False)
+
+        self.team_check = None
+        self.__switch_state(StateEnum.IDLE)
 
     def get_team_from_mac(self, mac: bytes | str) -> None | Team:
         """Finds a Team associated with a given MAC address.
@@ -209,13 +272,7 @@ class State:
             or None if no team matches.
         """
 
-        mac_f = self.bt_comm.target_mac_formatter(mac)
-
-        for i in self.teams:
-            if mac_f in i.associated_buzzers:
-                return i
-
-        return None
+        return self.teams.from_mac(mac)
 
     async def set_led_on_state(self):
         """Updates LEDs to reflect the current system __state.
@@ -224,12 +281,18 @@ class State:
         - WAIT: Lights all LEDs white to indicate waiting for a press
         - CHECK: Lights LEDs for the team currently being checked
         - Other states: Clears all LEDs
+
+        A running LED animation (confirm/deny flashes) is cancelled first.
         """
 
+        self.bt_comm.led_animator.stop()
+
         match self.current_state:
             case StateEnum.IDLE:
-                for t in self.teams:
-                    await t.set_led_point()
+                # Every team at once, so the frames are coalesced into as few writes as possible
+                await self.bt_comm.commands.commit_frames({
+                    mac: frame for t in self.teams for mac, frame in t.led_frames().items()
+                })
 
             case StateEnum.WAIT:
                 await self.__wait_press_led()
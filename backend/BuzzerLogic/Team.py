@@ -3,7 +3,7 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-from typing import List, Literal
+from typing import List, Literal, Dict, Tuple, Any
 
 from backend.BuzzerLogic.Constants import LED_NB
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
@@ -31,6 +31,9 @@ class Team:
         point (int): Current score of the team.
         associated_buzzers (List[bytes]): List of MAC addresses identifying
             buzzers associated with this team.
+        __frames (Dict[Tuple[int, int, int, int], bytes]): Encoded LED frames
+            already computed, keyed by (point limit, point, primary color,
+            secondary color). Cleared when a color is replaced.
     """
 
     def __init__(self, name: str, primary_color: Color, secondary_color: Color, bt_comm: BluetoothCommunication,
@@ -48,6 +51,8 @@ class Team:
                 the team.
         """
 
+        self.__frames: Dict[Tuple[int, int, int, int], bytes] = {}
+
         self.name: str = name
         self.primary_color: Color = primary_color
         self.secondary_color: Color = secondary_color
@@ -58,6 +63,48 @@ class Team:
         self.point: int = 0
         self.associated_buzzers: List[bytes] = []
 
+    @property
+    def primary_color(self) -> Color:
+        """Returns the main color used to display points.
+
+        Returns:
+            Color: The primary color.
+        """
+
+        return self.__primary_color
+
+    @primary_color.setter
+    def primary_color(self, value: Color) -> None:
+        """Sets the primary color and drops the LED frames computed with the former one.
+
+        Args:
+            value (Color): New primary color.
+        """
+
+        self.__primary_color = value
+        self.__frames.clear()
+
+    @property
+    def secondary_color(self) -> Color:
+        """Returns the color used when exceeding base score ranges.
+
+        Returns:
+            Color: The secondary color.
+        """
+
+        return self.__secondary_color
+
+    @secondary_color.setter
+    def secondary_color(self, value: Color) -> None:
+        """Sets the secondary color and drops the LED frames computed with the former one.
+
+        Args:
+            value (Color): New secondary color.
+        """
+
+        self.__secondary_color = value
+        self.__frames.clear()
+
     def calc_led_points(self) -> List[Color]:
         """Computes the LED color pattern representing the current score.
 
@@ -171,26 +218,67 @@ class Team:
             LEDs: The modified LED object with logo LEDs set.
         """
 
-        for i in range(16, LED_NB):
-            led.leds[i] = self.primary_color
+        return led.fill(self.primary_color, 16, LED_NB)
 
-        return led
-
-    async def set_led_point(self) -> None:
-        """Updates the LEDs on all associated buzzers to display the score.
+    def led_frame(self) -> bytes:
+        """Returns the encoded LED frame displaying the score.
 
         The computed LED pattern is mirrored on both halves of the display,
-        the logo section is applied, and the final LED __state is sent to all
-        associated buzzers via Bluetooth.
+        and the logo section is applied. Frames are computed once per
+        (point limit, point, colors), then looked up.
+
+        Returns:
+            bytes: SLED payload, 3 bytes per LED.
+        """
+
+        # Colors are mutable, so their value is part of the key
+        key = (self.point_limit, self.point, int(self.primary_color), int(self.secondary_color))
+
+        frame = self.__frames.get(key)
+
+        if frame is None:
+            l = LEDs(LED_NB)
+
+            l[0:8] = self.calc_led_points()
+            l.mirror(0, 8, 8)
+
+            frame = self.__frames[key] = bytes(self.__set_led_logo(l))
+
+        return frame
+
+    def led_frames(self) -> Dict[bytes, bytes]:
+        """Returns the LED frame displaying the score for each associated buzzer.
+
+        Returns:
+            Dict[bytes, bytes]: SLED payload (see `led_frame`) per MAC address.
         """
 
-        l = LEDs(LED_NB)
+        frame = self.led_frame()
+
+        return {i: frame for i in self.associated_buzzers}
 
-        for i, j in enumerate(self.calc_led_points()):
-            l.leds[i] = j
-            l.leds[i + 8] = j
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the team properties shown by the GUI.
+
+        Returns:
+            Dict[str, Any]: Name, points, point limit, colors (RRGGBB) and associated buzzers
+            (00:11:22:33:44:55).
+        """
 
-        l = self.__set_led_logo(l)
+        return {
+            'name': self.name,
+            'point': self.point,
+            'point_limit': self.point_limit,
+            'primary_color': self.primary_color.to_str_value(),
+            'secondary_color': self.secondary_color.to_str_value(),
+            'associated_buzzers': [self.bt_comm.mac_to_str(i) for i in self.associated_buzzers]
+        }
+
+    async def set_led_point(self) -> None:
+        """Updates the LEDs on all associated buzzers to display the score.
+
+        The LED frame (see `led_frame`) is committed to all associated
+        buzzers at once via Bluetooth.
+        """
 
-        for i in self.associated_buzzers:
-            await self.bt_comm.commands.set_leds(l, i)
+        await self.bt_comm.commands.commit_frames(self.led_frames())
@@ -0,0 +1,341 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import logging
+from enum import Enum
+from typing import Callable, Dict, Iterator, List
+
+from backend.BuzzerLogic.Team import Team, T_point_lim
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+from backend.ESPCommunication.LEDManager import Color
+
+logger = logging.getLogger(__name__)
+
+
+class TeamEvent(Enum):
+    """Change notified to the subscribers of a `TeamRegistry`.
+
+    Attributes:
+        ADDED (str): A team was registered.
+        REMOVED (str): A team was deleted.
+        RENAMED (str): A team changed its name.
+        UPDATED (str): Buzzers, points, point limit or colors of a team changed.
+    """
+
+    ADDED = "added"
+    REMOVED = "removed"
+    RENAMED = "renamed"
+    UPDATED = "updated"
+
+
+class TeamRegistry:
+    """Teams of the game session, indexed by name and by buzzer MAC address.
+
+    The registry is shared by `State` and every API, so they all see the same teams. Every change is
+    validated before anything is applied, then subscribers are notified. Once registered, names and
+    associated buzzers of a team must only be changed through the registry, which keeps its indexes
+    up to date.
+
+    Iterating over the registry yields teams in registration order.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance, used to format MAC addresses.
+        __by_name (Dict[str, Team]): Teams per name, in registration order.
+        __by_mac (Dict[bytes, Team]): Team per associated buzzer MAC address (6 bytes).
+        __subscribers (List[Callable[[TeamEvent, Team], None]]): Functions called after every change.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, teams: None | List[Team] = None) -> None:
+        """Initializes a TeamRegistry instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance, used to format MAC addresses.
+            teams (List[Team] | None, optional): Teams to register. Defaults to None.
+
+        Raises:
+            ValueError: If two teams have the same name or share a buzzer.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+
+        self.__by_name: Dict[str, Team] = {}
+        self.__by_mac: Dict[bytes, Team] = {}
+        self.__subscribers: List[Callable[[TeamEvent, Team], None]] = []
+
+        for i in teams or []:
+            self.add(i)
+
+    def __iter__(self) -> Iterator[Team]:
+        return iter(list(self.__by_name.values()))
+
+    def __len__(self) -> int:
+        return len(self.__by_name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__by_name
+
+    @property
+    def point_limit(self) -> T_point_lim:
+        """Literal[5, 8, 10, 16]: Point limit shared by the teams, 8 when there is none."""
+
+        return next(iter(self.__by_name.values())).point_limit if self.__by_name else 8
+
+    def get(self, name: str) -> None | Team:
+        """Finds a team by name.
+
+        Args:
+            name (str): Name of the team.
+
+        Returns:
+            Team | None: The team, None if no team has this name.
+        """
+
+        return self.__by_name.get(name)
+
+    def from_mac(self, mac: bytes | str) -> None | Team:
+        """Finds the team a buzzer is associated to.
+
+        Args:
+            mac (bytes | str): MAC address of the buzzer.
+
+        Returns:
+            Team | None: The team, None if the buzzer is not associated to any team.
+        """
+
+        return self.__by_mac.get(self.bt_comm.target_mac_formatter(mac))
+
+    def macs(self) -> List[bytes]:
+        """Returns the MAC addresses of every buzzer associated to a team.
+
+        Returns:
+            List[bytes]: MAC addresses (6 bytes).
+        """
+
+        return list(self.__by_mac)
+
+    def subscribe(self, callback: Callable[[TeamEvent, Team], None]) -> None:
+        """Registers a function called after every change, with the change and the team concerned.
+
+        Args:
+            callback (Callable[[TeamEvent, Team], None]): Function to call.
+        """
+
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[TeamEvent, Team], None]) -> None:
+        """Unregisters a function registered with `subscribe`.
+
+        Args:
+            callback (Callable[[TeamEvent, Team], None]): Function to stop calling.
+        """
+
+        if callback in self.__subscribers:
+            self.__subscribers.remove(callback)
+
+    def __notify(self, event: TeamEvent, team: Team) -> None:
+        """Calls every subscriber.
+
+        Args:
+            event (TeamEvent): Change that happened.
+            team (Team): Team concerned.
+        """
+
+        for i in self.__subscribers.copy():
+            try:
+                i(event, team)
+
+            except Exception as e:
+                logger.warning(f"Team {event.value} subscriber failed: {e}")
+
+    def __format_buzzers(self, team: Team, buzzers: List[bytes | str]) -> List[bytes]:
+        """Formats buzzers to associate to a team and checks they are not associated to another one.
+
+        Args:
+            team (Team): Team the buzzers are associated to.
+            buzzers (List[bytes | str]): MAC addresses of the buzzers.
+
+        Raises:
+            ValueError: If a buzzer is already associated to another team.
+
+        Returns:
+            List[bytes]: MAC addresses (6 bytes), without duplicates.
+        """
+
+        macs = list(dict.fromkeys(self.bt_comm.target_mac_formatter(i) for i in buzzers))
+
+        for i in macs:
+            owner = self.__by_mac.get(i)
+
+            if owner is not None and owner is not team:
+                raise ValueError(f"Buzzer {self.bt_comm.mac_to_str(i)} is already associated to team {owner.name}")
+
+        return macs
+
+    def add(self, team: Team) -> None:
+        """Registers a team, with the buzzers it is already associated to.
+
+        Args:
+            team (Team): Team to register.
+
+        Raises:
+            ValueError: If a team already has this name, or one of its buzzers is associated to another team.
+        """
+
+        if team.name in self.__by_name:
+            raise ValueError(f"Team {team.name} already exists")
+
+        team.associated_buzzers = self.__format_buzzers(team, team.associated_buzzers)
+
+        self.__by_name[team.name] = team
+        self.__by_mac.update({i: team for i in team.associated_buzzers})
+
+        self.__notify(TeamEvent.ADDED, team)
+
+    def remove(self, name: str) -> Team:
+        """Deletes a team, its buzzers are not associated to any team anymore.
+
+        Args:
+            name (str): Name of the team.
+
+        Raises:
+            ValueError: If no team has this name.
+
+        Returns:
+            Team: The deleted team.
+        """
+
+        if name not in self.__by_name:
+            raise ValueError(f"Team {name} does not exist")
+
+        team = self.__by_name.pop(name)
+
+        for i in team.associated_buzzers:
+            self.__by_mac.pop(i, None)
+
+        self.__notify(TeamEvent.REMOVED, team)
+
+        return team
+
+    def rename(self, old_name: str, new_name: str) -> Team:
+        """Changes the name of a team, keeping its registration order.
+
+        Args:
+            old_name (str): Current name of the team.
+            new_name (str): New name of the team.
+
+        Raises:
+            ValueError: If no team is named `old_name`, or a team is already named `new_name`.
+
+        Returns:
+            Team: The renamed team.
+        """
+
+        if old_name not in self.__by_name:
+            raise ValueError(f"Team {old_name} does not exist")
+
+        if new_name in self.__by_name:
+            raise ValueError(f"Team {new_name} already exists")
+
+        team = self.__by_name[old_name]
+        team.name = new_name
+
+        self.__by_name = {(new_name if k == old_name else k): v for k, v in self.__by_name.items()}
+
+        self.__notify(TeamEvent.RENAMED, team)
+
+        return team
+
+    def update(self, name: str, associated_buzzers: None | List[bytes | str] = None, point: None | int = None,
+               primary_color: None | Color = None, secondary_color: None | Color = None) -> Team:
+        """Changes properties of a team at once: nothing is changed if one of them is invalid.
+
+        Args:
+            name (str): Name of the team.
+            associated_buzzers (List[bytes | str] | None, optional): MAC addresses of the buzzers of the team.
+                Defaults to None (unchanged).
+            point (int | None, optional): Points of the team. Defaults to None (unchanged).
+            primary_color (Color | None, optional): Main color of the team. Defaults to None (unchanged).
+            secondary_color (Color | None, optional): Secondary color of the team. Defaults to None (unchanged).
+
+        Raises:
+            ValueError: If no team has this name, a buzzer is associated to another team, or points are
+                not from 0 to the point limit.
+
+        Returns:
+            Team: The updated team.
+        """
+
+        team = self.__by_name.get(name)
+
+        if team is None:
+            raise ValueError(f"Team {name} does not exist")
+
+        if associated_buzzers is not None:
+            associated_buzzers = self.__format_buzzers(team, associated_buzzers)
+
+        if point is not None and not 0 <= point <= team.point_limit:
+            raise ValueError(f"Point must be an integer from 0 to point_limit ({team.point_limit})")
+
+        if associated_buzzers is not None:
+            for i in team.associated_buzzers:
+                self.__by_mac.pop(i, None)
+
+            team.associated_buzzers = associated_buzzers
+            self.__by_mac.update({i: team for i in associated_buzzers})
+
+        if point is not None:
+            team.point = point
+
+        if primary_color is not None:
+            team.primary_color = primary_color
+
+        if secondary_color is not None:
+            team.secondary_color = secondary_color
+
+        self.__notify(TeamEvent.UPDATED, team)
+
+        return team
+
+    def add_point(self, name: str, point: int = 1) -> Team:
+        """Adds points to a team.
+
+        Args:
+            name (str): Name of the team.
+            point (int, optional): Points to add. Defaults to 1.
+
+        Raises:
+            ValueError: If no team has this name.
+
+        Returns:
+            Team: The updated team.
+        """
+
+        team = self.__by_name.get(name)
+
+        if team is None:
+            raise ValueError(f"Team {name} does not exist")
+
+        team.point += point
+        self.__notify(TeamEvent.UPDATED, team)
+
+        return team
+
+    def set_point_limit(self, limit: T_point_lim) -> None:
+        """Sets the point limit of every team.
+
+        Args:
+            limit (Literal[5, 8, 10, 16]): New point limit.
+        """
+
+        for i in self:
+            i.point_limit = limit
+            self.__notify(TeamEvent.UPDATED, i)
+
+    def reset_points(self) -> None:
+        """Sets the points of every team back to 0."""
+
+        for i in self:
+            i.point = 0
+            self.__notify(TeamEvent.UPDATED, i)
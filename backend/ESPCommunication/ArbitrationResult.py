@@ -0,0 +1,137 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import random
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, List, Dict, Any
+
+from backend.ESPCommunication.RecvPool import RecvObject
+
+
+class TiePolicy(Enum):
+    """What to do when presses of different teams can't be told apart.
+
+    Attributes:
+        FIRST (str): The earliest corrected press wins anyway.
+        RANDOM (str): A random press among the tied ones wins.
+        REJECT (str): Nobody wins, the question is asked again.
+    """
+
+    FIRST = "first"
+    RANDOM = "random"
+    REJECT = "reject"
+
+
+@dataclass
+class PressEntry:
+    """A press of an arbitration, on the common time base.
+
+    Attributes:
+        obj (RecvObject): The BPRS packet.
+        mac (str | None): MAC address of the buzzer (00:11:22:33:44:55).
+        time (float): Corrected press time in ms (see `ClockEstimator.corrected`), infinity if the clock is unset.
+        delta (float): Milliseconds after the winning press.
+        error (float): Error bound of `time`, in ms.
+    """
+
+    obj: RecvObject
+    mac: None | str
+    time: float
+    delta: float
+    error: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the entry as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: MAC address, delta and error bound (None if infinite).
+        """
+
+        return {
+            "mac": self.mac,
+            "delta_ms": None if self.delta == float("inf") else self.delta,
+            "error_ms": self.error
+        }
+
+
+@dataclass
+class ArbitrationResult:
+    """Outcome of an arbitration window.
+
+    Attributes:
+        presses (List[PressEntry]): Every press of the window, sorted by corrected time.
+        tied (List[PressEntry]): Presses which may have been made before the winner, winner first:
+            their delta is within the error bounds of both presses.
+        duration (float): Seconds from the first press arrival to the decision.
+    """
+
+    presses: List[PressEntry]
+    tied: List[PressEntry] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def winner(self) -> PressEntry:
+        """Returns the earliest press.
+
+        Returns:
+            PressEntry: The press with the lowest corrected time.
+        """
+
+        return self.presses[0]
+
+    @property
+    def tie(self) -> bool:
+        """Returns whether the winner is uncertain.
+
+        Returns:
+            bool: True if another press is within the error bounds of the winner.
+        """
+
+        return len(self.tied) > 1
+
+    def apply(self, policy: TiePolicy, group: None | Callable[[None | str], Any] = None) -> None | PressEntry:
+        """Picks the winning press with a tie policy.
+
+        Args:
+            policy (TiePolicy): Policy used if the winner is uncertain.
+            group (Callable[[str | None], Any] | None, optional): Maps a MAC address to its group (e.g. its
+                team). Tied presses of the same group are not a tie. Defaults to every press on its own.
+
+        Returns:
+            PressEntry | None: The winning press, None if the policy rejected a tie.
+        """
+
+        tied = self.tied
+
+        if group is not None:
+            groups = {}
+
+            for i in tied:
+                groups.setdefault(group(i.mac), i)
+
+            tied = list(groups.values())
+
+        if len(tied) <= 1 or policy is TiePolicy.FIRST:
+            return self.winner
+
+        if policy is TiePolicy.RANDOM:
+            return random.choice(tied)
+
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the result as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Tie flag, decision duration (in seconds), tied presses and every press.
+        """
+
+        return {
+            "tie": self.tie,
+            "duration": self.duration,
+            "tied": [i.to_dict() for i in self.tied],
+            "presses": [i.to_dict() for i in self.presses]
+        }
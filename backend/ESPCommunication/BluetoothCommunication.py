@@ -8,13 +8,27 @@ import json
 import logging
 import pathlib
 import time
+from typing import List, Tuple
 
 from bleak import BleakClient, BleakScanner, BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
 
+from backend.ESPCommunication.ArbitrationResult import TiePolicy
 from backend.ESPCommunication.ButtonCallback import ButtonCallback
+from backend.ESPCommunication.ClockEstimator import ClockEstimator
+from backend.ESPCommunication.ClockSync import ClockSync
+from backend.ESPCommunication.CommandIdAllocator import CommandIdAllocator
 from backend.ESPCommunication.Comands import Commands
 from backend.ESPCommunication.ConnectedCache import ConnectedCache
+from backend.ESPCommunication.EventBus import EventBus
+from backend.ESPCommunication.LedAnimator import LedAnimator
+from backend.ESPCommunication.ReliableSender import ReliableSender
+from backend.ESPCommunication.RttEstimator import RttEstimator
+from backend.ESPCommunication.LedShadow import LedShadow
 from backend.ESPCommunication.RecvPool import RecvPool, RecvObject
+from backend.ESPCommunication.SimulatedGateway import SimulatedGateway
+from backend.ESPCommunication.WriteScheduler import WriteScheduler, WritePriority
 
 logger = logging.getLogger(__name__)
 
@@ -28,37 +42,85 @@ class BluetoothCommunication:
         SERVICE_UUID (str): UUID of the BLE service used by buzzers.
         CHARACTERISTIC_UUID (str): UUID of the BLE service used by buzzers.
         TARGET_NAME (str): Name of the BLE device to connect to.
-        client (BleakClient or None): BLE client instance when connected, None otherwise.
+        client (BleakClient or SimulatedGateway or None): BLE client instance when connected, None otherwise.
+        simulated_gateway (SimulatedGateway or None): Simulated gateway used instead of a real BLE buzzer,
+            None to use BLE.
         commands (Commands): Commands object for sending commands to buzzers.
         but_callback (ButtonCallback): Callback handler for button press events received from buzzers.
-            Responsible for processing and deduplicating button press notifications.
+            Responsible for deduplicating and arbitrating button press notifications.
         recv_pool (RecvPool): Pool for storing received packets.
-        __cmd_id (int): Command ID counter (0–255) for outgoing commands.
-        __cmd_id_lock (asyncio.Lock): Lock to prevent race conditions when incrementing __cmd_id.
+        rtt_estimator (RttEstimator): Round trip time of every buzzer, setting how long commands wait for responses.
+        reliable (ReliableSender): Acknowledged delivery of commands expecting no response (SLED, CLED...).
+        cmd_ids (CommandIdAllocator): Allocator of command IDs (0–255) for outgoing commands.
+        write_scheduler (WriteScheduler): Outbound queue pacing every write to the gateway by priority.
+        clock_estimator (ClockEstimator): Estimator of buzzer clock offsets and drifts.
+        clock_sync (ClockSync): Background service sampling buzzer clocks and setting them when needed.
+        led_shadow (LedShadow): Last LED frame sent to each buzzer, to skip identical writes.
+        led_animator (LedAnimator): Background player of LED animations, the latest one preempting the others.
+        events (EventBus): Game and connectivity events pushed to the GUI.
+        batch_supported (bool): Whether the connected gateway accepts batch frames (see `pack_batch`).
+        reconnect_min_delay (float): Seconds before the first connection retry, doubled on every failure.
+        reconnect_max_delay (float): Highest delay between two connection attempts, in seconds.
+        direct_attempts (int): Connection attempts to the known gateway address before scanning again.
+        connect_timeout (float): Seconds to wait for a BLE connection to complete.
+        BATCH_HEADER (bytes): Header of batch frames: null target MAC, command ID 0 and MCMD command.
+        BATCH_MAX_SIZE (int): Maximum size of a batch frame, set by the gateway write buffer.
+        __batch_enabled (bool): Whether batch frames may be used, from `backend-config.json`.
+        __gateway (BLEDevice | str | None): Gateway found by the last scan, or its address loaded from
+            `GATEWAY_CACHE`. None if the gateway was never found.
+        GATEWAY_CACHE (pathlib.Path): File keeping the gateway address across restarts (not versioned).
     """
 
-    def __init__(self) -> None:
+    GATEWAY_CACHE: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent / "gateway-cache.json"
+
+    BATCH_HEADER: bytes = b"\x00\x00\x00\x00\x00\x00\x00MCMD"
+    BATCH_MAX_SIZE: int = 514
+
+    def __init__(self, simulated_gateway: None | SimulatedGateway = None) -> None:
         """Initializes a BluetoothCommunication instance.
 
         Loads configuration from `backend-config.json` and sets attributes accordingly.
+
+        Args:
+            simulated_gateway (SimulatedGateway | None, optional): Simulated gateway to use instead of
+                a real BLE buzzer. If None, one is created when enabled in `backend-config.json`.
         """
 
         self.SERVICE_UUID: str = ""
         self.CHARACTERISTIC_UUID: str = ""
         self.TARGET_NAME: str = ""
 
-        self.client: None | BleakClient = None
+        self.client: None | BleakClient | SimulatedGateway = None
+        self.simulated_gateway: None | SimulatedGateway = simulated_gateway
 
         self.commands: Commands = Commands(self)
         self.but_callback: ButtonCallback = ButtonCallback(self)
         self.connected_cache: ConnectedCache = ConnectedCache(self)
 
         self.recv_pool: RecvPool = RecvPool()
+        self.rtt_estimator: RttEstimator = RttEstimator()
+        self.reliable: ReliableSender = ReliableSender(self)
+
+        self.cmd_ids: CommandIdAllocator = CommandIdAllocator()
+        self.write_scheduler: WriteScheduler = WriteScheduler(self)
+        self.clock_estimator: ClockEstimator = ClockEstimator(self)
+        self.clock_sync: ClockSync = ClockSync(self)
+        self.led_shadow: LedShadow = LedShadow(self)
+        self.led_animator: LedAnimator = LedAnimator(self)
+        self.events: EventBus = EventBus()
+
+        self.batch_supported: bool = False
+        self.__batch_enabled: bool = True
+
+        self.reconnect_min_delay: float = 0.25
+        self.reconnect_max_delay: float = 5.0
+        self.direct_attempts: int = 4
+        self.connect_timeout: float = 5.0
 
-        self.__cmd_id: int = 0
-        self.__cmd_id_lock: asyncio.Lock = asyncio.Lock()
+        self.__gateway: None | BLEDevice | str = None
 
         self.__load_config()
+        self.__load_gateway_cache()
 
     def __load_config(self) -> None:
         """Loads configuration from `backend-config.json` into class attributes.
@@ -81,86 +143,387 @@ class BluetoothCommunication:
         self.CHARACTERISTIC_UUID = config["Buzzers"]["Characteristic_UUID"]
         self.TARGET_NAME = config["Buzzers"]["BT_target_name"]
 
+        scheduler = config.get("Scheduler", {})
+
+        self.write_scheduler.rate = scheduler.get("Write_rate", self.write_scheduler.rate)
+        self.write_scheduler.burst = scheduler.get("Write_burst", self.write_scheduler.burst)
+        self.write_scheduler.min_rate = scheduler.get("Write_min_rate", self.write_scheduler.min_rate)
+        self.__batch_enabled = scheduler.get("Batch_writes", self.__batch_enabled)
+
+        arbitration = config.get("Arbitration", {})
+
+        self.but_callback.max_window = arbitration.get("Max_window", self.but_callback.max_window)
+        self.but_callback.sync_error = arbitration.get("Sync_error", self.but_callback.sync_error)
+        self.but_callback.tie_policy = TiePolicy(arbitration.get("Tie_policy", self.but_callback.tie_policy.value))
+
+        clock_sync = config.get("Clock_sync", {})
+
+        self.clock_sync.interval = clock_sync.get("Sample_interval", self.clock_sync.interval)
+        self.clock_sync.max_skew = clock_sync.get("Max_skew", self.clock_sync.max_skew)
+        self.clock_sync.min_sync_interval = clock_sync.get("Min_sync_interval", self.clock_sync.min_sync_interval)
+
+        self.led_animator.frame_rate = config.get("Animation", {}).get("Frame_rate", self.led_animator.frame_rate)
+
+        timeouts = config.get("Timeouts", {})
+
+        self.rtt_estimator.initial_timeout = timeouts.get("Initial", self.rtt_estimator.initial_timeout)
+        self.rtt_estimator.min_timeout = timeouts.get("Min", self.rtt_estimator.min_timeout)
+        self.rtt_estimator.max_timeout = timeouts.get("Max", self.rtt_estimator.max_timeout)
+
+        # A reply may come back until the longest timeout, its ID must not be reused before
+        self.cmd_ids.quarantine = self.rtt_estimator.max_timeout
+
+        reliability = config.get("Reliability", {})
+
+        self.reliable.enabled = reliability.get("Enabled", self.reliable.enabled)
+        self.reliable.max_retries = reliability.get("Max_retries", self.reliable.max_retries)
+
+        reconnect = config.get("Reconnect", {})
+
+        self.reconnect_min_delay = reconnect.get("Min_delay", self.reconnect_min_delay)
+        self.reconnect_max_delay = reconnect.get("Max_delay", self.reconnect_max_delay)
+        self.direct_attempts = reconnect.get("Direct_attempts", self.direct_attempts)
+        self.connect_timeout = reconnect.get("Connect_timeout", self.connect_timeout)
+
+        simulation = config.get("Simulation", {})
+
+        if self.simulated_gateway is None and simulation.get("Enabled", False):
+            logger.warning("Using a simulated gateway, no BLE buzzer will be used")
+
+            self.simulated_gateway = SimulatedGateway(
+                buzzer_nb=simulation.get("Buzzer_nb", 4),
+                esp_now_latency=simulation.get("ESP_NOW_latency", 0.005),
+                esp_now_jitter=simulation.get("ESP_NOW_jitter", 0.002),
+                esp_now_loss=simulation.get("ESP_NOW_loss", 0.0)
+            )
+
+    def __load_gateway_cache(self) -> None:
+        """Loads the address of the gateway found during a previous run, from `GATEWAY_CACHE`."""
+
+        try:
+            with open(self.GATEWAY_CACHE, "r") as f:
+                cache = json.loads(f.read())
+
+        except (OSError, ValueError):
+            return
+
+        # The gateway may have been replaced since
+        if isinstance(cache, dict) and cache.get("Name") == self.TARGET_NAME and cache.get("Address"):
+            self.__gateway = cache["Address"]
+
+    def __save_gateway(self, device: BLEDevice) -> None:
+        """Remembers the gateway found by a scan, and writes its address to `GATEWAY_CACHE`.
+
+        Args:
+            device (BLEDevice): The gateway.
+        """
+
+        known = self.__gateway.address if isinstance(self.__gateway, BLEDevice) else self.__gateway
+        self.__gateway = device
+
+        if known == device.address:
+            return
+
+        try:
+            with open(self.GATEWAY_CACHE, "w") as f:
+                f.write(json.dumps({"Name": self.TARGET_NAME, "Address": device.address}))
+
+        except OSError as e:
+            logger.warning(f"Couldn't save gateway address: {e}")
+
     async def connect_oneshot(self) -> bool:
         """Attempts to connect to a single buzzer via BLE.
 
         This method performs the following steps:
-        1. Scans for nearby BLE devices (timeout: 5 seconds).
-        2. Selects the target device by matching its `TARGET_NAME`.
-        3. Establishes a BLE connection using `BleakClient`.
-        4. Attaches a notification handler to the buzzer characteristic.
-        5. Waits briefly to ensure the Bluetooth stack is initialized.
+        1. Scans for the BLE device named `TARGET_NAME`, until it is found (timeout: 5 seconds).
+        2. Establishes a BLE connection using `BleakClient`.
+        3. Attaches a notification handler to the buzzer characteristic.
+        4. Waits briefly to ensure the Bluetooth stack is initialized.
+
+        The gateway found is remembered, so later connections can skip the scan (see `connect_direct`).
+        If a simulated gateway is set, it is used instead and no scan is performed.
 
         Returns:
             bool: `True` if the connection was successful, `False` otherwise.
         """
 
-        logger.info("Discovering BLE devices...")
+        if self.simulated_gateway is not None:
+            return await self.__connect_simulated()
 
-        devices = await BleakScanner.discover(timeout=5.0)
+        logger.info("Discovering BLE devices...")
 
-        target = None
-        for d in devices:
-            logger.debug(f"Discovered device : {d.name} - {d.address}")
-            if d.name == self.TARGET_NAME:
-                target = d
+        target = await BleakScanner.find_device_by_name(self.TARGET_NAME, timeout=5.0)
 
         if target is None:
             logger.error("Buzzer not found")
             return False
 
-        logger.info(f"\nConnecting to {target.name} ({target.address})...")
+        self.__save_gateway(target)
+
+        return await self.__connect_ble(target)
+
+    async def connect_direct(self) -> bool:
+        """Attempts to connect to the gateway found before, without scanning first.
+
+        If a simulated gateway is set, it is used instead.
+
+        Returns:
+            bool: `True` if the connection was successful, `False` otherwise or if no gateway was found before.
+        """
+
+        if self.simulated_gateway is not None:
+            return await self.__connect_simulated()
+
+        if self.__gateway is None:
+            return False
+
+        return await self.__connect_ble(self.__gateway)
+
+    async def __connect_ble(self, target: BLEDevice | str) -> bool:
+        """Connects to the gateway and attaches the notification handler.
+
+        Args:
+            target (BLEDevice | str): The gateway, or its address.
 
-        self.client = BleakClient(
+        Returns:
+            bool: `True` if the connection was successful, `False` otherwise.
+        """
+
+        name = target if isinstance(target, str) else f"{target.name} ({target.address})"
+
+        logger.info(f"\nConnecting to {name}...")
+
+        client = BleakClient(
             address_or_ble_device=target,
-            disconnected_callback=self.on_disconnect
+            disconnected_callback=self.on_disconnect,
+            timeout=self.connect_timeout
         )
 
-        await self.client.connect()
+        try:
+            await client.connect()
 
-        i = 0
-        while i < 20 and self.client is None:
-            await asyncio.sleep(0.1)
-            i += 1
+        except (BleakError, asyncio.TimeoutError, OSError) as e:
+            logger.error(f"Couldn't connect to buzzer: {e}")
+            return False
 
-        if self.client is None or not self.client.is_connected:
+        if not client.is_connected:
             logger.error("Couldn't connect to buzzer")
             return False
 
         logger.debug("Attaching notifications handler")
         try:
-            await self.client.start_notify(self.CHARACTERISTIC_UUID, self.on_notification)
+            await client.start_notify(self.CHARACTERISTIC_UUID, self.on_notification)
+
+        except (BleakError, OSError) as e:
+            logger.error(f"Couldn't start notifying: {e}")
 
-        except OSError:
-            logger.error("Couldn't start notifying")
+            # A connected client would keep the gateway link taken, the next attempt could never connect
+            await self.__disconnect_quietly(client)
             return False
 
+        # Only a client delivering notifications is exposed, commands sent meanwhile fail instead
+        self.client = client
+
         logger.info("Buzzer connected")
 
         await asyncio.sleep(0.1)  # Ensure BT stack is properly initialized
 
         return True
 
+    async def __connect_simulated(self) -> bool:
+        """Connects to the simulated gateway.
+
+        Returns:
+            bool: `True` if the connection was successful, `False` otherwise.
+        """
+
+        logger.info("Connecting to simulated gateway...")
+
+        self.simulated_gateway.set_disconnected_callback(self.on_disconnect)
+
+        try:
+            await self.simulated_gateway.connect()
+
+        except OSError as e:
+            logger.error(f"Couldn't connect to simulated gateway: {e}")
+            return False
+
+        try:
+            await self.simulated_gateway.start_notify(self.CHARACTERISTIC_UUID, self.on_notification)
+
+        except OSError as e:
+            logger.error(f"Couldn't start notifying: {e}")
+
+            await self.__disconnect_quietly(self.simulated_gateway)
+            return False
+
+        self.client = self.simulated_gateway
+
+        logger.info("Simulated gateway connected")
+
+        return True
+
+    @staticmethod
+    async def __disconnect_quietly(client: BleakClient | SimulatedGateway) -> None:
+        """Disconnects a client which was never exposed as `client`, after a failed connection attempt.
+
+        Its disconnection callback is ignored by `on_disconnect`, the attempt in progress goes on.
+
+        Args:
+            client (BleakClient | SimulatedGateway): The client to disconnect.
+        """
+
+        try:
+            await client.disconnect()
+
+        except (BleakError, asyncio.TimeoutError, OSError) as e:
+            logger.warning(f"Couldn't disconnect from gateway: {e}")
+
     async def connect_until_complete(self) -> None:
         """Continuously attempts to connect to a buzzer until successful.
 
-        This method repeatedly calls `connect_oneshot()` every 5 seconds until
-        a connection is established. Useful for ensuring the system eventually
-        connects even if the target buzzer is temporarily unavailable.
+        The gateway found before (in this run or a previous one) is connected to directly, up to
+        `direct_attempts` times, before scanning for it again (see `connect_oneshot`). The delay between
+        two attempts starts at `reconnect_min_delay` and doubles up to `reconnect_max_delay`, so a short
+        radio drop is recovered from quickly while a missing gateway is not polled too often.
+
+        Once connected, the LED frames wanted on the buzzers are shown again (see `replay`).
         """
 
         logger.info("Trying to connect to buzzers...")
 
-        while not await self.connect_oneshot():
-            await asyncio.sleep(5)
+        delay = self.reconnect_min_delay
+        direct = 0
+
+        while True:
+            if self.__gateway is not None and direct < self.direct_attempts:
+                direct += 1
+                connected = await self.connect_direct()
+
+            else:
+                direct = 0
+                connected = await self.connect_oneshot()
+
+            if connected:
+                break
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
 
         logger.info("Successfully connected")
 
-    async def send_command(self, command: bytes | str, args: bytes | str = b"", target_mac: bytes | str = None) -> int:
+        self.events.publish("connection", {"connected": True})
+
+        if self.__batch_enabled:
+            await self.__probe_batch_support()
+
+        await self.replay()
+
+    async def replay(self) -> int:
+        """Shows again the last LED frame wanted on every buzzer, in one batch.
+
+        The gateway clears the LEDs of every buzzer when the BLE link drops, and frames sent meanwhile were
+        lost, so buzzers catch up with the game at once after a reconnection. The last broadcast frame
+        (e.g. while waiting for a press) is sent first, then the frames wanted on single buzzers since.
+
+        Returns:
+            int: Number of frames sent.
+        """
+
+        frames = self.led_shadow.wanted()
+        cleared = self.led_shadow.cleared()
+
+        if not frames:
+            return 0
+
+        try:
+            nb = await self.commands.commit_frames(frames, force=True)
+
+            for mac in cleared:
+                await self.commands.clear_leds(mac)
+
+        except Exception as e:
+            logger.warning(f"Couldn't replay LED frames: {e}")
+            return 0
+
+        logger.info(f"Replayed the LED frames of {nb} buzzer(s)")
+
+        return nb
+
+    async def __probe_batch_support(self) -> None:
+        """Checks if the gateway firmware accepts batch frames, and sets `batch_supported`.
+
+        A batch frame holding a single broadcast PING is sent. Older firmware forwards it to the null MAC
+        address, so no response comes back and single command writes are kept.
+        """
+
+        self.batch_supported = False
+
+        cmd_id = await self.cmd_ids.allocate(track=True)
+        self.recv_pool.clear_by_cmd_id(cmd_id, exclude=["BPRS"])
+
+        try:
+            packet = self.target_mac_formatter(None) + cmd_id.to_bytes(signed=False) + b"PING"
+
+            await self.write_scheduler.submit(self.pack_batch([packet]), WritePriority.CONTROL, batchable=False)
+            await self.recv_pool.wait_for_responses(cmd_id, "PING")
+
+            self.batch_supported = len(self.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "PING")) > 0
+
+        finally:
+            self.cmd_ids.release(cmd_id)
+
+        if self.batch_supported:
+            logger.info("Gateway supports batch frames")
+
+        else:
+            logger.warning("Gateway does not support batch frames, falling back to single command writes")
+
+    @property
+    def max_write_size(self) -> int:
+        """Returns the maximum size of a single BLE write to the gateway.
+
+        Returns:
+            int: Maximum write size in bytes, limited by the negotiated MTU and `BATCH_MAX_SIZE`.
+        """
+
+        # 3 bytes of the MTU are used by the ATT header
+        return min(self.BATCH_MAX_SIZE, getattr(self.client, "mtu_size", 23) - 3)
+
+    def pack_batch(self, packets: List[bytes]) -> bytes:
+        """Packs several command packets into a single batch frame.
+
+        A batch frame is `BATCH_HEADER` followed by one record per packet. A record is the length of the
+        packet data (1 byte), then the packet itself: target MAC (6 bytes), command ID (1 byte) and data.
+        The gateway unpacks the records and routes each of them as if it were written alone.
+
+        Args:
+            packets (List[bytes]): Packets (MAC + ID + command) to pack, in sending order.
+
+        Raises:
+            ValueError: If a packet data does not fit in a record.
+
+        Returns:
+            bytes: The batch frame.
+        """
+
+        frame = bytearray(self.BATCH_HEADER)
+
+        for i in packets:
+            if not 0 <= len(i) - 7 < 240:
+                raise ValueError("Packet data must be shorter than 240 bytes to be batched")
+
+            frame.append(len(i) - 7)
+            frame += i
+
+        return bytes(frame)
+
+    async def send_command(self, command: bytes | str, args: bytes | str = b"", target_mac: bytes | str = None,
+                           track: bool = False, priority: None | WritePriority = None) -> int:
         """Sends a command to one or more buzzers.
 
         Formats the command and arguments, applies target MAC addressing (broadcast if None),
-        and writes the command to the BLE characteristic.
+        and queues the command in `write_scheduler`. Returns once it is written to the BLE characteristic.
 
         Args:
             command (bytes | str): Command to send.
@@ -169,6 +532,11 @@ class BluetoothCommunication:
                 Defaults to broadcast (None). Acceptable formats:
                 - b"\x00\x11\x22\x33\x44\x55"
                 - "00:11:22:33:44:55"
+            track (bool, optional): Whether the command expects responses. Its ID is then kept in flight
+                until released with `cmd_ids.release`, and stale responses using the same ID are dropped
+                from `recv_pool`. Defaults to False.
+            priority (WritePriority | None, optional): Priority class of the write. Defaults to the class
+                of the command (see `WriteScheduler.priority_of`).
 
         Raises:
             AssertionError: If MAC format or value is invalid.
@@ -179,6 +547,81 @@ class BluetoothCommunication:
         """
 
         target_mac_format = self.target_mac_formatter(target_mac)
+        command_format, args_format = self.__format_command(command, args)
+
+        cmd_id = await self.cmd_ids.allocate(track)
+
+        if track:
+            # BPRS use the firmware press counter as ID, they are not replies to our commands
+            self.recv_pool.clear_by_cmd_id(cmd_id, exclude=["BPRS"])
+
+        msg_b = self.__make_packet(target_mac_format, cmd_id, command_format, args_format)
+
+        if priority is None:
+            priority = self.write_scheduler.priority_of(command_format)
+
+        try:
+            await self.write_scheduler.submit(msg_b, priority, batchable=len(msg_b) - 7 < 240)
+
+        except BaseException:
+            self.cmd_ids.release(cmd_id)
+            raise
+
+        return cmd_id
+
+    async def send_commands(self, commands: List[Tuple[bytes | str, bytes | str, None | bytes | str]],
+                            track: bool = False) -> List[int]:
+        """Sends several commands at once.
+
+        The commands are queued together in `write_scheduler`, so they are coalesced into as few BLE
+        writes as possible. Returns once they are all written to the BLE characteristic.
+
+        Args:
+            commands (List[Tuple[bytes | str, bytes | str, bytes | str | None]]): Commands to send, as
+                (command, arguments, target MAC address), see `send_command`.
+            track (bool, optional): Whether the commands expect responses, see `send_command`. Defaults to False.
+
+        Raises:
+            AssertionError: If a MAC format or value is invalid.
+            TypeError: If a command or its arguments are not of type bytes or str.
+
+        Returns:
+            List[int]: IDs of the sent commands, in order.
+        """
+
+        formatted = [(self.target_mac_formatter(mac), *self.__format_command(command, args))
+                     for command, args, mac in commands]
+
+        cmd_ids = [await self.cmd_ids.allocate(track) for _ in formatted]
+        packets = []
+
+        if track:
+            for cmd_id in cmd_ids:
+                self.recv_pool.clear_by_cmd_id(cmd_id, exclude=["BPRS"])
+
+        for cmd_id, (target_mac_format, command_format, args_format) in zip(cmd_ids, formatted):
+            msg_b = self.__make_packet(target_mac_format, cmd_id, command_format, args_format)
+
+            packets.append((msg_b, self.write_scheduler.priority_of(command_format), len(msg_b) - 7 < 240))
+
+        await self.write_scheduler.submit_many(packets)
+
+        return cmd_ids
+
+    @staticmethod
+    def __format_command(command: bytes | str, args: bytes | str) -> Tuple[bytes, bytes]:
+        """Encodes a command and its arguments.
+
+        Args:
+            command (bytes | str): Command to send.
+            args (bytes | str): Arguments for the command.
+
+        Raises:
+            TypeError: If `command` or `args` are not of type bytes or str.
+
+        Returns:
+            Tuple[bytes, bytes]: Encoded command and arguments.
+        """
 
         if isinstance(command, bytes):
             command_format = command
@@ -198,14 +641,21 @@ class BluetoothCommunication:
         else:
             raise TypeError("Args should be a str or a bytes object")
 
-        async with self.__cmd_id_lock:  # Lock other coroutine from accessing this critical section
-            cmd_id = self.__cmd_id
+        return command_format, args_format
 
-            if 0 <= self.__cmd_id < 255:
-                self.__cmd_id += 1
+    @staticmethod
+    def __make_packet(target_mac_format: bytes, cmd_id: int, command_format: bytes, args_format: bytes) -> bytes:
+        """Builds the packet written to the gateway for a command.
 
-            else:
-                self.__cmd_id = 0
+        Args:
+            target_mac_format (bytes): Target MAC address, as 6 bytes.
+            cmd_id (int): ID of the command.
+            command_format (bytes): Encoded command.
+            args_format (bytes): Encoded arguments, may be empty.
+
+        Returns:
+            bytes: Raw packet (MAC + ID + command + arguments).
+        """
 
         if len(args_format):
             msg_b = target_mac_format + cmd_id.to_bytes(signed=False) + command_format + b" " + args_format
@@ -218,9 +668,7 @@ class BluetoothCommunication:
             f"{args_format}"
         )
 
-        await self.client.write_gatt_char(self.CHARACTERISTIC_UUID, msg_b, response=False)
-
-        return cmd_id
+        return msg_b
 
     @staticmethod
     def target_mac_formatter(target_mac: bytes | str | None) -> bytes:
@@ -249,7 +697,7 @@ class BluetoothCommunication:
         elif isinstance(target_mac, str):
             assert len(target_mac) == 17, "Target MAC should be in the form 00:11:22:33:44:55 when using str"
 
-            target_mac_format = b"".join([int(i, 16).to_bytes(signed=False) for i in target_mac.split(":")])
+            target_mac_format = bytes.fromhex(target_mac.replace(":", ""))
 
         else:
             raise TypeError("Target mac should be either None, bytes or a string")
@@ -268,38 +716,64 @@ class BluetoothCommunication:
 
         return self.target_mac_formatter(mac_addr) == b"\xff\xff\xff\xff\xff\xff"
 
-    def on_disconnect(self, client: BleakClient) -> None:
+    def on_disconnect(self, client: BleakClient | SimulatedGateway) -> None:
         """Callback invoked when the buzzer disconnects.
 
         Args:
-            client (BleakClient): BLE client that got disconnected.
+            client (BleakClient | SimulatedGateway): BLE client that got disconnected.
         """
 
+        # A client dropped by a failed connection attempt was never in use, nothing to recover
+        if client is not self.client:
+            return
+
         logger.error("Client disconnected")
 
         self.client = None
+        self.batch_supported = False
+
+        # Buzzers may have been restarted or changed meanwhile
+        self.led_shadow.invalidate()
+        self.connected_cache.reset()
+
+        self.events.publish("connection", {"connected": False})
 
         asyncio.create_task(self.connect_until_complete())
 
     async def on_notification(self, sender: int | BleakGATTCharacteristic, data: bytearray) -> None:
         """Callback invoked when a buzzer sends a packet to the computer.
 
-        Parses the received data, creates a `RecvObject`, and inserts it into the `recv_pool`.
+        Parses the received data and creates a `RecvObject`. Button presses are handed over to
+        `but_callback`, other packets are inserted into the `recv_pool`. The sender of packets
+        carrying its MAC address is marked as seen in `connected_cache`.
 
         Args:
             sender (int | BleakGATTCharacteristic): Sender of the packet.
             data (bytearray): Data received from the buzzer.
         """
 
-        data_format = bytes(data).rstrip(b"\x00")
+        # RecvObject keeps the buffer as is, a BLE backend reusing its bytearray must not change the packet.
+        # One immutable copy, other fields are still only decoded on access.
+        recv_obj = RecvObject(int(time.time()), bytes(data))
 
-        recv_obj = RecvObject(int(time.time()), data_format)
-        self.recv_pool.insert_object(recv_obj)
+        # Button presses are time critical, they skip the pool
+        if recv_obj.cmd == "BPRS":
+            self.but_callback.on_press(recv_obj)
 
-        logger.debug(f"Added {str(recv_obj)} into poll")
+        else:
+            self.recv_pool.insert_object(recv_obj)
 
-        if recv_obj.cmd == "BPRS":
-            self.but_callback.bprs_callback_maker()
+            if recv_obj.cmd == "GCLK":
+                self.but_callback.on_clock(recv_obj)
+
+            # Lazy formatting, so packet fields are only decoded when debug logs are enabled
+            logger.debug("Added %s into pool", recv_obj)
+
+        # Any packet carrying its sender MAC address proves the buzzer is connected
+        mac = recv_obj.mac
+
+        if mac is not None:
+            self.connected_cache.seen(mac, recv_obj.received_at)
 
     @staticmethod
     def mac_to_str(target_mac: bytes | str | None) -> str:
@@ -5,103 +5,451 @@
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, List
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, List, Dict, Tuple, Deque, Set, Iterable
 
+from backend.ESPCommunication.ArbitrationResult import ArbitrationResult, PressEntry, TiePolicy
 from backend.ESPCommunication.RecvPool import RecvObject
+from backend.ESPCommunication.WriteScheduler import WritePriority
 
 if TYPE_CHECKING:
     from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 
 logger = logging.getLogger(__name__)
 
+INT64_MAX: int = 9223372036854775807
 
-class ButtonCallback:
-    """Handles button press events received via Bluetooth.
 
-    This class ensures that only one callback is processed at a time and
-    keeps track of previously seen button presses to avoid duplicates.
-    It also allows waiting asynchronously for the next button press using
-    an event-based mechanism.
+class ButtonCallback:
+    """Arbitrates button presses received via Bluetooth.
+
+    BPRS notifications are handed over directly by `BluetoothCommunication.on_notification`,
+    without going through the receive pool. Duplicates (the firmware sends each press several
+    times) are dropped in O(1), keyed by (MAC, firmware press ID). Presses are only arbitrated
+    while armed (see `arm` and `disarm`): the first new press then opens an arbitration window,
+    during which later presses are collected; when it closes, presses are ranked on their clock
+    corrected by `BluetoothCommunication.clock_estimator`, and waiters are notified with an
+    `ArbitrationResult`.
+
+    Corrected times are only known within an error bound (from the clock estimator, or half of
+    `sync_error` per buzzer until every armed buzzer has a clock model). Presses whose delta to
+    the winner is within the bounds of both presses are reported as tied.
+
+    The window closes as soon as neither an earlier press nor a tied press can still arrive:
+    - Every other armed buzzer reported a clock past the earliest press plus their tie bound. A
+      broadcast GCLK is sent when the window opens to get these reports. Packets from a buzzer
+      arrive in order, so a press made before its report would already have been received.
+    - Or the latency bound expired: such a press would have been made at most the sync error
+      after the first one, and delivered at most `latency_bound` later.
+    The window never lasts more than `max_window`.
 
     Attributes:
         bt_comm (BluetoothCommunication): The Bluetooth communication instance used to receive button presses.
-        last_seen (List[RecvObject]): List of the last processed button press objects to avoid duplicates.
-        __callback_running (bool): Internal flag indicating if a callback is currently running.
+        max_window (float): Maximum seconds presses are collected after the first one, before deciding.
+        sync_error (float): Maximum clock difference between two buzzers when it is not estimated, in seconds.
+        latency_margin (float): Seconds added to the highest measured delivery latency.
+        dedup_ttl (float): Seconds a (MAC, press ID) pair is remembered to drop duplicates.
+        tie_policy (TiePolicy): Policy applied by the game when the winner is uncertain.
+        last_seen (List[RecvObject]): Presses of the last decision, sorted by corrected clock.
+        last_result (ArbitrationResult | None): Result of the last decision, None if nothing was decided yet.
+        stats (Dict[str, int]): Press metrics:
+            - presses: Number of new presses received.
+            - ignored: Number of new presses received while disarmed.
+            - duplicates: Number of duplicate press packets dropped.
+            - decisions: Number of arbitration windows closed.
+            - early_decisions: Number of windows closed because every armed buzzer was past the earliest press.
+            - ties: Number of decisions with an uncertain winner.
+        __active (bool): Whether presses are arbitrated, between `arm` and `disarm`.
+        __armed (Set[str]): MAC addresses of the buzzers taking part in the game.
+        __clocks (Dict[str, float]): Highest corrected clock reported by each buzzer during the current window, in ms.
+        __behind (Set[str]): Armed buzzers which did not report a clock past the earliest press plus their tie
+            bound yet.
+        __earliest (float): Corrected time of the earliest press of the current window, in ms.
+        __earliest_error (float): Error bound of this press, in ms.
+        __one_way (Deque[float]): Recent one way delivery latencies (buzzer to computer), in seconds.
+        __probe_id (int | None): Command ID of the GCLK sent when the last window opened, tracked in flight
+            until the window closes.
+        __probe_sent (float): Monotonic time when this GCLK was written to the gateway.
+        __probe_window (int): Number of the window this GCLK was sent for.
+        __window_nb (int): Number of windows opened.
+        __seen (Dict[Tuple[None | str, int], float]): Arrival time of recent presses by (MAC, press ID),
+            in arrival order.
+        __window_presses (List[Tuple[float, RecvObject]]): Presses collected in the current arbitration window,
+            with their corrected time.
+        __window_start (float): Monotonic time when the current arbitration window opened.
+        __window_handle (asyncio.TimerHandle | None): Timer closing the current window, None if no window is open.
+        __latencies (Deque[float]): Recent press to decision latencies, in seconds.
         __callback_event (asyncio.Event): Internal event used to notify waiters of new button presses.
     """
 
-    def __init__(self, bt_comm: BluetoothCommunication) -> None:
+    def __init__(self, bt_comm: BluetoothCommunication, max_window: float = 0.15, sync_error: float = 0.01,
+                 latency_margin: float = 0.005, dedup_ttl: float = 1.0,
+                 tie_policy: TiePolicy = TiePolicy.FIRST) -> None:
         """Initializes a ButtonCallback instance.
 
         Args:
             bt_comm (BluetoothCommunication): The Bluetooth communication instance used to receive button presses.
+            max_window (float, optional): Maximum seconds presses are collected after the first one, before
+                deciding. Defaults to 0.15.
+            sync_error (float, optional): Maximum clock difference between two buzzers when it is not
+                estimated, in seconds. Defaults to 0.01.
+            latency_margin (float, optional): Seconds added to the highest measured delivery latency.
+                Defaults to 0.005.
+            dedup_ttl (float, optional): Seconds a (MAC, press ID) pair is remembered to drop duplicates.
+                Defaults to 1.
+            tie_policy (TiePolicy, optional): Policy applied by the game when the winner is uncertain.
+                Defaults to FIRST.
         """
 
         self.bt_comm: BluetoothCommunication = bt_comm
+        self.max_window: float = max_window
+        self.sync_error: float = sync_error
+        self.latency_margin: float = latency_margin
+        self.dedup_ttl: float = dedup_ttl
+        self.tie_policy: TiePolicy = tie_policy
 
         self.last_seen: List[RecvObject] = []
+        self.last_result: None | ArbitrationResult = None
+
+        self.stats: Dict[str, int] = {
+            "presses": 0,
+            "ignored": 0,
+            "duplicates": 0,
+            "decisions": 0,
+            "early_decisions": 0,
+            "ties": 0
+        }
+
+        self.__active: bool = False
+        self.__armed: Set[str] = set()
+        self.__clocks: Dict[str, float] = {}
+        self.__behind: Set[str] = set()
+        self.__earliest: float = math.inf
+        self.__earliest_error: float = 0.0
+        self.__one_way: Deque[float] = deque(maxlen=64)
+        self.__probe_id: None | int = None
+        self.__probe_sent: float = 0.0
+        self.__probe_window: int = 0
+        self.__window_nb: int = 0
+
+        self.__seen: Dict[Tuple[None | str, int], float] = {}
+        self.__window_presses: List[Tuple[float, RecvObject]] = []
+        self.__window_start: float = 0.0
+        self.__window_handle: None | asyncio.TimerHandle = None
+        self.__latencies: Deque[float] = deque(maxlen=256)
 
         self.__callback_event: asyncio.Event = asyncio.Event()
-        self.__callback_running: bool = False
 
-    def bprs_callback_maker(self):
-        """Schedules a callback to process new button presses.
+    @property
+    def latency_bound(self) -> float:
+        """Returns the highest delivery latency expected from a buzzer to the computer.
+
+        Returns:
+            float: Highest recently measured one way latency plus `latency_margin`, in seconds.
+            `max_window` if nothing was measured yet.
+        """
+
+        if not self.__one_way:
+            return self.max_window
+
+        return max(self.__one_way) + self.latency_margin
+
+    def arm(self, macs: Iterable[bytes | str]) -> None:
+        """Starts arbitrating presses, and sets the buzzers taking part in the game.
+
+        Only these buzzers are waited for before an early decision. A window opened by a press made
+        before arming is discarded, such a press must not win.
+
+        Args:
+            macs (Iterable[bytes | str]): MAC addresses of the buzzers. If empty, every buzzer can
+                win but the window only closes when its latency bound expires.
+        """
+
+        self.__discard_window()
+
+        self.__active = True
+        self.__armed = {self.bt_comm.mac_to_str(i).upper() for i in macs}
+
+    def disarm(self) -> None:
+        """Stops arbitrating presses, an open window is discarded without decision."""
+
+        self.__discard_window()
+
+        self.__active = False
+
+    def on_press(self, obj: RecvObject) -> None:
+        """Handles a BPRS packet received from a buzzer.
+
+        Duplicates are dropped. A new press is added to the current arbitration window, or opens
+        one if none is open.
+
+        Args:
+            obj (RecvObject): The received BPRS packet. Its command ID is the firmware press ID.
+        """
+
+        now = time.monotonic()
+
+        # Presses are stored in arrival order, so the oldest ones are first
+        while self.__seen:
+            key = next(iter(self.__seen))
+
+            if now - self.__seen[key] < self.dedup_ttl:
+                break
+
+            del self.__seen[key]
+
+        key = (obj.mac, obj.cmd_id)
+
+        if key in self.__seen:
+            self.stats["duplicates"] += 1
+            return
+
+        self.__seen[key] = now
+        self.stats["presses"] += 1
+
+        if not self.__active:
+            self.stats["ignored"] += 1
+            return
+
+        if self.__window_handle is None:
+            self.__open_window(now)
+
+        press_time = self.__press_time(obj)
+        self.__window_presses.append((press_time, obj))
 
-        If a callback is already running, this method returns immediately
-        without scheduling another one. Otherwise, it sets the running flag
-        and creates an asynchronous task to process the button presses.
+        if press_time < self.__earliest:
+            # Rarely happens more than a few times per window, presses mostly arrive in order
+            self.__earliest = press_time
+            self.__earliest_error = self.__press_error(obj.mac)
+            self.__behind = {i for i in self.__armed if self.__clocks.get(i, -math.inf) < self.__tie_limit(i)}
+
+        self.on_clock(obj)
+
+    def on_clock(self, obj: RecvObject) -> None:
+        """Handles a packet carrying the clock of a buzzer (GCLK or BPRS).
+
+        The clock is used to decide early, and responses to the GCLK sent when the window opened
+        give a measure of the delivery latency.
+
+        Args:
+            obj (RecvObject): The received packet.
+        """
+
+        now = time.monotonic()
+
+        # The probe ID can't be reused before its quarantine ends, late responses are still valid
+        if (obj.cmd == "GCLK" and obj.cmd_id == self.__probe_id
+                and now - self.__probe_sent < self.bt_comm.cmd_ids.quarantine):
+            # Half of the round trip, the BLE write being paced like the notification
+            self.__one_way.append((now - self.__probe_sent) / 2)
+
+        if self.__window_handle is None:
+            return
+
+        mac, clock = obj.mac, obj.clock
+
+        if mac is None or clock is None or clock == INT64_MAX:
+            return
+
+        corrected = self.bt_comm.clock_estimator.corrected(mac, clock)
+
+        if corrected > self.__clocks.get(mac, -math.inf):
+            self.__clocks[mac] = corrected
+
+        if mac in self.__behind and corrected >= self.__tie_limit(mac):
+            self.__behind.discard(mac)
+
+        if self.__armed and not self.__behind and self.__earliest != math.inf:
+            self.stats["early_decisions"] += 1
+            self.__decide()
+
+    def __open_window(self, now: float) -> None:
+        """Opens an arbitration window.
+
+        Args:
+            now (float): Monotonic time of the first press arrival.
         """
 
-        if self.__callback_running:
+        self.__window_nb += 1
+        self.__window_start = now
+        self.__clocks = {}
+        self.__behind = set(self.__armed)
+        self.__earliest = math.inf
+        self.__earliest_error = 0.0
+
+        duration = min(self.max_window, self.latency_bound + self.current_sync_error)
+        self.__window_handle = asyncio.get_running_loop().call_later(duration, self.__decide)
+
+        asyncio.create_task(self.__send_probe(self.__window_nb))
+
+        logger.debug(f"New arbitration window opened for {duration * 1000:.1f} ms")
+
+    def __close_window(self) -> None:
+        """Stops the timer of the current window and releases the ID of its probe, if already sent."""
+
+        self.__window_handle.cancel()
+        self.__window_handle = None
+
+        if self.__probe_id is not None and self.__probe_window == self.__window_nb:
+            self.bt_comm.cmd_ids.release(self.__probe_id)
+
+    def __discard_window(self) -> None:
+        """Drops the current arbitration window and its presses, without decision."""
+
+        if self.__window_handle is None:
             return
 
-        self.__callback_running = True
+        self.__close_window()
+        self.__window_presses = []
 
-        asyncio.create_task(self.__callback())
-        logger.debug("New callback task created")
+        logger.debug("Arbitration window discarded")
 
-    async def __callback(self):
-        """Processes new button press events asynchronously.
+    async def __send_probe(self, window_nb: int) -> None:
+        """Sends a broadcast GCLK, so armed buzzers report their clock and the delivery latency is measured.
 
-        This method:
-        - Waits briefly to allow multiple notifications to accumulate.
-        - Filters out previously seen presses.
-        - Sorts the new presses by their internal clock.
-        - Updates the `last_seen` list.
-        - Sets the internal event to notify any coroutines waiting for a press.
-        - Clears the receive pool regardless of exceptions to free resources.
+        Args:
+            window_nb (int): Number of the window the probe is sent for.
         """
 
         try:
-            await asyncio.sleep(0.15)
+            cmd_id = await self.bt_comm.send_command(b"GCLK", priority=WritePriority.CLOCK, track=True)
 
-            presses: List[RecvObject] = list(filter(
-                lambda x: x not in self.last_seen,
-                self.bt_comm.recv_pool.get_object_by_cmd("BPRS"))
-            )
+        except Exception as e:
+            logger.warning(f"Couldn't send arbitration GCLK: {e}")
+            return
 
-            presses.sort(key=lambda x: int(x.data[1]))
+        # Taken once written, the wait in the write queue is not part of the round trip
+        self.__probe_id, self.__probe_sent, self.__probe_window = cmd_id, time.monotonic(), window_nb
 
-            # No new button presses were made
-            if not presses:
-                return
+        if window_nb != self.__window_nb or self.__window_handle is None:
+            # The window closed while the probe was queued
+            self.bt_comm.cmd_ids.release(cmd_id)
 
-            self.__callback_event.set()
+    def __press_time(self, obj: RecvObject) -> float:
+        """Returns the corrected time of a press, comparable between buzzers.
 
-            self.last_seen = presses.copy()
+        Args:
+            obj (RecvObject): The BPRS packet.
 
-        finally:
-            self.bt_comm.recv_pool.clear_by_command("BPRS")
+        Returns:
+            float: Corrected time in ms (see `ClockEstimator.corrected`), infinity if the buzzer clock
+            is not set.
+        """
 
-            # Free the callback even if exceptions happens during execution
-            self.__callback_running = False
+        clock = obj.clock
 
-    async def get_first_press(self, timeout: None | float = None) -> RecvObject:
-        """Waits for the next button press and returns the first press received.
+        if clock is None or clock == INT64_MAX:
+            return math.inf
 
-        This method waits asynchronously until a new button press is detected
-        by `__callback` and returns the first `RecvObject` from the `last_seen` list.
-        The wait can be limited with the `timeout` parameter.
+        return self.bt_comm.clock_estimator.corrected(obj.mac, clock)
+
+    def __press_error(self, mac: None | str) -> float:
+        """Returns the error bound of corrected times of a buzzer.
+
+        Args:
+            mac (str | None): MAC address of the buzzer.
+
+        Returns:
+            float: Error bound from the clock estimator, half of `sync_error` if the buzzer has no model, in ms.
+        """
+
+        error = self.bt_comm.clock_estimator.error_bound(mac) if mac is not None else None
+
+        return self.sync_error * 500 if error is None else error
+
+    def __tie_limit(self, mac: str) -> float:
+        """Returns the corrected time a buzzer must report before it can't tie the earliest press anymore.
+
+        Args:
+            mac (str): MAC address of the buzzer.
+
+        Returns:
+            float: Corrected time in ms.
+        """
+
+        return self.__earliest + self.__earliest_error + self.__press_error(mac)
+
+    @property
+    def current_sync_error(self) -> float:
+        """Returns the current bound of the clock difference between armed buzzers.
+
+        Returns:
+            float: Highest error bound of the clock estimator among armed buzzers (or every buzzer if none
+            is armed), in seconds. `sync_error` if one of them has no clock model.
+        """
+
+        bound = self.bt_comm.clock_estimator.max_error_bound(self.__armed or None)
+
+        return self.sync_error if bound is None else bound / 1000
+
+    def __decide(self) -> None:
+        """Closes the current arbitration window.
+
+        Presses are sorted by their corrected clock, stored in `last_seen` and `last_result`, and
+        waiters are notified.
+        """
+
+        if self.__window_handle is None:
+            return
+
+        self.__close_window()
+
+        presses = self.__window_presses
+        self.__window_presses = []
+
+        presses.sort(key=lambda x: x[0])
+
+        first = presses[0][0]
+        entries = [
+            PressEntry(j, j.mac, i, i - first if first != math.inf else math.inf, self.__press_error(j.mac))
+            for i, j in presses
+        ]
+
+        tied = [entries[0]]
+
+        if first != math.inf:
+            tied += [i for i in entries[1:] if i.delta <= entries[0].error + i.error]
+
+        duration = time.monotonic() - self.__window_start
+
+        self.last_seen = [i.obj for i in entries]
+        self.last_result = ArbitrationResult(entries, tied, duration)
+
+        self.__latencies.append(duration)
+        self.stats["decisions"] += 1
+        self.stats["ties"] += self.last_result.tie
+
+        logger.info(f"Press arbitration decided in {duration * 1000:.1f} ms among {len(entries)} press(es)"
+                    f"{f', {len(tied)} tied' if len(tied) > 1 else ''}")
+
+        self.__callback_event.set()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Returns press counters, arbitration settings and press to decision latencies.
+
+        Latency is measured from the arrival of the first press of a window to the decision.
+
+        Returns:
+            Dict[str, float]: Counters of `stats`, the window bounds (in seconds), and the mean, median
+            and max latency of recent decisions (in seconds).
+        """
+
+        latencies = sorted(self.__latencies)
+
+        return {
+            **self.stats,
+            "max_window": self.max_window,
+            "latency_bound": self.latency_bound,
+            "sync_error": self.current_sync_error,
+            "latency_mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "latency_max": latencies[-1] if latencies else 0.0
+        }
+
+    async def get_result(self, timeout: None | float = None) -> ArbitrationResult:
+        """Waits for the next arbitration window to close and returns its result.
 
         Args:
             timeout (float | None): Maximum number of seconds to wait for a button press.
@@ -109,17 +457,38 @@ class ButtonCallback:
                 received, an `asyncio.TimeoutError` is raised.
 
         Returns:
-            RecvObject: The first new button press object.
+            ArbitrationResult: Result of the arbitration, with every press and the tied ones.
 
         Raises:
             asyncio.TimeoutError: If no button press is detected before the timeout expires.
         """
-        
+
         self.__callback_event.clear()
 
         try:
             await asyncio.wait_for(self.__callback_event.wait(), timeout=timeout)
-            return self.last_seen[0]
+            return self.last_result
 
         finally:
             self.__callback_event.clear()
+
+    async def get_first_press(self, timeout: None | float = None) -> RecvObject:
+        """Waits for the next button press and returns the first press received.
+
+        This method waits asynchronously until the next arbitration window closes
+        and returns the first `RecvObject` from the `last_seen` list, whatever the tie policy.
+        The wait can be limited with the `timeout` parameter.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait for a button press.
+                If None, waits indefinitely. If the timeout expires before a press is
+                received, an `asyncio.TimeoutError` is raised.
+
+        Returns:
+            RecvObject: The first new button press object.
+
+        Raises:
+            asyncio.TimeoutError: If no button press is detected before the timeout expires.
+        """
+
+        return (await self.get_result(timeout)).winner.obj
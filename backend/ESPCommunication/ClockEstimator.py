@@ -0,0 +1,327 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Deque, Tuple, List, Iterable, Any, Set
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+INT64_MAX: int = 9223372036854775807
+
+
+@dataclass
+class ClockModel:
+    """Linear model of a buzzer clock against the computer monotonic clock.
+
+    The buzzer clock is `clock_ref + rate * (host - host_ref)`, all values in milliseconds.
+
+    Attributes:
+        host_ref (float): Reference computer time (mean of the samples used), in ms.
+        clock_ref (float): Buzzer clock at `host_ref`, in ms.
+        rate (float): Buzzer clock milliseconds per computer millisecond (1 + drift).
+        error (float): Bound of the error of a corrected timestamp, in ms.
+        samples (int): Number of samples used for the fit.
+    """
+
+    host_ref: float
+    clock_ref: float
+    rate: float
+    error: float
+    samples: int
+
+    def to_host(self, clock: float) -> float:
+        """Converts a buzzer clock value to computer time.
+
+        Args:
+            clock (float): Buzzer clock value, in ms.
+
+        Returns:
+            float: Computer monotonic time, in ms.
+        """
+
+        return self.host_ref + (clock - self.clock_ref) / self.rate
+
+    def to_clock(self, host: float) -> float:
+        """Predicts the buzzer clock at a computer time.
+
+        Args:
+            host (float): Computer monotonic time, in ms.
+
+        Returns:
+            float: Buzzer clock value, in ms.
+        """
+
+        return self.clock_ref + self.rate * (host - self.host_ref)
+
+
+class ClockEstimator:
+    """Estimates the offset and drift of every buzzer clock.
+
+    Broadcast GCLK are sent periodically (see `ClockSync`). Each response gives a sample: the buzzer clock, and the
+    computer time it was read at, taken at the middle of the round trip (so known within half the
+    round trip time). Samples with a round trip time far above the best one of their buzzer are
+    dropped, as they were delayed somewhere on the way. A line is then fitted per buzzer with least
+    squares, for every buzzer at once with numpy.
+
+    The models convert a buzzer clock (e.g. from a BPRS) to computer time, so presses are ranked on
+    a common time base, whatever the error left by `ACLK`.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance used to send GCLK.
+        history (int): Number of samples kept per buzzer.
+        rtt_tolerance (float): Samples with a round trip time above `rtt_tolerance` times the best one
+            (plus 1 ms) are dropped.
+        max_drift (float): Highest drift accepted from a fit, as a ratio (e.g. 0.001 for 1000 ppm).
+        stats (Dict[str, int]): Sampling metrics:
+            - rounds: Number of sampling rounds.
+            - samples: Number of samples collected.
+            - resets: Number of clock resets (ACLK, SCLK or RCLK sent).
+        unset (Set[str]): MAC addresses of the buzzers which answered the last round with an unset clock.
+        __samples (Dict[str, Deque[Tuple[float, float, float]]]): Samples per MAC address, as
+            (computer time, buzzer clock, round trip time), in ms.
+        __models (Dict[str, ClockModel]): Fitted model per MAC address.
+        __generation (int): Incremented on every reset, to drop samples taken across a reset.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, history: int = 64, rtt_tolerance: float = 1.5,
+                 max_drift: float = 0.001) -> None:
+        """Initializes a ClockEstimator instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance used to send GCLK.
+            history (int, optional): Number of samples kept per buzzer. Defaults to 64.
+            rtt_tolerance (float, optional): Samples with a round trip time above `rtt_tolerance` times
+                the best one (plus 1 ms) are dropped. Defaults to 1.5.
+            max_drift (float, optional): Highest drift accepted from a fit, as a ratio. Defaults to 0.001.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.history: int = history
+        self.rtt_tolerance: float = rtt_tolerance
+        self.max_drift: float = max_drift
+
+        self.stats: Dict[str, int] = {"rounds": 0, "samples": 0, "resets": 0}
+        self.unset: Set[str] = set()
+
+        self.__samples: Dict[str, Deque[Tuple[float, float, float]]] = {}
+        self.__models: Dict[str, ClockModel] = {}
+        self.__generation: int = 0
+
+    async def sample(self) -> int:
+        """Runs a sampling round: sends a broadcast GCLK, records the responses and refits the models.
+
+        Returns:
+            int: Number of samples recorded.
+        """
+
+        generation = self.__generation
+
+        # Buzzers already sampled are expected to answer, so the broadcast can end early
+        expected = list(self.__samples) or None
+
+        # Time taken once written, the wait in the write queue is not part of the round trip
+        ret, sent = await self.bt_comm.commands.get_clock_timed(expected=expected)
+
+        # Clocks were reset while waiting, these samples are meaningless
+        if generation != self.__generation:
+            return 0
+
+        nb = 0
+        unset = set()
+
+        for i in ret:
+            mac, clock = i.mac, i.clock
+
+            if mac is None or clock is None:
+                continue
+
+            if clock == INT64_MAX:
+                # Clocks are only unset at boot, so the buzzer LEDs were reset too
+                if mac not in self.unset:
+                    self.bt_comm.led_shadow.invalidate(mac)
+
+                unset.add(mac)
+                continue
+
+            samples = self.__samples.setdefault(mac, deque(maxlen=self.history))
+            samples.append(((sent + i.received_at) * 500, float(clock), (i.received_at - sent) * 1000))
+
+            nb += 1
+
+        self.unset = unset
+        self.stats["rounds"] += 1
+        self.stats["samples"] += nb
+
+        self.fit()
+
+        return nb
+
+    def reset(self, mac: None | bytes | str = None) -> None:
+        """Forgets the samples of a buzzer, after its clock was changed.
+
+        Args:
+            mac (bytes | str | None, optional): MAC address of the buzzer. Broadcast or None for every buzzer.
+        """
+
+        self.__generation += 1
+        self.stats["resets"] += 1
+
+        if mac is None or self.bt_comm.is_broadcast(mac):
+            self.__samples.clear()
+            self.__models.clear()
+            self.unset.clear()
+            return
+
+        mac_str = self.bt_comm.mac_to_str(mac).upper()
+
+        self.__samples.pop(mac_str, None)
+        self.__models.pop(mac_str, None)
+        self.unset.discard(mac_str)
+
+    def fit(self) -> None:
+        """Fits the clock model of every buzzer from its samples."""
+
+        macs = [i for i in self.__samples if self.__samples[i]]
+
+        if not macs:
+            self.__models = {}
+            return
+
+        m = len(macs)
+
+        idx = np.concatenate([np.full(len(self.__samples[j]), i) for i, j in enumerate(macs)])
+        host, clock, rtt = np.array([k for j in macs for k in self.__samples[j]]).T
+
+        # Round trip time filter, against the best round trip time of each buzzer
+        min_rtt = np.full(m, np.inf)
+        np.minimum.at(min_rtt, idx, rtt)
+
+        keep = rtt <= min_rtt[idx] * self.rtt_tolerance + 1.0
+        idx, host, clock = idx[keep], host[keep], clock[keep]
+
+        # Least squares per buzzer with grouped sums, centered to keep float precision
+        n = np.bincount(idx, minlength=m)
+        host_ref = np.bincount(idx, host, minlength=m) / n
+        clock_ref = np.bincount(idx, clock, minlength=m) / n
+
+        d_host = host - host_ref[idx]
+        d_clock = clock - clock_ref[idx]
+
+        s_hh = np.bincount(idx, d_host * d_host, minlength=m)
+        s_hc = np.bincount(idx, d_host * d_clock, minlength=m)
+
+        rate = np.divide(s_hc, s_hh, out=np.ones(m), where=(n >= 3) & (s_hh > 0))
+        rate = np.clip(rate, 1 - self.max_drift, 1 + self.max_drift)
+
+        residual = np.abs(d_clock - rate[idx] * d_host)
+        max_residual = np.zeros(m)
+        np.maximum.at(max_residual, idx, residual)
+
+        # A sample is read somewhere within its round trip, the fit can't be better than half of it
+        error = max_residual + min_rtt / 2
+
+        self.__models = {
+            j: ClockModel(float(host_ref[i]), float(clock_ref[i]), float(rate[i]), float(error[i]), int(n[i]))
+            for i, j in enumerate(macs)
+        }
+
+    def corrected(self, mac: None | str, clock: int) -> float:
+        """Converts a buzzer clock value to a time comparable between buzzers.
+
+        Buzzers without a model use the mean conversion of the others, as `ACLK` synchronized them
+        roughly. If no buzzer has a model, the clock value is returned unchanged.
+
+        Args:
+            mac (str | None): MAC address of the buzzer (00:11:22:33:44:55).
+            clock (int): Buzzer clock value, in ms.
+
+        Returns:
+            float: Computer monotonic time in ms, or the clock value if nothing was fitted yet.
+        """
+
+        model = self.__models.get(mac.upper()) if mac is not None else None
+
+        if model is not None:
+            return model.to_host(clock)
+
+        if self.__models:
+            return sum(i.to_host(clock) for i in self.__models.values()) / len(self.__models)
+
+        return float(clock)
+
+    def error_bound(self, mac: str) -> None | float:
+        """Returns the error bound of corrected timestamps of a buzzer.
+
+        Args:
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+
+        Returns:
+            float | None: Error bound in ms, None if the buzzer has no model.
+        """
+
+        model = self.__models.get(mac.upper())
+
+        return None if model is None else model.error
+
+    def max_error_bound(self, macs: None | Iterable[str] = None) -> None | float:
+        """Returns the highest error bound among buzzers.
+
+        Args:
+            macs (Iterable[str] | None, optional): MAC addresses to consider. Defaults to every buzzer with a model.
+
+        Returns:
+            float | None: Highest error bound in ms, None if one of these buzzers has no model.
+        """
+
+        bounds: List[None | float] = [i.error for i in self.__models.values()] if macs is None \
+            else [self.error_bound(i) for i in macs]
+
+        if not bounds or None in bounds:
+            return None
+
+        return max(bounds)
+
+    def clock_spread(self) -> None | float:
+        """Returns the current difference between the most ahead and the most behind buzzer clocks.
+
+        This is what firmware timestamps disagree by, before any correction.
+
+        Returns:
+            float | None: Predicted clock spread in ms, None if no buzzer has a model.
+        """
+
+        if not self.__models:
+            return None
+
+        now = time.monotonic() * 1000
+        clocks = [i.to_clock(now) for i in self.__models.values()]
+
+        return max(clocks) - min(clocks)
+
+    def get_estimates(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the current model of every buzzer.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per MAC address: offset of the buzzer clock against the computer
+            monotonic clock (ms), drift (ppm), error bound (ms) and number of samples used.
+        """
+
+        return {
+            mac: {
+                "offset_ms": i.clock_ref - i.host_ref,
+                "drift_ppm": (i.rate - 1) * 1e6,
+                "error_ms": i.error,
+                "samples": i.samples
+            }
+            for mac, i in self.__models.items()
+        }
@@ -0,0 +1,154 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Any
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+
+class ClockSync:
+    """Background clock synchronization of the buzzers.
+
+    Every `interval` seconds, buzzer clocks are sampled by `BluetoothCommunication.clock_estimator`.
+    An automatic clock set (ACLK, which makes the master broadcast SCLK) is only sent when needed:
+    - a buzzer reported an unset clock (new or rebooted buzzer),
+    - or buzzer clocks drifted apart by more than `max_skew`.
+    It is never sent while suspended (during a press wait), nor more than once per `min_sync_interval`.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+        interval (float): Seconds between two sampling rounds.
+        max_skew (float): Clock spread between buzzers above which clocks are set again, in ms.
+        min_sync_interval (float): Minimum seconds between two automatic clock sets.
+        stats (Dict[str, int]): Synchronization metrics:
+            - checks: Number of sampling rounds.
+            - syncs: Number of automatic clock sets sent.
+            - deferred: Number of needed clock sets delayed by a suspension or `min_sync_interval`.
+        __suspended (bool): Whether automatic clock sets are currently forbidden.
+        __last_sync (float): Monotonic time of the last automatic clock set.
+        __sync_task (asyncio.Task | None): Automatic clock set in progress, None if none was sent yet.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, interval: float = 2.0, max_skew: float = 20.0,
+                 min_sync_interval: float = 30.0) -> None:
+        """Initializes a ClockSync instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+            interval (float, optional): Seconds between two sampling rounds. Defaults to 2.
+            max_skew (float, optional): Clock spread between buzzers above which clocks are set again, in ms.
+                Defaults to 20.
+            min_sync_interval (float, optional): Minimum seconds between two automatic clock sets. Defaults to 30.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.interval: float = interval
+        self.max_skew: float = max_skew
+        self.min_sync_interval: float = min_sync_interval
+
+        self.stats: Dict[str, int] = {"checks": 0, "syncs": 0, "deferred": 0}
+
+        self.__suspended: bool = False
+        self.__last_sync: float = -min_sync_interval
+        self.__sync_task: None | asyncio.Task = None
+
+    async def run(self) -> None:
+        """Samples buzzer clocks and sets them again when needed, forever, while connected."""
+
+        while True:
+            if self.bt_comm.client is not None:
+                try:
+                    await self.check()
+
+                except Exception as e:
+                    logger.warning(f"Clock synchronization check failed: {e}")
+
+            await asyncio.sleep(self.interval)
+
+    def sync_reason(self) -> None | str:
+        """Tells why buzzer clocks need to be set again.
+
+        Returns:
+            str | None: Reason of the clock set, None if clocks are fine.
+        """
+
+        clock_estimator = self.bt_comm.clock_estimator
+
+        if clock_estimator.unset:
+            return f"unset clock on {', '.join(sorted(clock_estimator.unset))}"
+
+        spread = clock_estimator.clock_spread()
+
+        if spread is not None and spread > self.max_skew:
+            return f"clocks {spread:.1f} ms apart"
+
+        return None
+
+    async def check(self) -> bool:
+        """Runs a sampling round, then sets buzzer clocks if needed and allowed.
+
+        Returns:
+            bool: True if an automatic clock set was sent.
+        """
+
+        await self.bt_comm.clock_estimator.sample()
+        self.stats["checks"] += 1
+
+        reason = self.sync_reason()
+
+        if reason is None:
+            return False
+
+        if self.__suspended or time.monotonic() - self.__last_sync < self.min_sync_interval:
+            self.stats["deferred"] += 1
+            return False
+
+        logger.info(f"Setting buzzer clocks: {reason}")
+
+        self.__last_sync = time.monotonic()
+        self.stats["syncs"] += 1
+
+        self.__sync_task = asyncio.create_task(self.bt_comm.commands.automatic_set_clock())
+        await self.__sync_task
+
+        return True
+
+    async def suspend(self) -> None:
+        """Forbids automatic clock sets, and waits for the end of one in progress.
+
+        Clocks are being rewritten during a clock set, so presses made meanwhile would be misranked.
+        """
+
+        self.__suspended = True
+
+        if self.__sync_task is not None and not self.__sync_task.done():
+            # Shielded, so cancelling the waiter does not abort the clock set
+            await asyncio.shield(self.__sync_task)
+
+    def resume(self) -> None:
+        """Allows automatic clock sets again."""
+
+        self.__suspended = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns synchronization counters and settings.
+
+        Returns:
+            Dict[str, Any]: Counters of `stats`, whether clock sets are suspended, the current clock spread
+            (ms, None if unknown) and `max_skew`.
+        """
+
+        return {
+            **self.stats,
+            "suspended": self.__suspended,
+            "clock_spread": self.bt_comm.clock_estimator.clock_spread(),
+            "max_skew": self.max_skew
+        }
@@ -3,7 +3,8 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-from typing import TYPE_CHECKING, List
+import time
+from typing import TYPE_CHECKING, List, Iterable, Dict, Tuple
 
 from backend.ESPCommunication.LEDManager import LEDs
 from backend.ESPCommunication.RecvPool import RecvObject
@@ -15,7 +16,9 @@ if TYPE_CHECKING:
 class Commands:
     """Provides methods to send commands to buzzers via BLE communication.
 
-    Each method sends a specific command using the BluetoothCommunication instance.
+    Each method sends a specific command using the BluetoothCommunication instance. Commands expecting
+    responses wait for them as long as the round trip times of the targeted buzzers require
+    (see `BluetoothCommunication.rtt_estimator`), and every response feeds these estimates.
     """
 
     def __init__(self, bt_comm: BluetoothCommunication) -> None:
@@ -27,61 +30,158 @@ class Commands:
 
         self.bt_comm: BluetoothCommunication = bt_comm
 
-    async def ping(self, target_mac: bytes | str = None) -> List[RecvObject]:
+    async def __query(self, cmd: str, target_mac: None | bytes | str,
+                      expected: None | Iterable[str]) -> Tuple[List[RecvObject], float]:
+        """Sends a command expecting responses and waits for them.
+
+        Unicast commands wait for the timeout of their target, broadcasts for the highest timeout of the
+        expected buzzers, or `initial_timeout` when no buzzer is expected. Each buzzer's first response
+        is recorded as a round trip time sample, and each expected buzzer which did not answer as a timeout.
+
+        Args:
+            cmd (str): Command name (PING, GCLK, GLED...).
+            target_mac (bytes | str | None): MAC address to target, None for broadcast.
+            expected (Iterable[str] | None): MAC addresses expected to answer a broadcast.
+
+        Returns:
+            Tuple[List[RecvObject], float]: Responses from the buzzer(s), and monotonic time the command
+            was written to the gateway.
+        """
+
+        rtt = self.bt_comm.rtt_estimator
+        is_broadcast = self.bt_comm.is_broadcast(target_mac)
+
+        if is_broadcast:
+            waited = [i.upper() for i in expected] if expected is not None else []
+            timeout = rtt.max_timeout_of(waited)
+
+        else:
+            waited = [self.bt_comm.mac_to_str(target_mac).upper()]
+            timeout = rtt.timeout(waited[0])
+
+        cmd_id = await self.bt_comm.send_command(command=cmd.encode(), target_mac=target_mac, track=True)
+        sent = time.monotonic()
+        answered = False
+
+        try:
+            await self.bt_comm.recv_pool.wait_for_responses(
+                cmd_id,
+                cmd,
+                timeout=timeout,
+                is_broadcast=is_broadcast,
+                expected=expected
+            )
+
+            responses = self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, cmd)
+
+            # Any buzzer may still answer a broadcast late
+            answered = not is_broadcast and len(responses) > 0
+
+        finally:
+            self.bt_comm.cmd_ids.release(cmd_id, answered=answered)
+
+        received: Dict[str, float] = {}
+
+        for i in responses:
+            # Responses without MAC address (GLED...) can only be attributed to a unicast target
+            mac = i.mac if is_broadcast else waited[0]
+
+            if mac is not None:
+                received[mac] = min(received.get(mac, i.received_at), i.received_at)
+
+        for mac, received_at in received.items():
+            rtt.sample(mac, received_at - sent)
+
+        if not is_broadcast or all(i.mac is not None for i in responses):
+            for i in waited:
+                if i not in received:
+                    rtt.timed_out(i)
+
+        return responses, sent
+
+    async def __send_many(self, commands: List[Tuple[bytes, bytes | str, None | bytes | str]],
+                          reliable: None | bool) -> None:
+        """Sends commands expecting no response, reliably or not.
+
+        Args:
+            commands (List[Tuple[bytes, bytes | str, bytes | str | None]]): Commands to send, as
+                (command, arguments, target MAC address).
+            reliable (bool | None): Whether the commands are acknowledged and sent again if lost,
+                None for `reliable.enabled`.
+        """
+
+        if self.bt_comm.reliable.enabled if reliable is None else reliable:
+            await self.bt_comm.reliable.send_many(commands)
+
+        else:
+            await self.bt_comm.send_commands(commands)
+
+    async def ping(self, target_mac: bytes | str = None,
+                   expected: None | Iterable[str] = None) -> List[RecvObject]:
         """Performs a ping command and returns the responses.
 
         Args:
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            expected (Iterable[str] | None, optional): MAC addresses expected to answer a broadcast.
+                The wait ends early once all of them answered. Defaults to None.
 
         Returns:
             List[RecvObject]: List of responses from the buzzer(s).
         """
 
-        cmd_id = await self.bt_comm.send_command(command=b"PING", target_mac=target_mac)
+        return (await self.__query("PING", target_mac, expected))[0]
 
-        await self.bt_comm.recv_pool.wait_for_responses(
-            cmd_id,
-            "PING",
-            is_broadcast=self.bt_comm.is_broadcast(target_mac)
-        )
-
-        return self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "PING")
-
-    async def get_clock(self, target_mac: bytes | str = None) -> List[RecvObject]:
+    async def get_clock(self, target_mac: bytes | str = None,
+                        expected: None | Iterable[str] = None) -> List[RecvObject]:
         """Retrieves the internal clock value from the buzzer(s).
 
         Args:
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            expected (Iterable[str] | None, optional): MAC addresses expected to answer a broadcast.
+                The wait ends early once all of them answered. Defaults to None.
 
         Returns:
             List[RecvObject]: List of responses containing clock values.
         """
 
-        cmd_id = await self.bt_comm.send_command(command=b"GCLK", target_mac=target_mac)
+        return (await self.__query("GCLK", target_mac, expected))[0]
 
-        await self.bt_comm.recv_pool.wait_for_responses(
-            cmd_id,
-            "GCLK",
-            is_broadcast=self.bt_comm.is_broadcast(target_mac)
-        )
+    async def get_clock_timed(self, target_mac: bytes | str = None,
+                              expected: None | Iterable[str] = None) -> Tuple[List[RecvObject], float]:
+        """Retrieves the internal clock value from the buzzer(s), with the time GCLK was sent.
 
-        return self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "GCLK")
+        Args:
+            target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            expected (Iterable[str] | None, optional): MAC addresses expected to answer a broadcast.
+                The wait ends early once all of them answered. Defaults to None.
+
+        Returns:
+            Tuple[List[RecvObject], float]: Responses containing clock values, and monotonic time GCLK was
+            written to the gateway (after any wait in the write queue).
+        """
 
-    async def reset_clock(self, target_mac: bytes | str = None) -> None:
+        return await self.__query("GCLK", target_mac, expected)
+
+    async def reset_clock(self, target_mac: bytes | str = None, reliable: None | bool = None) -> None:
         """Resets the internal clock on the buzzer(s).
 
         Args:
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            reliable (bool | None, optional): Whether the command is acknowledged and sent again if lost
+                (see `BluetoothCommunication.reliable`). Defaults to None (`reliable.enabled`).
         """
 
-        await self.bt_comm.send_command(command=b"RCLK", target_mac=target_mac)
+        await self.__send_many([(b"RCLK", b"", target_mac)], reliable)
+        self.bt_comm.clock_estimator.reset(target_mac)
 
-    async def set_clock(self, new_clock: int, target_mac: bytes | str = None) -> None:
+    async def set_clock(self, new_clock: int, target_mac: bytes | str = None, reliable: None | bool = None) -> None:
         """Sets the internal clock to a new value if it is smaller than the current value.
 
         Args:
             new_clock (int): New clock value to set.
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            reliable (bool | None, optional): Whether the command is acknowledged and sent again if lost
+                (see `BluetoothCommunication.reliable`). Defaults to None (`reliable.enabled`).
 
         Raises:
             AssertionError: If `new_clock` is outside the valid range 0–MAX_INT64.
@@ -91,7 +191,8 @@ class Commands:
 
         assert 0 <= i_new_clock <= 9223372036854775807, "Clock must be in the range 0 - MAX_INT64"
 
-        await self.bt_comm.send_command(command=b"SCLK", args=str(i_new_clock), target_mac=target_mac)
+        await self.__send_many([(b"SCLK", str(i_new_clock), target_mac)], reliable)
+        self.bt_comm.clock_estimator.reset(target_mac)
 
     async def automatic_set_clock(self, target_mac: bytes | str = None) -> bool:
         """Automatically synchronizes all buzzer clocks.
@@ -103,51 +204,115 @@ class Commands:
             bool: True if synchronization was successful (master buzzer responded), False otherwise.
         """
 
-        cmd_id = await self.bt_comm.send_command(command=b"ACLK", target_mac=target_mac)
+        cmd_id = await self.bt_comm.send_command(command=b"ACLK", target_mac=target_mac, track=True)
+        answered = False
+
+        try:
+            await self.bt_comm.recv_pool.wait_for_responses(
+                cmd_id,
+                "ACLK",
+                is_broadcast=False  # Even if this command is made by broadcast, only master will respond
+            )
+
+            answered = len(self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "ACLK")) == 1
+
+            return answered
 
-        await self.bt_comm.recv_pool.wait_for_responses(
-            cmd_id,
-            "ACLK",
-            is_broadcast=False  # Even if this command is made by broadcast, only master will respond
-        )
+        finally:
+            self.bt_comm.cmd_ids.release(cmd_id, answered=answered)
 
-        return len(self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "ACLK")) == 1
+            # Every clock got reset, even if the master didn't answer in time
+            self.bt_comm.clock_estimator.reset()
 
-    async def get_led_number(self, target_mac: bytes | str = None) -> List[RecvObject]:
+    async def get_led_number(self, target_mac: bytes | str = None,
+                             expected: None | Iterable[str] = None) -> List[RecvObject]:
         """Retrieves the number of LEDs installed on the buzzer(s).
 
         Args:
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            expected (Iterable[str] | None, optional): MAC addresses expected to answer a broadcast.
+                The wait ends early once as many buzzers answered. Defaults to None.
 
         Returns:
             List[RecvObject]: Responses containing the number of LEDs.
         """
 
-        cmd_id = await self.bt_comm.send_command(command=b"GLED", target_mac=target_mac)
+        return (await self.__query("GLED", target_mac, expected))[0]
 
-        await self.bt_comm.recv_pool.wait_for_responses(
-            cmd_id,
-            "GLED",
-            is_broadcast=self.bt_comm.is_broadcast(target_mac)
-        )
-
-        return self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "GLED")
-
-    async def set_leds(self, leds: LEDs, target_mac: bytes | str = None) -> None:
+    async def set_leds(self, leds: LEDs | bytes, target_mac: bytes | str = None, force: bool = False,
+                       reliable: None | bool = None) -> None:
         """Sets the colors of LEDs on the buzzer(s).
 
+        Nothing is sent to a single buzzer already showing these colors (see `BluetoothCommunication.led_shadow`).
+
         Args:
-            leds (LEDs): LED colors to set.
+            leds (LEDs | bytes): LED colors to set, or an already encoded frame (3 bytes per LED).
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            force (bool, optional): Whether the colors are sent even if the buzzer already shows them.
+                Defaults to False.
+            reliable (bool | None, optional): Whether the frame is acknowledged and sent again if lost
+                (see `BluetoothCommunication.reliable`). Defaults to None (`reliable.enabled`).
         """
 
-        await self.bt_comm.send_command(command=b"SLED", args=bytes(leds), target_mac=target_mac)
+        await self.commit_frames({target_mac: leds}, force, reliable)
+
+    async def commit_frames(self, frames: Dict[None | bytes | str, LEDs | bytes], force: bool = False,
+                            reliable: None | bool = None) -> int:
+        """Sets the colors of LEDs on several buzzers at once.
+
+        Every SLED is queued at once, so they are coalesced into as few BLE writes as possible.
+        Nothing is sent to a buzzer already showing its colors (see `BluetoothCommunication.led_shadow`).
+
+        Args:
+            frames (Dict[bytes | str | None, LEDs | bytes]): LED colors to set, or already encoded frames
+                (3 bytes per LED), per MAC address. None or broadcast targets every buzzer.
+            force (bool, optional): Whether the colors are sent even if the buzzers already show them.
+                Defaults to False.
+            reliable (bool | None, optional): Whether the frames are acknowledged and sent again to the
+                buzzers which lost them (see `BluetoothCommunication.reliable`). Defaults to None
+                (`reliable.enabled`).
 
-    async def clear_leds(self, target_mac: bytes | str = None) -> None:
+        Returns:
+            int: Number of frames sent.
+        """
+
+        led_shadow = self.bt_comm.led_shadow
+        commands = []
+
+        for mac, leds in frames.items():
+            frame = bytes(leds)
+
+            if self.bt_comm.is_broadcast(mac):
+                led_shadow.update_broadcast(frame)
+
+            elif not led_shadow.update(mac, frame, force):
+                continue
+
+            commands.append((b"SLED", frame, mac))
+
+        if not commands:
+            return 0
+
+        try:
+            await self.__send_many(commands, reliable)
+
+        except Exception:
+            for _, _, mac in commands:
+                led_shadow.invalidate(mac)
+
+            raise
+
+        return len(commands)
+
+    async def clear_leds(self, target_mac: bytes | str = None, reliable: None | bool = None) -> None:
         """Clears all LEDs on the buzzer(s).
 
         Args:
             target_mac (bytes | str, optional): MAC address to target. Defaults to broadcast.
+            reliable (bool | None, optional): Whether the command is acknowledged and sent again if lost
+                (see `BluetoothCommunication.reliable`). Defaults to None (`reliable.enabled`).
         """
 
-        await self.bt_comm.send_command(command=b"CLED", target_mac=target_mac)
+        self.bt_comm.led_shadow.invalidate(target_mac, wanted=True)
+
+        await self.__send_many([(b"CLED", b"", target_mac)], reliable)
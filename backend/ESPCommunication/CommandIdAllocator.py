@@ -0,0 +1,201 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, Set, Deque
+
+logger = logging.getLogger(__name__)
+
+
+class CommandIdAllocator:
+    """Allocates command IDs (0–255) for outgoing commands.
+
+    IDs of queries still waiting for their responses are tracked as in flight and skipped, so a
+    reply can never be matched to a newer command reusing the same ID. Once released, an ID stays
+    in quarantine as long as a late reply may still come back (the longest response timeout, see
+    `RttEstimator.max_timeout`), so a reply arriving after its query timed out can't be matched to
+    the next user of the ID. IDs of unicast queries which got their response are only kept unused
+    for a short time, to let duplicates expire. If every ID is busy, allocation stalls until one gets
+    released.
+
+    Attributes:
+        quarantine (float): Seconds a released ID is kept unused, when a late reply may still come.
+        settle (float): Seconds a released ID is kept unused, when every reply already came.
+        stats (Dict[str, float]): Allocation metrics:
+            - allocations: Number of allocated IDs.
+            - skipped: Number of IDs skipped because they were in flight or in quarantine.
+            - stalls: Number of allocations which had to wait for an ID to be released.
+            - stall_time: Total time spent waiting for an ID, in seconds.
+            - max_in_flight: Highest number of IDs simultaneously in flight.
+        __next (int): Next ID to try.
+        __in_flight (Set[int]): IDs of queries waiting for their responses.
+        __released (Dict[int, float]): Monotonic time each ID in quarantine becomes available again.
+        __waiters (Deque[asyncio.Future]): Futures of stalled allocations, woken up one per released ID.
+    """
+
+    def __init__(self, quarantine: float = 3.0, settle: float = 0.1) -> None:
+        """Initializes a CommandIdAllocator instance.
+
+        Args:
+            quarantine (float, optional): Seconds a released ID is kept unused, when a late reply may
+                still come. Defaults to 3.
+            settle (float, optional): Seconds a released ID is kept unused, when every reply already
+                came. Defaults to 0.1.
+        """
+
+        self.quarantine: float = quarantine
+        self.settle: float = settle
+
+        self.stats: Dict[str, float] = {
+            "allocations": 0,
+            "skipped": 0,
+            "stalls": 0,
+            "stall_time": 0.0,
+            "max_in_flight": 0
+        }
+
+        self.__next: int = 0
+        self.__in_flight: Set[int] = set()
+        self.__released: Dict[int, float] = {}
+        self.__waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of IDs currently in flight.
+
+        Returns:
+            int: Number of queries waiting for their responses.
+        """
+
+        return len(self.__in_flight)
+
+    def __is_available(self, cmd_id: int, now: float) -> bool:
+        """Checks if an ID can be allocated.
+
+        Args:
+            cmd_id (int): ID to check.
+            now (float): Current monotonic time.
+
+        Returns:
+            bool: True if the ID is neither in flight nor in quarantine.
+        """
+
+        if cmd_id in self.__in_flight:
+            return False
+
+        available_at = self.__released.get(cmd_id)
+
+        if available_at is not None:
+            if now < available_at:
+                return False
+
+            del self.__released[cmd_id]
+
+        return True
+
+    def __try_allocate(self, track: bool) -> None | int:
+        """Tries to allocate an ID without waiting.
+
+        Args:
+            track (bool): Whether the ID must be marked as in flight.
+
+        Returns:
+            int | None: The allocated ID, None if every ID is busy.
+        """
+
+        now = time.monotonic()
+
+        for _ in range(256):
+            cmd_id = self.__next
+            self.__next = (self.__next + 1) % 256
+
+            if not self.__is_available(cmd_id, now):
+                self.stats["skipped"] += 1
+                continue
+
+            if track:
+                self.__in_flight.add(cmd_id)
+                self.stats["max_in_flight"] = max(self.stats["max_in_flight"], len(self.__in_flight))
+
+            self.stats["allocations"] += 1
+
+            return cmd_id
+
+        return None
+
+    async def allocate(self, track: bool = False) -> int:
+        """Allocates a command ID, waiting if every ID is busy.
+
+        Args:
+            track (bool, optional): Whether the ID must be marked as in flight until `release` is called.
+                Set it for commands expecting a response. Defaults to False.
+
+        Returns:
+            int: The allocated ID (0–255).
+        """
+
+        cmd_id = self.__try_allocate(track)
+
+        if cmd_id is not None:
+            return cmd_id
+
+        logger.warning("Every command ID is in flight, waiting for one to be released")
+
+        self.stats["stalls"] += 1
+        t = time.monotonic()
+
+        while cmd_id is None:
+            future = asyncio.get_running_loop().create_future()
+            self.__waiters.append(future)
+
+            try:
+                # Timeout only guards against a wake up happening right before the quarantine ends
+                await asyncio.wait_for(future, timeout=self.quarantine)
+
+            except asyncio.TimeoutError:
+                if future in self.__waiters:
+                    self.__waiters.remove(future)
+
+            cmd_id = self.__try_allocate(track)
+
+        self.stats["stall_time"] += time.monotonic() - t
+
+        return cmd_id
+
+    def release(self, cmd_id: int, answered: bool = False) -> None:
+        """Releases an ID allocated with `track=True`.
+
+        The ID is put in quarantine before being allocatable again. One stalled allocation, if any,
+        is woken up when the quarantine ends.
+
+        Args:
+            cmd_id (int): ID to release.
+            answered (bool, optional): Whether every reply to the command already came, so none can
+                come late. The ID is then only kept unused for `settle`. Defaults to False.
+        """
+
+        if cmd_id not in self.__in_flight:
+            return
+
+        delay = self.settle if answered else self.quarantine
+
+        self.__in_flight.remove(cmd_id)
+        self.__released[cmd_id] = time.monotonic() + delay
+
+        if self.__waiters:
+            asyncio.get_running_loop().call_later(delay, self.__wake_one)
+
+    def __wake_one(self) -> None:
+        """Wakes up the oldest stalled allocation."""
+
+        while self.__waiters:
+            future = self.__waiters.popleft()
+
+            if not future.done():
+                future.set_result(None)
+                return
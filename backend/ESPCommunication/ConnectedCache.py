@@ -3,11 +3,10 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
+import asyncio
 import logging
 import time
-from typing import List, TYPE_CHECKING
-
-from backend.ESPCommunication.RecvPool import RecvObject
+from typing import List, TYPE_CHECKING, Iterable, Dict, Any
 
 if TYPE_CHECKING:
     from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
@@ -16,31 +15,287 @@ logger = logging.getLogger(__name__)
 
 
 class ConnectedCache:
-    def __init__(self, bt_comm: BluetoothCommunication, expires_after: int = 30) -> None:
+    """Buzzers known to be connected, learnt from every notification and revalidated in background.
+
+    Every notification carrying its sender MAC address (PING, GCLK and BPRS) refreshes the last time
+    this buzzer was seen (`seen`), so the background clock sampling and presses keep the roster alive
+    without any PING. A buzzer silent for more than `expires_after` is pinged alone, and dropped if it
+    does not answer. A broadcast PING is only sent to discover new buzzers: on the first read, on forced
+    updates, and every `discovery_after` seconds.
+
+    Once loaded, the roster is served right away even when some buzzers must be revalidated
+    (stale-while-revalidate): the read starts a refresh in background and returns the current roster.
+    Only one refresh is in flight at a time, every caller needing a fresh roster (first read, forced
+    update) awaits the same one. If the refresh in flight only pings silent buzzers, a broadcast PING
+    is chained after it instead.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+        expires_after (int): Seconds of silence after which a buzzer is pinged.
+        discovery_after (int): Seconds after which a broadcast PING looks for new buzzers.
+        stats (Dict[str, int | float]): Cache metrics:
+            - hits: Number of reads served by a fresh roster.
+            - stale_hits: Number of reads served while the roster is revalidated.
+            - misses: Number of reads which waited for a PING (first read or forced update).
+            - refreshes: Number of refreshes (broadcast PING or PING of silent buzzers).
+            - broadcasts: Number of broadcast PING sent.
+            - unicasts: Number of PING sent to a single silent buzzer.
+            - shared: Number of reads which awaited a refresh already in flight.
+            - failures: Number of failed refreshes.
+            - discovered: Number of buzzers added to the roster.
+            - lost: Number of buzzers dropped from the roster, not answering a PING.
+            - refresh_mean: Mean duration of a refresh, in seconds.
+            - refresh_max: Longest refresh, in seconds.
+        __last_seen (Dict[str, float]): Monotonic time a notification was last received from each connected
+            buzzer (00:11:22:33:44:55).
+        __last_broadcast (float): Monotonic time of the last broadcast PING.
+        __loaded (bool): Whether a broadcast PING already completed.
+        __completed (int): Number of refreshes completed, for `refresh_mean`.
+        __refresh_task (asyncio.Task | None): Refresh in flight, None if none was started yet.
+        __refresh_broadcast (bool): Whether this refresh sends a broadcast PING.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, expires_after: int = 30, discovery_after: int = 300) -> None:
+        """Initializes a ConnectedCache instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+            expires_after (int, optional): Seconds of silence after which a buzzer is pinged. Defaults to 30.
+            discovery_after (int, optional): Seconds after which a broadcast PING looks for new buzzers.
+                Defaults to 300.
+        """
+
         self.bt_comm: BluetoothCommunication = bt_comm
         self.expires_after: int = expires_after
+        self.discovery_after: int = discovery_after
+
+        self.stats: Dict[str, int | float] = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "broadcasts": 0, "unicasts": 0, "shared": 0,
+            "failures": 0, "discovered": 0, "lost": 0, "refresh_mean": 0.0, "refresh_max": 0.0
+        }
+
+        self.__last_seen: Dict[str, float] = {}
+        self.__last_broadcast: float = 0.0
+        self.__loaded: bool = False
+        self.__completed: int = 0
+        self.__refresh_task: None | asyncio.Task = None
+        self.__refresh_broadcast: bool = False
+
+    def seen(self, mac: str, at: None | float = None) -> None:
+        """Records a notification received from a buzzer.
+
+        Called for every notification carrying its sender MAC address, so it must stay cheap.
+
+        Args:
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55, uppercase).
+            at (float | None, optional): Monotonic time the notification was received. Defaults to now.
+        """
+
+        new = mac not in self.__last_seen
+
+        self.__last_seen[mac] = time.monotonic() if at is None else at
+
+        if new:
+            self.stats["discovered"] += 1
+            self.bt_comm.events.publish("buzzers", {"connected": self.connected})
+
+    def reset(self) -> None:
+        """Forgets every buzzer, the next read waits for a broadcast PING."""
+
+        self.__last_seen.clear()
+        self.__loaded = False
 
-        self.next_poll: int = 0
+    def silent(self) -> List[str]:
+        """Returns the buzzers of the roster silent for more than `expires_after`.
 
-        self.__connected: List[str] = []
+        Returns:
+            List[str]: MAC addresses (00:11:22:33:44:55).
+        """
 
-    async def update_cache(self, force: bool = False) -> None:
-        if not force and self.next_poll > time.time():
+        limit = time.monotonic() - self.expires_after
+
+        return [mac for mac, at in self.__last_seen.items() if at < limit]
+
+    def __discovery_due(self) -> bool:
+        """Tells whether a broadcast PING must look for new buzzers.
+
+        Returns:
+            bool: True if the last broadcast PING is older than `discovery_after`.
+        """
+
+        return time.monotonic() - self.__last_broadcast > self.discovery_after
+
+    async def update_cache(self, force: bool = False, expected: None | Iterable[str] = None) -> None:
+        """Refreshes the roster if needed.
+
+        Args:
+            force (bool, optional): Whether to wait for a new broadcast PING even if the roster is fresh.
+                Defaults to False.
+            expected (Iterable[str] | None, optional): Buzzers expected to answer (00:11:22:33:44:55), so the
+                broadcast can end as soon as they all did. Defaults to None.
+
+        Raises:
+            Exception: Any exception raised while sending the PING, when waiting for it.
+        """
+
+        if force or not self.__loaded:
+            self.stats["misses"] += 1
+
+            await asyncio.shield(self.__refresh(expected, broadcast=True))
             return
 
-        logging.debug("Updating connected cache")
+        if not self.__discovery_due() and not self.silent():
+            self.stats["hits"] += 1
+            return
+
+        self.stats["stale_hits"] += 1
+        self.__refresh(expected, broadcast=False)
+
+    def __refresh(self, expected: None | Iterable[str], broadcast: bool) -> asyncio.Task:
+        """Starts a refresh, or returns the one in flight.
+
+        A refresh in flight is only shared if it sends a broadcast PING or none is needed. Otherwise
+        the new refresh waits for it before sending its broadcast.
+
+        Args:
+            expected (Iterable[str] | None): Buzzers expected to answer a broadcast.
+            broadcast (bool): Whether a broadcast PING must be sent, even if no discovery is due.
+
+        Returns:
+            asyncio.Task: Task of the refresh.
+        """
+
+        in_flight = self.__refresh_task is not None and not self.__refresh_task.done()
+
+        if in_flight and (self.__refresh_broadcast or not broadcast):
+            self.stats["shared"] += 1
+            return self.__refresh_task
 
-        ret: List[RecvObject] = await self.bt_comm.commands.ping(target_mac=b"\xFF\xFF\xFF\xFF\xFF\xFF")
+        if in_flight:
+            self.__refresh_task = asyncio.create_task(self.__ping_after(self.__refresh_task, expected))
 
-        self.__connected = [i.data[0] for i in ret]
-        self.next_poll = int(time.time() + self.expires_after)
+        else:
+            self.__refresh_task = asyncio.create_task(self.__ping(expected, broadcast))
+
+        self.__refresh_task.add_done_callback(self.__on_refresh_done)
+        self.__refresh_broadcast = broadcast or self.__discovery_due()
+
+        return self.__refresh_task
+
+    async def __ping_after(self, previous: asyncio.Task, expected: None | Iterable[str]) -> None:
+        """Sends a broadcast PING once a refresh of silent buzzers is over.
+
+        Args:
+            previous (asyncio.Task): Task of the refresh in flight, its failure is logged on its own.
+            expected (Iterable[str] | None): Buzzers expected to answer the broadcast.
+        """
+
+        await asyncio.wait([previous])
+        await self.__ping(expected, broadcast=True)
+
+    def __on_refresh_done(self, task: asyncio.Task) -> None:
+        """Logs a failed refresh, even when nobody awaits it.
+
+        Args:
+            task (asyncio.Task): Task of the refresh.
+        """
+
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["failures"] += 1
+            logger.warning(f"Connected cache refresh failed: {task.exception()}")
+
+    async def __ping(self, expected: None | Iterable[str], broadcast: bool) -> None:
+        """Pings buzzers and drops the ones which did not answer.
+
+        Answers are recorded by `seen`, as every PING response carries the MAC address of its sender.
+
+        Args:
+            expected (Iterable[str] | None): Buzzers expected to answer a broadcast.
+            broadcast (bool): Whether a broadcast PING must be sent, even if no discovery is due.
+        """
+
+        start = time.monotonic()
+        self.stats["refreshes"] += 1
+
+        if broadcast or self.__discovery_due():
+            logger.debug("Updating connected cache")
+
+            pinged = list(self.__last_seen)
+            self.stats["broadcasts"] += 1
+
+            # Buzzers known to be connected are expected to answer, so the broadcast can end early
+            await self.bt_comm.commands.ping(
+                target_mac=b"\xFF\xFF\xFF\xFF\xFF\xFF",
+                expected=set(pinged) | set(expected if expected is not None else [])
+            )
+
+            self.__last_broadcast = start
+            self.__loaded = True
+
+        else:
+            pinged = self.silent()
+
+            logger.debug(f"Pinging silent buzzers {pinged}")
+
+            self.stats["unicasts"] += len(pinged)
+
+            await asyncio.gather(*[self.bt_comm.commands.ping(target_mac=i) for i in pinged])
+
+        lost = [i for i in pinged if self.__last_seen.get(i, start) < start]
+
+        for i in lost:
+            del self.__last_seen[i]
+            self.bt_comm.rtt_estimator.forget(i)
+
+        if lost:
+            self.stats["lost"] += len(lost)
+            self.bt_comm.events.publish("buzzers", {"connected": self.connected})
+
+        duration = time.monotonic() - start
+        self.__completed += 1
+
+        self.stats["refresh_mean"] += (duration - self.stats["refresh_mean"]) / self.__completed
+        self.stats["refresh_max"] = max(self.stats["refresh_max"], duration)
+
+    @property
+    def connected(self) -> List[str]:
+        """List[str]: Buzzers currently in the roster, without pinging them again."""
+
+        return list(self.__last_seen)
 
     async def get_connected_str(self) -> List[str]:
+        """Returns the connected buzzers, refreshing them in background when expired.
+
+        Returns:
+            List[str]: MAC addresses (00:11:22:33:44:55).
+        """
+
         await self.update_cache()
 
-        return self.__connected
+        return self.connected
 
     async def get_connected_bytes(self) -> List[bytes]:
+        """Returns the connected buzzers, refreshing them in background when expired.
+
+        Returns:
+            List[bytes]: MAC addresses (6 bytes).
+        """
+
         await self.update_cache()
 
-        return [self.bt_comm.target_mac_formatter(i) for i in self.__connected]
+        return [self.bt_comm.target_mac_formatter(i) for i in self.__last_seen]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns cache metrics.
+
+        Returns:
+            Dict[str, Any]: `stats`, with the roster size, the number of silent buzzers and whether a
+            refresh is in flight.
+        """
+
+        return {
+            **self.stats,
+            "connected": len(self.__last_seen),
+            "silent": len(self.silent()),
+            "refreshing": self.__refresh_task is not None and not self.__refresh_task.done()
+        }
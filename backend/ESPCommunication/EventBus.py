@@ -0,0 +1,173 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List
+
+
+@dataclass
+class Event:
+    """An event pushed to the GUI.
+
+    Attributes:
+        id (int): Sequence number of the event, increasing by one per event published.
+        type (str): Kind of event (state, team, press, connection, buzzers...).
+        data (Dict[str, Any]): JSON serializable content of the event.
+        sse (bytes): Event encoded once for every Server-Sent Events stream.
+    """
+
+    id: int
+    type: str
+    data: Dict[str, Any]
+    sse: bytes = b""
+
+    def __post_init__(self) -> None:
+        if not self.sse:
+            self.sse = f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n".encode()
+
+
+class EventBus:
+    """Publishes game and connectivity events to any number of subscribers (GUI event streams).
+
+    Events are encoded once when published, then handed to a bounded queue per subscriber, so the cost
+    of a publication barely depends on the number of screens. A subscriber too slow to drain its queue
+    loses its pending events and receives None instead, telling it to resynchronize from a snapshot.
+    The last events are kept, so a subscriber reconnecting with the ID of the last event it received
+    gets the ones it missed.
+
+    Attributes:
+        history (int): Number of last events kept for reconnecting subscribers.
+        queue_size (int): Maximum number of pending events per subscriber.
+        stats (Dict[str, int]): Bus metrics:
+            - published: Number of events published.
+            - delivered: Number of events queued to subscribers.
+            - overflows: Number of times a subscriber lost its pending events.
+        __last_id (int): ID of the last event published, 0 if none was.
+        __events (Deque[Event]): Last events published, oldest first.
+        __subscribers (List[asyncio.Queue]): Queue of pending events of every subscriber.
+    """
+
+    def __init__(self, history: int = 64, queue_size: int = 256) -> None:
+        """Initializes an EventBus instance.
+
+        Args:
+            history (int, optional): Number of last events kept for reconnecting subscribers. Defaults to 64.
+            queue_size (int, optional): Maximum number of pending events per subscriber. Defaults to 256.
+        """
+
+        self.history: int = history
+        self.queue_size: int = queue_size
+
+        self.stats: Dict[str, int] = {"published": 0, "delivered": 0, "overflows": 0}
+
+        self.__last_id: int = 0
+        self.__events: Deque[Event] = deque(maxlen=history)
+        self.__subscribers: List[asyncio.Queue] = []
+
+    @property
+    def last_id(self) -> int:
+        """int: ID of the last event published, 0 if none was."""
+
+        return self.__last_id
+
+    @property
+    def subscriber_nb(self) -> int:
+        """int: Number of current subscribers."""
+
+        return len(self.__subscribers)
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> Event:
+        """Publishes an event to every subscriber.
+
+        Args:
+            event_type (str): Kind of event.
+            data (Dict[str, Any]): JSON serializable content of the event.
+
+        Returns:
+            Event: The published event.
+        """
+
+        self.__last_id += 1
+
+        event = Event(self.__last_id, event_type, data)
+        self.__events.append(event)
+
+        self.stats["published"] += 1
+
+        for i in self.__subscribers:
+            self.__deliver(i, event)
+
+        return event
+
+    def __deliver(self, queue: asyncio.Queue, event: Event) -> None:
+        """Queues an event to a subscriber, replacing its pending events by None if it is full.
+
+        Args:
+            queue (asyncio.Queue): Queue of the subscriber.
+            event (Event): Event to queue.
+        """
+
+        if queue.full():
+            while not queue.empty():
+                queue.get_nowait()
+
+            # The subscriber can't catch up event by event anymore
+            queue.put_nowait(None)
+            self.stats["overflows"] += 1
+            return
+
+        queue.put_nowait(event)
+        self.stats["delivered"] += 1
+
+    def subscribe(self, last_id: None | int = None) -> asyncio.Queue:
+        """Registers a subscriber.
+
+        Args:
+            last_id (int | None, optional): ID of the last event received before reconnecting. Events
+                published since then are queued right away, or None if some are not kept anymore.
+                Defaults to None (new subscriber).
+
+        Returns:
+            asyncio.Queue: Queue of pending events (Event), None meaning events were lost.
+        """
+
+        queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # A higher ID than the last one comes from before a restart of the backend
+        if last_id is not None and last_id != self.__last_id:
+            missed = [i for i in self.__events if i.id > last_id]
+
+            if not missed or missed[0].id != last_id + 1:
+                queue.put_nowait(None)
+
+            else:
+                for i in missed:
+                    self.__deliver(queue, i)
+
+        self.__subscribers.append(queue)
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Unregisters a subscriber.
+
+        Args:
+            queue (asyncio.Queue): Queue returned by `subscribe`.
+        """
+
+        if queue in self.__subscribers:
+            self.__subscribers.remove(queue)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns bus metrics.
+
+        Returns:
+            Dict[str, int]: `stats`, with the number of subscribers and the last event ID.
+        """
+
+        return {**self.stats, "subscribers": self.subscriber_nb, "last_id": self.__last_id}
@@ -1,13 +1,23 @@
+import operator
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 
 
 class LEDs:
     """Represents all LEDs on a buzzer.
 
+    Colors are stored in a single bytearray, 3 bytes (red, green, blue) per LED, which is the format
+    sent to the hardware. LEDs can be read and written by index or slice as `Color` objects (or 0xRRGGBB
+    integers), either on the object itself or through `leds` (kept for compatibility, it is the object
+    itself). Colors read are views on the buffer (`LedColor`), so `leds.leds[i].red = 255` still sets
+    the LED as it did when `leds` was a list of colors.
+
+    LEDs are compared by colors, they are mutable so they are not hashable.
+
     Attributes:
         led_nb (int): Number of LEDs on the buzzer. This attribute is constant after initialization.
-        leds (List[Color]): List of LED color values.
+        leds (LEDs): The LEDs themselves, as a sequence of `Color`. Can be assigned a list of `led_nb` colors.
+        __buffer (bytearray): Colors of every LED, 3 bytes per LED.
     """
 
     def __init__(self, led_nb: int) -> None:
@@ -20,31 +30,204 @@ class LEDs:
         """
 
         self.led_nb = led_nb
-        self.leds: List[Color] = [Color(0, 0, 0) for _ in range(self.led_nb)]
+        self.__buffer: bytearray = bytearray(3 * led_nb)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Validates attribute modifications.
 
-        Ensures that `leds` length is not changed and `led_nb` cannot be modified after initialization.
+        Ensures that `led_nb` cannot be modified after initialization.
 
         Args:
             name (str): Name of the attribute being modified.
             value (Any): New value for the attribute.
 
         Raises:
-            ValueError: If `leds` is not a list or its length does not match `led_nb`.
             RuntimeError: If attempting to modify `led_nb` after initialization.
         """
 
-        if name == "leds":
-            if not isinstance(value, list) or len(value) != getattr(self, "led_nb", len(value)):
-                raise ValueError(f"Leds must be a list of length {self.led_nb}")
-
-        elif name == "led_nb" and "led_nb" in self.__dict__:
+        if name == "led_nb" and "led_nb" in self.__dict__:
             raise RuntimeError("This attribute is a constant")
 
         super().__setattr__(name, value)
 
+    @property
+    def leds(self) -> LEDs:
+        """Returns the LEDs as a sequence of colors.
+
+        Returns:
+            LEDs: This object, which reads and writes colors by index or slice.
+        """
+
+        return self
+
+    @leds.setter
+    def leds(self, value: List[Color]) -> None:
+        """Sets the color of every LED.
+
+        Args:
+            value (List[Color]): Colors of the LEDs.
+
+        Raises:
+            ValueError: If `value` is not a list or its length does not match `led_nb`.
+        """
+
+        if not isinstance(value, list) or len(value) != self.led_nb:
+            raise ValueError(f"Leds must be a list of length {self.led_nb}")
+
+        self.__buffer[:] = b"".join([operator.index(i).to_bytes(3) for i in value])
+
+    def __len__(self) -> int:
+        """Returns the number of LEDs.
+
+        Returns:
+            int: `led_nb`.
+        """
+
+        return self.led_nb
+
+    def __getitem__(self, index: int | slice) -> LedColor | List[LedColor]:
+        """Returns the color of one or several LEDs.
+
+        Args:
+            index (int | slice): Index or slice of LEDs.
+
+        Returns:
+            LedColor | List[LedColor]: Color of the LED, or list of colors for a slice. Changing their
+            components changes the LEDs.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.led_nb))]
+
+        return LedColor(self.__buffer, 3 * range(self.led_nb)[index])
+
+    def __setitem__(self, index: int | slice, value: Color | Iterable[Color]) -> None:
+        """Sets the color of one or several LEDs.
+
+        Args:
+            index (int | slice): Index or slice of LEDs.
+            value (Color | Iterable[Color]): Color of the LED, or colors of the slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If a slice is not given as many colors as it has LEDs.
+        """
+
+        if isinstance(index, slice):
+            indices = range(*index.indices(self.led_nb))
+            value = b"".join([operator.index(i).to_bytes(3) for i in value])
+
+            if len(value) != 3 * len(indices):
+                raise ValueError(f"{len(indices)} colors expected for this slice, got {len(value) // 3}")
+
+            if indices.step == 1:
+                self.__buffer[3 * indices.start:3 * indices.stop] = value
+                return
+
+            for i, j in enumerate(indices):
+                self.__buffer[3 * j:3 * j + 3] = value[3 * i:3 * i + 3]
+
+            return
+
+        i = 3 * range(self.led_nb)[index]
+
+        self.__buffer[i:i + 3] = operator.index(value).to_bytes(3)
+
+    def __iter__(self) -> Iterator[LedColor]:
+        """Iterates over the LED colors.
+
+        Returns:
+            Iterator[LedColor]: Color of each LED, in order, as views on the LEDs.
+        """
+
+        return (self[i] for i in range(self.led_nb))
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the colors of two LEDs objects.
+
+        Args:
+            other (object): Object to compare with.
+
+        Returns:
+            bool: True if `other` is a LEDs object with the same colors.
+        """
+
+        if not isinstance(other, LEDs):
+            return NotImplemented
+
+        return self.__buffer == other.__buffer
+
+    # Equal LEDs may stop being equal once modified, they can't be used as dict keys
+    __hash__ = None
+
+    def fill(self, color: Color, start: int = 0, stop: None | int = None, step: int = 1) -> LEDs:
+        """Sets a range of LEDs to the same color.
+
+        Args:
+            color (Color): Color to set.
+            start (int, optional): First LED of the range. Defaults to 0.
+            stop (int | None, optional): End of the range (excluded). Defaults to `led_nb`.
+            step (int, optional): Step between LEDs of the range. Defaults to 1.
+
+        Returns:
+            LEDs: This object, for chaining.
+        """
+
+        indices = range(*slice(start, stop, step).indices(self.led_nb))
+        color_b = operator.index(color).to_bytes(3)
+
+        if indices.step == 1:
+            self.__buffer[3 * indices.start:3 * indices.stop] = color_b * len(indices)
+
+        else:
+            for i in indices:
+                self.__buffer[3 * i:3 * i + 3] = color_b
+
+        return self
+
+    def mirror(self, start: int, stop: int, to: int, reverse: bool = False) -> LEDs:
+        """Copies a range of LEDs to another position.
+
+        Args:
+            start (int): First LED of the copied range.
+            stop (int): End of the copied range (excluded).
+            to (int): First LED of the destination.
+            reverse (bool, optional): Whether the range is copied in reverse order. Defaults to False.
+
+        Returns:
+            LEDs: This object, for chaining.
+
+        Raises:
+            IndexError: If a range does not fit in the LEDs.
+        """
+
+        if not 0 <= start <= stop <= self.led_nb or not 0 <= to <= self.led_nb - (stop - start):
+            raise IndexError("Mirrored range out of LEDs")
+
+        block = self.__buffer[3 * start:3 * stop]
+
+        if reverse:
+            block = b"".join([block[i:i + 3] for i in range(len(block) - 3, -1, -3)])
+
+        self.__buffer[3 * to:3 * (to + stop - start)] = block
+
+        return self
+
+    def copy(self) -> LEDs:
+        """Returns an independent copy of the LEDs.
+
+        Returns:
+            LEDs: New object with the same colors.
+        """
+
+        ret = LEDs(self.led_nb)
+        ret.__buffer[:] = self.__buffer
+
+        return ret
+
     def __str__(self) -> str:
         """Returns a human-readable string of the object.
 
@@ -54,18 +237,33 @@ class LEDs:
             str: Formatted string representing all LED colors.
         """
 
-        return f"<LEDs {" ".join([f"{int(i):06X}" for i in self.leds])}>"
+        return f"<LEDs {self.__buffer.hex(" ", 3).upper()}>"
 
     def __bytes__(self) -> bytes:
         """Returns the bytes representation of the LEDs.
 
-        Each LED is represented by 3 bytes: red, green, and blue.
+        Each LED is represented by 3 bytes: red, green, and blue. The buffer is copied once, so
+        later changes to the LEDs don't alter the returned value.
+
+        Returns:
+            bytes: Bytes suitable for sending to the hardware.
+        """
+
+        return bytes(self.__buffer)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exposes the LED buffer without copy (buffer protocol).
+
+        The LEDs can be used wherever a bytes-like object is accepted (e.g. `b" " + leds`).
+
+        Args:
+            flags (int): Buffer flags requested by the consumer.
 
         Returns:
-            str: Bytes suitable for sending to the hardware.
+            memoryview: View of the LED buffer, 3 bytes per LED.
         """
 
-        return b"".join([bytes(i) for i in self.leds])
+        return memoryview(self.__buffer)
 
 
 @dataclass
@@ -202,3 +400,62 @@ class Color:
         """
 
         return self.__index__().to_bytes(length=3)
+
+
+class LedColor(Color):
+    """Color of one LED of a `LEDs` object, changes to its components are written back to the LEDs.
+
+    Attributes:
+        __buffer (bytearray): Colors of every LED of the `LEDs` object, 3 bytes per LED.
+        __offset (int): Position of the red component of this LED in the buffer.
+    """
+
+    COMPONENTS = ("red", "green", "blue")
+
+    def __init__(self, buffer: bytearray, offset: int) -> None:
+        """Initializes a LedColor instance.
+
+        Args:
+            buffer (bytearray): Colors of every LED, 3 bytes per LED.
+            offset (int): Position of the red component of the LED in the buffer.
+        """
+
+        # Set first, components are written back as soon as they are initialized
+        object.__setattr__(self, "_LedColor__buffer", buffer)
+        object.__setattr__(self, "_LedColor__offset", offset)
+
+        super().__init__(buffer[offset], buffer[offset + 1], buffer[offset + 2])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Validates modifications to color components, and writes them to the LEDs.
+
+        Args:
+            name (str): Name of the attribute being modified.
+            value (Any): New value for the attribute.
+
+        Raises:
+            AssertionError: If the new value for red, green, or blue is not an integer in the range 0–255.
+        """
+
+        super().__setattr__(name, value)
+
+        if name in self.COMPONENTS:
+            self.__buffer[self.__offset + self.COMPONENTS.index(name)] = value
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the components of two colors, whether they are LED views or not.
+
+        Args:
+            other (object): Object to compare with.
+
+        Returns:
+            bool: True if `other` is a Color with the same components.
+        """
+
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        return operator.index(self) == operator.index(other)
+
+    # Same as Color, components are mutable
+    __hash__ = None
@@ -0,0 +1,208 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Callable, Awaitable
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Keyframe:
+    """LED frames shown during a step of a timeline.
+
+    Attributes:
+        duration (float): Seconds the step lasts.
+        frames (Dict[bytes | str, bytes]): Encoded frame (3 bytes per LED) shown per MAC address.
+        clear (bool): Whether every buzzer is cleared (CLED) before showing the frames.
+    """
+
+    duration: float
+    frames: Dict[bytes | str, bytes] = field(default_factory=dict)
+    clear: bool = False
+
+
+@dataclass
+class Timeline:
+    """Declarative LED animation: keyframes shown one after the other.
+
+    Attributes:
+        keyframes (List[Keyframe]): Steps of the animation, in order.
+    """
+
+    keyframes: List[Keyframe]
+
+    @property
+    def duration(self) -> float:
+        """float: Seconds the whole animation lasts."""
+
+        return sum(i.duration for i in self.keyframes)
+
+    def at(self, elapsed: float) -> None | int:
+        """Finds the keyframe shown at a given time.
+
+        Args:
+            elapsed (float): Seconds since the start of the animation.
+
+        Returns:
+            int | None: Index of the keyframe, None once the animation is over.
+        """
+
+        for i, keyframe in enumerate(self.keyframes):
+            elapsed -= keyframe.duration
+
+            if elapsed < 0:
+                return i
+
+        return None
+
+    @classmethod
+    def flash(cls, macs: List[bytes | str], frame: bytes, count: int = 5, period: float = 0.5) -> Timeline:
+        """Builds an animation flashing a frame on buzzers, every other buzzer being cleared.
+
+        Args:
+            macs (List[bytes | str]): MAC addresses of the flashing buzzers.
+            frame (bytes): Encoded frame (3 bytes per LED) to flash.
+            count (int, optional): Number of flashes. Defaults to 5.
+            period (float, optional): Seconds between two flashes, half of it lit. Defaults to 0.5.
+
+        Returns:
+            Timeline: The animation.
+        """
+
+        keyframes = []
+
+        for _ in range(count):
+            keyframes.append(Keyframe(period / 2, {mac: frame for mac in macs}, clear=not keyframes))
+            keyframes.append(Keyframe(period / 2, clear=True))
+
+        return cls(keyframes)
+
+
+class LedAnimator:
+    """Plays LED animations in background, the latest one preempting the others.
+
+    Timelines are sampled at a fixed frame rate, and a keyframe is only written when it changes, so
+    a late write delays the next keyframe without shifting the whole animation. Playing an animation,
+    or calling `stop` before a static write, cancels the running one: its remaining keyframes are never
+    written.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+        frame_rate (float): Timeline samplings per second.
+        stats (Dict[str, int]): Animation metrics:
+            - played: Number of animations started.
+            - completed: Number of animations played until the end.
+            - preempted: Number of animations cancelled before their end.
+            - keyframes: Number of keyframes written.
+        __task (asyncio.Task | None): Animation in progress, None if none was played yet.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, frame_rate: float = 20.0) -> None:
+        """Initializes a LedAnimator instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+            frame_rate (float, optional): Timeline samplings per second. Defaults to 20.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.frame_rate: float = frame_rate
+
+        self.stats: Dict[str, int] = {"played": 0, "completed": 0, "preempted": 0, "keyframes": 0}
+
+        self.__task: None | asyncio.Task = None
+
+    @property
+    def running(self) -> bool:
+        """bool: Whether an animation is in progress."""
+
+        return self.__task is not None and not self.__task.done()
+
+    def play(self, timeline: Timeline, then: None | Callable[[], Awaitable[None]] = None) -> asyncio.Task:
+        """Starts an animation, cancelling the running one.
+
+        Args:
+            timeline (Timeline): Animation to play.
+            then (Callable[[], Awaitable[None]] | None, optional): Coroutine function called once the
+                animation is over, not called if it is preempted. Defaults to None.
+
+        Returns:
+            asyncio.Task: Task playing the animation.
+        """
+
+        self.stop()
+
+        self.__task = asyncio.create_task(self.__run(timeline, then))
+        self.stats["played"] += 1
+
+        return self.__task
+
+    def stop(self) -> bool:
+        """Cancels the running animation.
+
+        Does nothing when called from the animation itself (from its `then` callback).
+
+        Returns:
+            bool: True if an animation was cancelled.
+        """
+
+        if not self.running or self.__task is asyncio.current_task():
+            return False
+
+        self.__task.cancel()
+        self.stats["preempted"] += 1
+
+        return True
+
+    async def __show(self, keyframe: Keyframe) -> None:
+        """Writes a keyframe.
+
+        Args:
+            keyframe (Keyframe): Keyframe to show.
+        """
+
+        if keyframe.clear:
+            await self.bt_comm.commands.clear_leds()
+
+        if keyframe.frames:
+            await self.bt_comm.commands.commit_frames(keyframe.frames)
+
+        self.stats["keyframes"] += 1
+
+    async def __run(self, timeline: Timeline, then: None | Callable[[], Awaitable[None]]) -> None:
+        """Plays an animation until its end.
+
+        Args:
+            timeline (Timeline): Animation to play.
+            then (Callable[[], Awaitable[None]] | None): Coroutine function called once the animation is over.
+        """
+
+        start = time.monotonic()
+        shown = None
+        tick = 0
+
+        try:
+            while (index := timeline.at(time.monotonic() - start)) is not None:
+                if index != shown:
+                    shown = index
+                    await self.__show(timeline.keyframes[index])
+
+                tick += 1
+                await asyncio.sleep(max(0.0, start + tick / self.frame_rate - time.monotonic()))
+
+            self.stats["completed"] += 1
+
+            if then is not None:
+                await then()
+
+        except Exception as e:
+            logger.warning(f"LED animation failed: {e}")
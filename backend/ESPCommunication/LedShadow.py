@@ -0,0 +1,161 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+
+class LedShadow:
+    """Last LED frame sent to each buzzer, used to skip identical SLED writes.
+
+    A frame is recorded when its SLED is sent to a single buzzer. The shadow of a buzzer is dropped
+    when its LEDs may have changed otherwise: CLED, broadcast SLED, failed write, reconnection to the
+    gateway, or buzzer reboot (unset clock reported).
+
+    The frames wanted on the buzzers are kept apart, so they can be shown again once the gateway is
+    reconnected (see `wanted` and `cleared`): the last broadcast frame, as long as no broadcast CLED
+    replaced it, then the frame wanted on each buzzer since, and the buzzers cleared alone since.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance, used to format MAC addresses.
+        enabled (bool): Whether identical writes are skipped.
+        stats (Dict[str, int]): Shadow metrics:
+            - sent: Number of SLED written to a single buzzer.
+            - skipped: Number of SLED not written because the buzzer already shows the frame.
+            - invalidations: Number of shadow drops (a broadcast one counting once).
+        __frames (Dict[str, bytes]): Last frame sent per MAC address (00:11:22:33:44:55).
+        __wanted (Dict[str, bytes]): Last frame requested per MAC address, even if its write failed.
+        __broadcast (bytes | None): Last frame broadcast to every buzzer, None if none or if a broadcast CLED
+            replaced it.
+        __cleared (Set[str]): MAC addresses cleared alone (CLED) since the last broadcast frame.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, enabled: bool = True) -> None:
+        """Initializes a LedShadow instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance, used to format MAC addresses.
+            enabled (bool, optional): Whether identical writes are skipped. Defaults to True.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.enabled: bool = enabled
+
+        self.stats: Dict[str, int] = {"sent": 0, "skipped": 0, "invalidations": 0}
+
+        self.__frames: Dict[str, bytes] = {}
+        self.__wanted: Dict[str, bytes] = {}
+        self.__broadcast: None | bytes = None
+        self.__cleared: Set[str] = set()
+
+    def update(self, mac: bytes | str, frame: bytes, force: bool = False) -> bool:
+        """Records a frame about to be sent to a buzzer.
+
+        Args:
+            mac (bytes | str): MAC address of the buzzer.
+            frame (bytes): LED frame (3 bytes per LED).
+            force (bool, optional): Whether the frame must be sent even if the buzzer already shows it.
+                Defaults to False.
+
+        Returns:
+            bool: True if the frame must be sent, False if the buzzer already shows it.
+        """
+
+        mac_str = self.bt_comm.mac_to_str(mac).upper()
+        self.__wanted[mac_str] = frame
+        self.__cleared.discard(mac_str)
+
+        if self.enabled and not force and self.__frames.get(mac_str) == frame:
+            self.stats["skipped"] += 1
+            return False
+
+        self.__frames[mac_str] = frame
+        self.stats["sent"] += 1
+
+        return True
+
+    def update_broadcast(self, frame: bytes) -> None:
+        """Records a frame about to be broadcast to every buzzer.
+
+        Buzzers which miss the broadcast keep their former colors, so every shadow is dropped. The frame
+        replaces every frame wanted before.
+
+        Args:
+            frame (bytes): LED frame (3 bytes per LED).
+        """
+
+        self.invalidate(wanted=True)
+        self.__broadcast = frame
+
+    def invalidate(self, mac: None | bytes | str = None, wanted: bool = False) -> None:
+        """Forgets the frame shown by a buzzer.
+
+        Args:
+            mac (bytes | str | None, optional): MAC address of the buzzer. Broadcast or None for every buzzer.
+            wanted (bool, optional): Whether the frame wanted on the buzzer is forgotten too, as its LEDs
+                were cleared (CLED). Defaults to False.
+        """
+
+        self.stats["invalidations"] += 1
+
+        if mac is None or self.bt_comm.is_broadcast(mac):
+            self.__frames.clear()
+
+            if wanted:
+                self.__wanted.clear()
+                self.__cleared.clear()
+                self.__broadcast = None
+
+            return
+
+        mac_str = self.bt_comm.mac_to_str(mac).upper()
+
+        self.__frames.pop(mac_str, None)
+
+        if wanted:
+            self.__wanted.pop(mac_str, None)
+
+            # Otherwise the replayed broadcast frame would show on it again
+            if self.__broadcast is not None:
+                self.__cleared.add(mac_str)
+
+    def get(self, mac: bytes | str) -> None | bytes:
+        """Returns the last frame sent to a buzzer.
+
+        Args:
+            mac (bytes | str): MAC address of the buzzer.
+
+        Returns:
+            bytes | None: The frame, None if unknown.
+        """
+
+        return self.__frames.get(self.bt_comm.mac_to_str(mac).upper())
+
+    def wanted(self) -> Dict[None | str, bytes]:
+        """Returns the last frames requested on the buzzers, whether they were written or not.
+
+        Returns:
+            Dict[str | None, bytes]: Frame per MAC address (00:11:22:33:44:55). The last broadcast frame comes
+            first with a None key, if any, so sending them in order shows every buzzer its frame.
+        """
+
+        frames: Dict[None | str, bytes] = {} if self.__broadcast is None else {None: self.__broadcast}
+        frames.update(self.__wanted)
+
+        return frames
+
+    def cleared(self) -> List[str]:
+        """Returns the buzzers cleared alone since the last broadcast frame.
+
+        Returns:
+            List[str]: MAC addresses (00:11:22:33:44:55), to clear again after the frames of `wanted`.
+        """
+
+        return sorted(self.__cleared)
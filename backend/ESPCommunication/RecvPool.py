@@ -1,8 +1,10 @@
 import asyncio
-import sqlite3
 import time
-from dataclasses import dataclass
-from typing import List
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Deque, Set, Iterable
+
+T_pool_key = Tuple[int, str, bytes]
 
 
 class RecvPool:
@@ -11,9 +13,21 @@ class RecvPool:
     Provides methods to insert, delete, and query received packets.
     Entries are automatically cleared after a configurable duration.
 
+    Packets are stored in dictionaries indexed by command name, command ID and both, so every
+    lookup is O(1). Expiry is done by time bucket: packets received during the same second share
+    a bucket, and only the oldest buckets are checked when clearing garbage.
+
     Attributes:
-        __sql (sqlite3.Connection): In-memory SQLite database storing packets.
         __clear_garbage_after (int): Seconds before old packets are automatically removed.
+        __objects (Dict[T_pool_key, RecvObject]): Stored packets, unique by (cmd_id, cmd, head).
+        __by_cmd (Dict[str, Dict[T_pool_key, RecvObject]]): Packets indexed by command name.
+        __by_cmd_id (Dict[int, Dict[T_pool_key, RecvObject]]): Packets indexed by command ID.
+        __by_cmd_id_and_cmd (Dict[Tuple[int, str], Dict[T_pool_key, RecvObject]]): Packets indexed
+            by (cmd_id, cmd).
+        __buckets (Deque[Tuple[int, List[T_pool_key]]]): Keys of stored packets grouped by timestamp,
+            oldest first.
+        __pending (Dict[Tuple[int, str], List[PendingResponse]]): Coroutines waiting for a response,
+            keyed by (cmd_id, cmd). They are woken up as soon as a matching packet is inserted.
     """
 
     def __init__(self, clear_garbage_after: int = 60) -> None:
@@ -23,18 +37,48 @@ class RecvPool:
             clear_garbage_after (int, optional): Seconds to keep entries in the pool. Defaults to 60.
         """
 
-        self.__sql: sqlite3.Connection = sqlite3.connect(":memory:")
         self.__clear_garbage_after: int = clear_garbage_after
 
-        self.__sql.execute(
-            "CREATE TABLE pool ("
-            "   ts INTEGER NOT NULL,"
-            "   cmd_id INTEGER NOT NULL,"
-            "   cmd TEXT NOT NULL,"
-            "   raw BLOB NOT NULL,"
-            "   UNIQUE(cmd_id, cmd, raw)"
-            ");"
-        )
+        self.__objects: Dict[T_pool_key, RecvObject] = {}
+        self.__by_cmd: Dict[str, Dict[T_pool_key, RecvObject]] = {}
+        self.__by_cmd_id: Dict[int, Dict[T_pool_key, RecvObject]] = {}
+        self.__by_cmd_id_and_cmd: Dict[Tuple[int, str], Dict[T_pool_key, RecvObject]] = {}
+        self.__buckets: Deque[Tuple[int, List[T_pool_key]]] = deque()
+
+        self.__pending: Dict[Tuple[int, str], List[PendingResponse]] = {}
+
+    @staticmethod
+    def __key(obj: RecvObject) -> T_pool_key:
+        """Returns the unique key of an object in the pool.
+
+        Args:
+            obj (RecvObject): Object to get the key of.
+
+        Returns:
+            T_pool_key: The (cmd_id, cmd, head) tuple identifying this object.
+        """
+
+        return obj.cmd_id, obj.cmd, obj.head
+
+    def __remove(self, key: T_pool_key) -> None:
+        """Removes an object and its index entries from the pool.
+
+        Args:
+            key (T_pool_key): Key of the object to remove.
+        """
+
+        obj = self.__objects.pop(key, None)
+
+        if obj is None:
+            return
+
+        for index, index_key in [(self.__by_cmd, obj.cmd), (self.__by_cmd_id, obj.cmd_id),
+                                 (self.__by_cmd_id_and_cmd, (obj.cmd_id, obj.cmd))]:
+            entries = index[index_key]
+            del entries[key]
+
+            if not entries:
+                del index[index_key]
 
     def __clear_garbage(self) -> None:
         """Deletes entries older than the configured duration.
@@ -44,22 +88,46 @@ class RecvPool:
 
         t = time.time() - self.__clear_garbage_after
 
-        self.__sql.execute("DELETE FROM pool WHERE ts<?;", (t,))
+        while self.__buckets and self.__buckets[0][0] < t:
+            ts, keys = self.__buckets.popleft()
+
+            for key in keys:
+                obj = self.__objects.get(key)
+
+                # The object may have been deleted then inserted again in a newer bucket
+                if obj is not None and obj.timestamp == ts:
+                    self.__remove(key)
 
     def insert_object(self, obj: RecvObject) -> None:
         """Inserts a RecvObject into the pool.
 
+        Objects duplicating one already in the pool (same command ID, command name and first bytes
+        of data, see `RecvObject.head`) are ignored. Coroutines waiting for a response with the same
+        command ID and command name are woken up, even when the object is a duplicate.
+
         Args:
             obj (RecvObject): Object to add to the pool.
         """
 
-        self.__sql.execute(
-            "INSERT OR IGNORE INTO pool (ts, cmd_id, cmd, raw) VALUES (?,?,?,?);",
-            (obj.timestamp, obj.cmd_id, obj.cmd, obj.raw)
-        )
+        key = self.__key(obj)
+
+        if key not in self.__objects:
+            self.__objects[key] = obj
+            self.__by_cmd.setdefault(obj.cmd, {})[key] = obj
+            self.__by_cmd_id.setdefault(obj.cmd_id, {})[key] = obj
+            self.__by_cmd_id_and_cmd.setdefault((obj.cmd_id, obj.cmd), {})[key] = obj
+
+            if self.__buckets and self.__buckets[-1][0] == obj.timestamp:
+                self.__buckets[-1][1].append(key)
+
+            else:
+                self.__buckets.append((obj.timestamp, [key]))
 
         self.__clear_garbage()
 
+        for pending in self.__pending.get((obj.cmd_id, obj.cmd), []):
+            pending.add_response(obj)
+
     def delete_object(self, obj: RecvObject) -> None:
         """Deletes a RecvObject from the pool.
 
@@ -67,10 +135,11 @@ class RecvPool:
             obj (RecvObject): Object to remove from the pool.
         """
 
-        self.__sql.execute(
-            "DELETE FROM pool WHERE ts=? AND cmd_id=? AND cmd=? AND raw=?;",
-            (obj.timestamp, obj.cmd_id, obj.cmd, obj.raw)
-        )
+        key = self.__key(obj)
+        stored = self.__objects.get(key)
+
+        if stored is not None and stored.timestamp == obj.timestamp:
+            self.__remove(key)
 
         self.__clear_garbage()
 
@@ -81,10 +150,24 @@ class RecvPool:
             command_name (str): Command name used to filter objects for deletion.
         """
 
-        self.__sql.execute(
-            "DELETE FROM pool WHERE cmd=?;",
-            (command_name,)
-        )
+        for key in list(self.__by_cmd.get(command_name, {})):
+            self.__remove(key)
+
+        self.__clear_garbage()
+
+    def clear_by_cmd_id(self, cmd_id: int, exclude: Iterable[str] = ()) -> None:
+        """Deletes all objects in the pool matching a command ID.
+
+        Args:
+            cmd_id (int): Command ID used to filter objects for deletion.
+            exclude (Iterable[str], optional): Command names to keep. Defaults to none.
+        """
+
+        exclude = set(exclude)
+
+        for key, obj in list(self.__by_cmd_id.get(cmd_id, {}).items()):
+            if obj.cmd not in exclude:
+                self.__remove(key)
 
         self.__clear_garbage()
 
@@ -100,9 +183,7 @@ class RecvPool:
 
         self.__clear_garbage()
 
-        c = self.__sql.execute("SELECT ts, raw FROM pool WHERE cmd=?;", (cmd,))
-
-        return [RecvObject(ts, raw) for ts, raw in c.fetchall()]
+        return list(self.__by_cmd.get(cmd, {}).values())
 
     def get_object_by_cmd_id(self, cmd_id: int) -> List[RecvObject]:
         """Returns all objects matching a command ID.
@@ -116,9 +197,7 @@ class RecvPool:
 
         self.__clear_garbage()
 
-        c = self.__sql.execute("SELECT ts, raw FROM pool WHERE cmd_id=?;", (cmd_id,))
-
-        return [RecvObject(ts, raw) for ts, raw in c.fetchall()]
+        return list(self.__by_cmd_id.get(cmd_id, {}).values())
 
     def get_object_by_cmd_id_and_cmd(self, cmd_id: int, cmd_name: str) -> List[RecvObject]:
         """Returns all objects matching both a command ID and command name.
@@ -133,79 +212,273 @@ class RecvPool:
 
         self.__clear_garbage()
 
-        c = self.__sql.execute(
-            "SELECT ts, raw FROM pool WHERE cmd=? AND cmd_id=?;",
-            (cmd_name, cmd_id)
-        )
-
-        return [RecvObject(ts, raw) for ts, raw in c.fetchall()]
+        return list(self.__by_cmd_id_and_cmd.get((cmd_id, cmd_name), {}).values())
 
     async def wait_for_responses(self, cmd_id: int, cmd: str, timeout: float = 0.75,
-                                 is_broadcast: bool = False) -> bool:
-        """Waits for at least one response to a command.
+                                 is_broadcast: bool = False, expected: None | Iterable[str] = None,
+                                 grace: float = 0.05) -> bool:
+        """Waits for responses to a command.
+
+        For unicast commands, returns as soon as the first matching packet is inserted
+        or the timeout expires.
+        For broadcast commands, returns once every expected buzzer answered, after a short grace window
+        letting unknown buzzers answer too. Without expected buzzers, waits the full timeout duration.
 
-        Busy-waits until a matching packet is received or the timeout expires.
-        For broadcast commands, waits the full timeout duration.
+        Responses carrying a MAC address (PING, GCLK...) are matched against `expected`.
+        For the other ones (GLED...), the number of responses is compared to the number of expected buzzers.
 
         Args:
             cmd_id (int): Command ID of the issued command.
             cmd (str): Command name of the issued command.
             timeout (float, optional): Maximum time to wait in seconds. Defaults to 0.75.
-            is_broadcast (bool, optional): If True, waits full timeout even if a response is received.
+            is_broadcast (bool, optional): If True, waits for every expected buzzer (or the full timeout)
+                even if a response is received.
+            expected (Iterable[str] | None, optional): MAC addresses (00:11:22:33:44:55) expected to answer
+                a broadcast command. Defaults to None.
+            grace (float, optional): Seconds to keep waiting for unknown buzzers once every expected
+                buzzer answered. Defaults to 0.05.
 
         Returns:
             bool: True if at least one matching packet was received, False if timeout expired.
         """
 
-        query = "SELECT COUNT(cmd_id) FROM pool WHERE cmd_id=? AND cmd=?;"
+        key = (cmd_id, cmd)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-        if is_broadcast:
+        expected_set = {i.upper() for i in expected} if expected is not None else set()
+
+        if is_broadcast and not expected_set:
             await asyncio.sleep(timeout)
 
-        else:
-            t = time.time() + timeout
+            return key in self.__by_cmd_id_and_cmd
+
+        pending = PendingResponse(expected=expected_set if is_broadcast else set())
+
+        for obj in self.__by_cmd_id_and_cmd.get(key, {}).values():
+            pending.add_response(obj)
+
+        self.__pending.setdefault(key, []).append(pending)
+
+        try:
+            while not pending.is_complete() and loop.time() < deadline:
+                pending.future = loop.create_future()
+
+                try:
+                    await asyncio.wait_for(pending.future, timeout=deadline - loop.time())
+
+                except asyncio.TimeoutError:
+                    break
+
+            if is_broadcast and pending.is_complete():
+                await asyncio.sleep(max(0.0, min(grace, deadline - loop.time())))
+
+        finally:
+            self.__pending[key].remove(pending)
+
+            if not self.__pending[key]:
+                del self.__pending[key]
+
+        return key in self.__by_cmd_id_and_cmd
+
+
+@dataclass(eq=False)
+class PendingResponse:
+    """Tracks responses received for a command someone is waiting for.
+
+    Attributes:
+        expected (Set[str]): MAC addresses expected to answer, empty if any response completes the wait.
+        responders (Set[str]): MAC addresses of buzzers which answered.
+        arrivals (int): Number of responses received, duplicates included.
+        future (asyncio.Future | None): Future resolved on the next response.
+    """
+
+    expected: Set[str] = field(default_factory=set)
+    responders: Set[str] = field(default_factory=set)
+    arrivals: int = 0
+    future: None | asyncio.Future = None
+
+    def add_response(self, obj: RecvObject) -> None:
+        """Records a response and wakes up the waiting coroutine.
+
+        Args:
+            obj (RecvObject): The received response.
+        """
+
+        self.arrivals += 1
+
+        mac = obj.mac
 
-            while time.time() < t and self.__sql.execute(query, (cmd_id, cmd)).fetchone()[0] == 0:
-                await asyncio.sleep(0.01)
+        if mac is not None:
+            self.responders.add(mac)
 
-        return self.__sql.execute(query, (cmd_id, cmd)).fetchone()[0] != 0
+        if self.future is not None and not self.future.done():
+            self.future.set_result(None)
+
+    def is_complete(self) -> bool:
+        """Checks if the wait can end.
+
+        Returns:
+            bool: True if every expected buzzer answered (or any buzzer when nothing is expected).
+        """
+
+        if not self.expected:
+            return self.arrivals > 0
+
+        if self.responders:
+            return self.expected <= self.responders
+
+        return self.arrivals >= len(self.expected)
 
 
 @dataclass
 class RecvObject:
     """Represents a received message.
 
+    The received buffer is kept as is, without copy. Only the command ID and command name are
+    parsed on creation, from fixed offsets (byte 0 and bytes 1–4). Other fields are decoded on first
+    access, so packets dropped as duplicates or late replies cost almost nothing.
+
     Attributes:
         timestamp (int): Timestamp when the message was received.
+        received_at (float): Monotonic time when the message was received, in seconds.
         cmd_id (int): Command ID extracted from the raw packet.
         cmd (str): Command name extracted from the raw packet.
         data (List[str]): Strings parsed from the raw packet, following the command name.
-        raw (bytes): The original raw packet.
+        raw (bytes): The original raw packet, trailing null bytes excluded.
+        head (bytes): First bytes following the command name, identifying the sender of a response.
+        mac (str | None): MAC address of the sender, for responses starting with it (PING, GCLK, BPRS).
+        clock (int | None): Clock value of the sender, for responses carrying it (GCLK, BPRS).
+        __buffer (bytes | bytearray): The received packet, possibly followed by null bytes.
+        __end (int): Length of the packet without its trailing null bytes.
+        __raw (bytes | None): Cached `raw` value.
+        __data (List[str] | None): Cached `data` value.
     """
 
+    __slots__ = ("timestamp", "received_at", "cmd_id", "cmd", "__buffer", "__end", "__raw", "__data")
+
+    # Space and MAC address (00:11:22:33:44:55) following the command name
+    HEAD_SIZE = 18
+
     timestamp: int  # The timestamp when the message got received
+    received_at: float  # The monotonic time when the message got received
 
     cmd_id: int  # The command ID
     cmd: str  # The command
-    data: List[str]  # All data from a command
-
-    raw: bytes  # The raw message
 
-    def __init__(self, timestamp: int, raw: bytes) -> None:
+    def __init__(self, timestamp: int, raw: bytes | bytearray, received_at: None | float = None) -> None:
         """Initializes a RecvObject instance.
 
-        Parses the raw packet to populate cmd_id, cmd, and data.
+        Parses cmd_id and cmd from the raw packet, other fields are parsed when accessed.
 
         Args:
             timestamp (int): Timestamp when the packet was received.
-            raw (bytes): Raw bytes of the received packet.
+            raw (bytes | bytearray): Raw bytes of the received packet, possibly followed by null bytes.
+                It must not be modified afterward, as it is not copied.
+            received_at (float | None, optional): Monotonic time when the packet was received, in seconds.
+                Defaults to now.
         """
 
+        # The payload is a C string, so it ends at the first null byte (the ID byte may be 0)
+        end = raw.find(0, 1)
+
         self.timestamp = timestamp
-        self.cmd_id = int(raw[0])
-        self.cmd = raw.split(b" ")[0][1:].decode(errors="ignore")
-        self.data = raw.decode(errors="ignore").split(" ")[1:]
-        self.raw = raw
+        self.received_at = time.monotonic() if received_at is None else received_at
+        self.cmd_id = raw[0]
+        # Command names are always 4 characters, as the firmware dispatches on them
+        self.cmd = str(raw[1:5], "ascii", "ignore") if end == -1 or end >= 5 else str(raw[1:end], "ascii", "ignore")
+
+        self.__buffer: bytes | bytearray = raw
+        self.__end: int = len(raw) if end == -1 else end
+        self.__raw: None | bytes = None
+        self.__data: None | List[str] = None
+
+    @property
+    def raw(self) -> bytes:
+        """Returns the raw packet, trailing null bytes excluded.
+
+        Returns:
+            bytes: The raw packet.
+        """
+
+        if self.__raw is None:
+            self.__raw = bytes(self.__buffer[:self.__end])
+
+        return self.__raw
+
+    @property
+    def head(self) -> bytes:
+        """Returns the first bytes following the command name, enough to tell duplicates apart.
+
+        Responses carrying their sender MAC address start with it, so the sender is identified without
+        copying nor decoding the whole packet.
+
+        Returns:
+            bytes: Up to `HEAD_SIZE` bytes following the command name, trailing null bytes excluded.
+        """
+
+        return bytes(self.__buffer[5:min(self.__end, 5 + self.HEAD_SIZE)])
+
+    @property
+    def data(self) -> List[str]:
+        """Returns the strings following the command name.
+
+        Returns:
+            List[str]: Space separated strings of the packet, command name excluded.
+        """
+
+        if self.__data is None:
+            # The ID byte is skipped before splitting, as it may be a space (ID 32)
+            self.__data = str(self.__buffer[1:self.__end], "utf-8", "ignore").split(" ")[1:]
+
+        return self.__data
+
+    @staticmethod
+    def is_mac(value: str) -> bool:
+        """Checks if a string looks like a MAC address (00:11:22:33:44:55).
+
+        Args:
+            value (str): String to check.
+
+        Returns:
+            bool: True if `value` is formatted like a MAC address.
+        """
+
+        return len(value) == 17 and value.count(":") == 5
+
+    @property
+    def mac(self) -> None | str:
+        """Returns the MAC address of the sender, for responses starting with it.
+
+        Returns:
+            str | None: MAC address formatted as 00:11:22:33:44:55, None if the packet does not carry it.
+        """
+
+        data = self.data
+
+        if data and self.is_mac(data[0]):
+            return data[0].upper()
+
+        return None
+
+    @property
+    def clock(self) -> None | int:
+        """Returns the clock value of the sender, for responses carrying it after the MAC address.
+
+        Returns:
+            int | None: Clock value, None if the packet does not carry it.
+        """
+
+        data = self.data
+
+        if len(data) < 2 or self.mac is None:
+            return None
+
+        try:
+            return int(data[1])
+
+        except ValueError:
+            return None
 
     def __str__(self) -> str:
         """Returns a human-readable string of the object.
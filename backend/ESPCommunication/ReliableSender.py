@@ -0,0 +1,324 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+# State of a buzzer each command sets, only the newest command of a state is retransmitted
+COMMAND_SLOTS: Dict[bytes, str] = {
+    b"SLED": "led",
+    b"CLED": "led",
+    b"RCLK": "clock",
+    b"SCLK": "clock"
+}
+
+
+@dataclass
+class Delivery:
+    """A reliable command and the buzzers which did not acknowledge it yet.
+
+    Attributes:
+        sequence (int): Order of the command among reliable commands, the newest one has the highest.
+        command (bytes): Wrapped command (SLED, CLED, RCLK, SCLK).
+        args (bytes): Arguments of the command.
+        slot (str): State of the buzzer the command sets (see `COMMAND_SLOTS`).
+        pending (Set[str]): MAC addresses (00:11:22:33:44:55) which did not acknowledge the command yet.
+        attempts (int): Number of times the command was sent.
+    """
+
+    sequence: int
+    command: bytes
+    args: bytes
+    slot: str
+    pending: Set[str] = field(default_factory=set)
+    attempts: int = 1
+
+
+class ReliableSender:
+    """Sends commands expecting no response (SLED, CLED, RCLK, SCLK) with acknowledgement and retransmission.
+
+    Commands are wrapped in a `RELY` command: buzzers answer `RACK` with the same command ID before running
+    them. Buzzers which did not acknowledge a command within their timeout (see `RttEstimator`) get it
+    again, alone, as each timeout doubles their next one. A command is only sent again to a buzzer while
+    it is the newest one setting the same state (LEDs or clock) of this buzzer, so a frame replaced by
+    another one is never retransmitted.
+
+    Reliable delivery needs a firmware answering `RELY`, it is opt-in (`enabled`, or `reliable` argument
+    of `Commands`).
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+        enabled (bool): Whether `Commands` sends commands reliably by default.
+        max_retries (int): Retransmissions per buzzer before giving up.
+        stats (Dict[str, int]): Delivery metrics:
+            - sent: Number of reliable commands sent.
+            - retransmits: Number of commands sent again to a buzzer.
+            - acked: Number of acknowledgements received from expected buzzers.
+            - superseded: Number of retransmissions skipped, a newer command setting the same state.
+            - given_up: Number of buzzers which never acknowledged a command.
+        __sequence (int): Sequence of the last command sent.
+        __latest (Dict[Tuple[str, str], int]): Sequence of the newest command per (MAC address, slot).
+        __tasks (Set[asyncio.Task]): Acknowledgement tracking in progress.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, enabled: bool = False, max_retries: int = 4) -> None:
+        """Initializes a ReliableSender instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance used to send commands.
+            enabled (bool, optional): Whether `Commands` sends commands reliably by default. Defaults to False.
+            max_retries (int, optional): Retransmissions per buzzer before giving up. Defaults to 4.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.enabled: bool = enabled
+        self.max_retries: int = max_retries
+
+        self.stats: Dict[str, int] = {"sent": 0, "retransmits": 0, "acked": 0, "superseded": 0, "given_up": 0}
+
+        self.__sequence: int = 0
+        self.__latest: Dict[Tuple[str, str], int] = {}
+        self.__tasks: Set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """int: Number of command batches still waiting for acknowledgements."""
+
+        return len(self.__tasks)
+
+    async def send(self, command: bytes | str, args: bytes | str = b"",
+                   target_mac: None | bytes | str = None) -> asyncio.Task:
+        """Sends a command reliably.
+
+        Args:
+            command (bytes | str): Command to send (SLED, CLED, RCLK, SCLK).
+            args (bytes | str, optional): Arguments of the command. Defaults to empty bytes.
+            target_mac (bytes | str | None, optional): MAC address to target. Defaults to broadcast.
+
+        Raises:
+            ValueError: If the command is not one of the supported commands.
+
+        Returns:
+            asyncio.Task: Task tracking acknowledgements, see `send_many`.
+        """
+
+        return await self.send_many([(command, args, target_mac)])
+
+    async def send_many(self, commands: List[Tuple[bytes | str, bytes | str, None | bytes | str]]) -> asyncio.Task:
+        """Sends several commands reliably at once.
+
+        Returns once the commands are written to the gateway, acknowledgements are tracked in background.
+        A broadcast command expects an acknowledgement from every buzzer of the connected cache.
+
+        Args:
+            commands (List[Tuple[bytes | str, bytes | str, bytes | str | None]]): Commands to send, as
+                (command, arguments, target MAC address).
+
+        Raises:
+            ValueError: If a command is not one of the supported commands.
+
+        Returns:
+            asyncio.Task: Task tracking acknowledgements and retransmissions. Its result is the set of MAC
+            addresses which never acknowledged their command (newer commands aside).
+        """
+
+        deliveries = []
+
+        for command, args, mac in commands:
+            command = command.encode() if isinstance(command, str) else command
+            args = args.encode() if isinstance(args, str) else args
+
+            if command not in COMMAND_SLOTS:
+                raise ValueError(f"Command {command!r} can't be sent reliably")
+
+            self.__sequence += 1
+
+            delivery = Delivery(self.__sequence, command, args, COMMAND_SLOTS[command])
+
+            if self.bt_comm.is_broadcast(mac):
+                delivery.pending = set(self.bt_comm.connected_cache.connected)
+
+            else:
+                delivery.pending = {self.bt_comm.mac_to_str(mac).upper()}
+
+            for i in delivery.pending:
+                self.__latest[(i, delivery.slot)] = delivery.sequence
+
+            deliveries.append((delivery, mac))
+
+        cmd_ids = await self.bt_comm.send_commands(
+            [(b"RELY " + delivery.command, delivery.args, mac) for delivery, mac in deliveries],
+            track=True
+        )
+        sent = time.monotonic()
+
+        self.stats["sent"] += len(deliveries)
+
+        in_flight = [(delivery, set(delivery.pending), cmd_id, self.bt_comm.is_broadcast(mac))
+                     for (delivery, mac), cmd_id in zip(deliveries, cmd_ids)]
+
+        task = asyncio.create_task(self.__track(in_flight, sent))
+
+        self.__tasks.add(task)
+        task.add_done_callback(self.__on_track_done)
+
+        return task
+
+    def __on_track_done(self, task: asyncio.Task) -> None:
+        """Logs a failed acknowledgement tracking, even when nobody awaits it.
+
+        Args:
+            task (asyncio.Task): Task of the tracking.
+        """
+
+        self.__tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Reliable delivery failed: {task.exception()}")
+
+    def __is_latest(self, delivery: Delivery, mac: str) -> bool:
+        """Checks if a command is the newest one setting its state on a buzzer.
+
+        Args:
+            delivery (Delivery): The command.
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+
+        Returns:
+            bool: True if no newer command setting the same state was sent to this buzzer.
+        """
+
+        return self.__latest.get((mac, delivery.slot)) == delivery.sequence
+
+    async def __wait_acks(self, delivery: Delivery, targets: Set[str], cmd_id: int, broadcast: bool,
+                          sent: float) -> None:
+        """Waits for the acknowledgements of a command sent once, and records them.
+
+        Args:
+            delivery (Delivery): The command.
+            targets (Set[str]): MAC addresses expected to acknowledge this sending.
+            cmd_id (int): ID the command was sent with.
+            broadcast (bool): Whether it was sent to every buzzer.
+            sent (float): Monotonic time the command was written to the gateway.
+        """
+
+        rtt = self.bt_comm.rtt_estimator
+        targets = set(targets)
+        answered = False
+
+        try:
+            await self.bt_comm.recv_pool.wait_for_responses(
+                cmd_id,
+                "RACK",
+                timeout=rtt.max_timeout_of(targets),
+                is_broadcast=broadcast,
+                expected=targets
+            )
+
+            responses = self.bt_comm.recv_pool.get_object_by_cmd_id_and_cmd(cmd_id, "RACK")
+
+            # Any buzzer may still acknowledge a broadcast late
+            answered = not broadcast and len(responses) > 0
+
+        finally:
+            self.bt_comm.cmd_ids.release(cmd_id, answered=answered)
+
+        for i in responses:
+            mac = i.mac
+
+            if mac in targets:
+                targets.discard(mac)
+                delivery.pending.discard(mac)
+
+                rtt.sample(mac, i.received_at - sent)
+                self.stats["acked"] += 1
+
+        for i in targets:
+            rtt.timed_out(i)
+
+    async def __track(self, in_flight: List[Tuple[Delivery, Set[str], int, bool]], sent: float) -> Set[str]:
+        """Waits for acknowledgements, and sends commands again to the buzzers which did not acknowledge them.
+
+        Args:
+            in_flight (List[Tuple[Delivery, Set[str], int, bool]]): Commands sent, with the buzzers expected
+                to acknowledge them, their ID and whether they were broadcast.
+            sent (float): Monotonic time the commands were written to the gateway.
+
+        Returns:
+            Set[str]: MAC addresses which never acknowledged their command.
+        """
+
+        deliveries = [i[0] for i in in_flight]
+        given_up = set()
+
+        while True:
+            await asyncio.gather(*[self.__wait_acks(delivery, targets, cmd_id, broadcast, sent)
+                                   for delivery, targets, cmd_id, broadcast in in_flight])
+
+            retries = []
+
+            for delivery in deliveries:
+                for mac in sorted(delivery.pending):
+                    if not self.__is_latest(delivery, mac):
+                        delivery.pending.discard(mac)
+                        self.stats["superseded"] += 1
+
+                    elif delivery.attempts > self.max_retries:
+                        delivery.pending.discard(mac)
+                        given_up.add(mac)
+                        self.__give_up(delivery, mac)
+
+                    else:
+                        retries.append((delivery, mac))
+
+            if not retries:
+                return given_up
+
+            # Only the buzzers which did not acknowledge get the command again, each one alone
+            cmd_ids = await self.bt_comm.send_commands(
+                [(b"RELY " + delivery.command, delivery.args, mac) for delivery, mac in retries],
+                track=True
+            )
+            sent = time.monotonic()
+
+            for delivery in {i.sequence: i for i, _ in retries}.values():
+                delivery.attempts += 1
+
+            self.stats["retransmits"] += len(retries)
+
+            in_flight = [(delivery, {mac}, cmd_id, False) for (delivery, mac), cmd_id in zip(retries, cmd_ids)]
+
+    def __give_up(self, delivery: Delivery, mac: str) -> None:
+        """Stops sending a command to a buzzer which never acknowledged it.
+
+        Args:
+            delivery (Delivery): The command.
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+        """
+
+        self.stats["given_up"] += 1
+
+        logger.warning(f"Buzzer {mac} did not acknowledge {delivery.command.decode()} "
+                       f"after {delivery.attempts} attempts")
+
+        if delivery.slot == "led":
+            # The buzzer may show anything, the next frame must be sent whatever the shadow says
+            self.bt_comm.led_shadow.invalidate(mac)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns delivery metrics.
+
+        Returns:
+            Dict[str, int]: `stats`, with the number of command batches still waiting for acknowledgements.
+        """
+
+        return {**self.stats, "in_flight": self.in_flight}
@@ -0,0 +1,188 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Any, Iterable
+
+import numpy as np
+
+
+@dataclass
+class RttState:
+    """Round trip time estimate of a buzzer.
+
+    Attributes:
+        srtt (float): Smoothed round trip time, in seconds.
+        rttvar (float): Round trip time variation, in seconds.
+        backoff (int): Number of timeouts since the last sample, each one doubling the timeout.
+        samples (Deque[float]): Last round trip times measured, in seconds.
+    """
+
+    srtt: float
+    rttvar: float
+    backoff: int = 0
+    samples: Deque[float] = field(default_factory=deque)
+
+
+class RttEstimator:
+    """Estimates the round trip time of every buzzer, to wait for its responses just as long as needed.
+
+    Every response to a tracked command (PING, GCLK, GLED...) gives a sample: the time between the
+    command written to the gateway and the response received. Samples are smoothed per MAC address the
+    way TCP does (RFC 6298): `srtt` follows the mean and `rttvar` the mean deviation, and the timeout is
+    `srtt + 4 * rttvar`. Command IDs are never reused while in flight, so no sample is ambiguous.
+
+    Each timeout without response doubles the timeout of the buzzer until its next sample, so a link
+    getting slower is not given up on. Buzzers without any sample use `initial_timeout`.
+
+    Attributes:
+        history (int): Number of samples kept per buzzer, for percentiles.
+        initial_timeout (float): Timeout of a buzzer without any sample, in seconds.
+        min_timeout (float): Lowest timeout, in seconds.
+        max_timeout (float): Highest timeout, backoff included, in seconds.
+        granularity (float): Lowest variation term of the timeout, in seconds.
+        stats (Dict[str, int]): Estimation metrics:
+            - samples: Number of round trip times measured.
+            - timeouts: Number of buzzers which did not answer in time.
+        __states (Dict[str, RttState]): Estimate per MAC address (00:11:22:33:44:55).
+    """
+
+    ALPHA: float = 1 / 8
+    BETA: float = 1 / 4
+    K: float = 4.0
+
+    def __init__(self, history: int = 128, initial_timeout: float = 0.75, min_timeout: float = 0.05,
+                 max_timeout: float = 3.0, granularity: float = 0.005) -> None:
+        """Initializes a RttEstimator instance.
+
+        Args:
+            history (int, optional): Number of samples kept per buzzer. Defaults to 128.
+            initial_timeout (float, optional): Timeout of a buzzer without any sample, in seconds. Defaults to 0.75.
+            min_timeout (float, optional): Lowest timeout, in seconds. Defaults to 0.05.
+            max_timeout (float, optional): Highest timeout, in seconds. Defaults to 3.
+            granularity (float, optional): Lowest variation term of the timeout, in seconds. Defaults to 0.005.
+        """
+
+        self.history: int = history
+        self.initial_timeout: float = initial_timeout
+        self.min_timeout: float = min_timeout
+        self.max_timeout: float = max_timeout
+        self.granularity: float = granularity
+
+        self.stats: Dict[str, int] = {"samples": 0, "timeouts": 0}
+
+        self.__states: Dict[str, RttState] = {}
+
+    def sample(self, mac: str, rtt: float) -> None:
+        """Records a round trip time.
+
+        Args:
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+            rtt (float): Time between the command written and the response received, in seconds.
+        """
+
+        rtt = max(0.0, rtt)
+        state = self.__states.get(mac.upper())
+
+        if state is None:
+            state = self.__states[mac.upper()] = RttState(rtt, rtt / 2, samples=deque(maxlen=self.history))
+
+        else:
+            state.rttvar += self.BETA * (abs(state.srtt - rtt) - state.rttvar)
+            state.srtt += self.ALPHA * (rtt - state.srtt)
+            state.backoff = 0
+
+        state.samples.append(rtt)
+        self.stats["samples"] += 1
+
+    def timed_out(self, mac: str) -> None:
+        """Records a buzzer which did not answer in time, doubling its timeout until its next sample.
+
+        Args:
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+        """
+
+        state = self.__states.get(mac.upper())
+
+        if state is not None and self.__timeout(state) < self.max_timeout:
+            state.backoff += 1
+
+        self.stats["timeouts"] += 1
+
+    def forget(self, mac: str) -> None:
+        """Forgets the estimate of a buzzer, e.g. after it left.
+
+        Args:
+            mac (str): MAC address of the buzzer (00:11:22:33:44:55).
+        """
+
+        self.__states.pop(mac.upper(), None)
+
+    def __timeout(self, state: RttState) -> float:
+        """Computes the timeout of an estimate.
+
+        Args:
+            state (RttState): Estimate of the buzzer.
+
+        Returns:
+            float: Timeout in seconds, within `min_timeout` and `max_timeout`.
+        """
+
+        rto = (state.srtt + max(self.granularity, self.K * state.rttvar)) * 2 ** state.backoff
+
+        return min(self.max_timeout, max(self.min_timeout, rto))
+
+    def timeout(self, mac: None | str = None) -> float:
+        """Returns how long to wait for the response of a buzzer.
+
+        Args:
+            mac (str | None, optional): MAC address of the buzzer (00:11:22:33:44:55). Defaults to None
+                (`initial_timeout`).
+
+        Returns:
+            float: Timeout in seconds.
+        """
+
+        state = self.__states.get(mac.upper()) if mac is not None else None
+
+        return self.initial_timeout if state is None else self.__timeout(state)
+
+    def max_timeout_of(self, macs: Iterable[str]) -> float:
+        """Returns how long to wait for the responses of several buzzers.
+
+        Args:
+            macs (Iterable[str]): MAC addresses of the buzzers (00:11:22:33:44:55).
+
+        Returns:
+            float: Highest timeout of these buzzers in seconds, `initial_timeout` if there are none.
+        """
+
+        return max((self.timeout(i) for i in macs), default=self.initial_timeout)
+
+    def get_estimates(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the round trip times of every buzzer.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per MAC address: smoothed round trip time, variation, current
+            timeout and 50th, 90th and 99th percentiles of the last samples (ms), and number of samples.
+        """
+
+        estimates = {}
+
+        for mac, i in self.__states.items():
+            p50, p90, p99 = np.percentile(np.array(i.samples) * 1000, [50, 90, 99])
+
+            estimates[mac] = {
+                "srtt_ms": i.srtt * 1000,
+                "rttvar_ms": i.rttvar * 1000,
+                "timeout_ms": self.__timeout(i) * 1000,
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "samples": len(i.samples)
+            }
+
+        return estimates
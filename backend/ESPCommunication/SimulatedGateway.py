@@ -0,0 +1,534 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, List, Any
+
+logger = logging.getLogger(__name__)
+
+INT64_MAX: int = 9223372036854775807
+BROADCAST_MAC: bytes = b"\xFF\xFF\xFF\xFF\xFF\xFF"
+NULL_MAC: bytes = b"\x00\x00\x00\x00\x00\x00"
+
+# Same values as firmware (ble.cpp, cmd-clock.cpp and button-interrupt.cpp)
+BATCH_MAX_SIZE: int = 514
+AUTO_SET_CLK_NB: int = 10
+AUTO_SET_CLK_DELAY: float = 0.010
+INTERRUPT_PCK_SEND: int = 2
+INTERRUPT_PCK_DELAY: float = 0.002
+
+
+class VirtualBuzzer:
+    """Represents a single simulated buzzer running the ESP firmware.
+
+    Attributes:
+        mac (bytes): MAC address of this buzzer (6 bytes).
+        mac_str (str): MAC address formatted as 00:11:22:33:44:55.
+        is_master (bool): Whether this buzzer is the gateway (connected through BLE).
+        led_nb (int): Number of LEDs installed on this buzzer.
+        leds (bytes): Last LED frame displayed, 3 bytes per LED.
+        drift_ppm (float): Drift of the internal oscillator, in parts per million.
+        press_id (int): Firmware press counter (0–255), used as command ID for BPRS.
+        powered (bool): Whether the buzzer is switched on. A switched off buzzer ignores every packet.
+        link_latency (float): One way ESP-NOW latency added to the packets of this buzzer (distance,
+            obstacles), in seconds.
+        link_jitter (float): Maximum random delay added to the packets of this buzzer, in seconds.
+        __boot (float): Monotonic time when this buzzer "booted".
+        __clock_offset (int): Internal clock offset, INT64_MAX when not set.
+    """
+
+    def __init__(self, mac: bytes, is_master: bool, led_nb: int, drift_ppm: float, uptime: float) -> None:
+        """Initializes a VirtualBuzzer instance.
+
+        Args:
+            mac (bytes): MAC address of this buzzer (6 bytes).
+            is_master (bool): Whether this buzzer is the gateway.
+            led_nb (int): Number of LEDs installed on this buzzer.
+            drift_ppm (float): Drift of the internal oscillator, in parts per million.
+            uptime (float): Seconds elapsed since this buzzer booted.
+        """
+
+        self.mac: bytes = mac
+        self.mac_str: str = ":".join([f"{i:02X}" for i in mac])
+        self.is_master: bool = is_master
+        self.led_nb: int = led_nb
+        self.leds: bytes = bytes(3 * led_nb)
+        self.drift_ppm: float = drift_ppm
+        self.press_id: int = 0
+        self.powered: bool = True
+        self.link_latency: float = 0.0
+        self.link_jitter: float = 0.0
+
+        self.__boot: float = time.monotonic() - uptime
+        self.__clock_offset: int = INT64_MAX
+
+        self.reset_clock()
+
+    def millis(self) -> int:
+        """Returns the value of the simulated `millis()` Arduino function.
+
+        Returns:
+            int: Milliseconds elapsed since boot, affected by oscillator drift.
+        """
+
+        return int((time.monotonic() - self.__boot) * 1000 * (1 + self.drift_ppm * 1e-6))
+
+    def get_clock(self) -> int:
+        """Returns the internal clock, as `get_clock()` does in firmware.
+
+        Returns:
+            int: Internal clock value, INT64_MAX if not set.
+        """
+
+        if self.__clock_offset == INT64_MAX:
+            return INT64_MAX
+
+        return self.millis() - self.__clock_offset
+
+    def reset_clock(self) -> None:
+        """Resets the internal clock (0 for master, INT64_MAX for others)."""
+
+        if self.is_master:
+            self.__clock_offset = self.millis()
+
+        else:
+            self.__clock_offset = INT64_MAX
+
+    def set_clock(self, s_clock: int) -> None:
+        """Sets the internal clock if `s_clock` is less than the actual clock.
+
+        Args:
+            s_clock (int): Clock value to synchronize to.
+        """
+
+        actual_millis = self.millis()
+
+        if self.__clock_offset == INT64_MAX or s_clock < actual_millis - self.__clock_offset:
+            self.__clock_offset = actual_millis - s_clock
+
+
+class SimulatedGateway:
+    """In-process simulated gateway buzzer, usable as a drop-in for `BleakClient`.
+
+    Parses the same PDU as the firmware (6 bytes MAC + 1 byte ID + command) and answers
+    PING, GCLK, GLED, ACLK and BPRS like real buzzers would. Other buzzers are reached
+    through a simulated ESP-NOW network with configurable latency, jitter and loss.
+
+    Only the subset of the `BleakClient` interface used by `BluetoothCommunication`
+    is implemented.
+
+    Attributes:
+        buzzers (List[VirtualBuzzer]): Simulated buzzers, the first one being the gateway.
+        esp_now_latency (float): Base one way ESP-NOW latency, in seconds.
+        esp_now_jitter (float): Maximum random delay added to each ESP-NOW packet, in seconds.
+        esp_now_loss (float): Probability (0–1) for an ESP-NOW packet to be lost.
+        ble_latency (float): One way BLE latency between the computer and the gateway, in seconds.
+        mtu_size (int): Negotiated BLE MTU.
+        batch_support (bool): Whether the simulated firmware unpacks batch frames (MCMD).
+        address (str): BLE address of the gateway (its MAC address).
+        reachable (bool): Whether the gateway is within BLE range, connections fail otherwise.
+        stats (Dict[str, int]): Counters of written packets, notifications and ESP-NOW packets.
+        __by_mac (Dict[bytes, VirtualBuzzer]): Simulated buzzers indexed by MAC address.
+        __random (random.Random): Random generator used for jitter and loss.
+        __notify_callback (Callable | None): Notification handler registered through `start_notify`.
+        __disconnected_callback (Callable | None): Callback invoked on simulated disconnection.
+        __connected (bool): Whether the simulated BLE link is up.
+    """
+
+    def __init__(self, buzzer_nb: int = 4, led_nb: int = 20, esp_now_latency: float = 0.005,
+                 esp_now_jitter: float = 0.002, esp_now_loss: float = 0.0, ble_latency: float = 0.002,
+                 drift_ppm: float = 0.0, seed: None | int = None, batch_support: bool = True,
+                 disconnected_callback: None | Callable[[SimulatedGateway], None] = None) -> None:
+        """Initializes a SimulatedGateway instance.
+
+        Args:
+            buzzer_nb (int, optional): Number of simulated buzzers, gateway included. Defaults to 4.
+            led_nb (int, optional): Number of LEDs on each buzzer. Defaults to 20.
+            esp_now_latency (float, optional): Base one way ESP-NOW latency in seconds. Defaults to 0.005.
+            esp_now_jitter (float, optional): Maximum random jitter in seconds. Defaults to 0.002.
+            esp_now_loss (float, optional): ESP-NOW packet loss probability (0–1). Defaults to 0.
+            ble_latency (float, optional): One way BLE latency in seconds. Defaults to 0.002.
+            drift_ppm (float, optional): Maximum oscillator drift of a buzzer, in ppm. Each buzzer
+                gets a random drift in [-drift_ppm, drift_ppm]. Defaults to 0.
+            seed (int | None, optional): Seed of the random generator, for reproducible runs.
+            batch_support (bool, optional): Whether the simulated firmware unpacks batch frames (MCMD).
+                Set it to False to simulate an older firmware. Defaults to True.
+            disconnected_callback (Callable | None, optional): Called when the link is dropped.
+
+        Raises:
+            AssertionError: If `buzzer_nb` is less than 1 or `esp_now_loss` is outside 0–1.
+        """
+
+        assert buzzer_nb >= 1, "At least one buzzer (the gateway) must be simulated"
+        assert 0 <= esp_now_loss <= 1, "Loss must be a probability in the range 0 - 1"
+
+        self.esp_now_latency: float = esp_now_latency
+        self.esp_now_jitter: float = esp_now_jitter
+        self.esp_now_loss: float = esp_now_loss
+        self.ble_latency: float = ble_latency
+
+        self.mtu_size: int = 517
+        self.batch_support: bool = batch_support
+
+        self.stats: Dict[str, int] = {"writes": 0, "notifications": 0, "esp_now_sent": 0, "esp_now_lost": 0}
+
+        self.__random: random.Random = random.Random(seed)
+        self.__notify_callback: None | Callable[[Any, bytearray], Any] = None
+        self.__disconnected_callback: None | Callable[[SimulatedGateway], None] = disconnected_callback
+        self.__connected: bool = False
+
+        self.buzzers: List[VirtualBuzzer] = []
+
+        for i in range(buzzer_nb):
+            mac = bytes([0x5A, 0x1B, 0x00, 0x00, i >> 8, i & 0xFF])
+            drift = self.__random.uniform(-drift_ppm, drift_ppm)
+
+            self.buzzers.append(VirtualBuzzer(mac, i == 0, led_nb, drift, self.__random.uniform(1, 10)))
+
+        self.__by_mac: Dict[bytes, VirtualBuzzer] = {i.mac: i for i in self.buzzers}
+
+        self.address: str = self.gateway.mac_str
+        self.reachable: bool = True
+
+    @property
+    def gateway(self) -> VirtualBuzzer:
+        """Returns the simulated gateway (master) buzzer.
+
+        Returns:
+            VirtualBuzzer: The master buzzer.
+        """
+
+        return self.buzzers[0]
+
+    @property
+    def is_connected(self) -> bool:
+        """Returns whether the simulated BLE link is up.
+
+        Returns:
+            bool: True if connected, False otherwise.
+        """
+
+        return self.__connected
+
+    def set_disconnected_callback(self, callback: None | Callable[[SimulatedGateway], None]) -> None:
+        """Sets the callback invoked on simulated disconnection.
+
+        Args:
+            callback (Callable | None): Callback taking this gateway as single argument.
+        """
+
+        self.__disconnected_callback = callback
+
+    async def connect(self, **kwargs: Any) -> None:
+        """Simulates a BLE connection to the gateway.
+
+        Args:
+            **kwargs (Any): Ignored, accepted for compatibility with `BleakClient.connect`.
+
+        Raises:
+            OSError: If the gateway is not reachable.
+        """
+
+        await asyncio.sleep(self.ble_latency)
+
+        if not self.reachable:
+            raise OSError("Simulated gateway is out of reach")
+
+        self.__connected = True
+
+    async def disconnect(self) -> None:
+        """Simulates a clean disconnection from the gateway."""
+
+        self.simulate_disconnect()
+
+    def simulate_disconnect(self) -> None:
+        """Drops the simulated BLE link, as a radio loss would.
+
+        The gateway broadcasts a CLED to every buzzer, like the firmware does in `onDisconnect`.
+        """
+
+        if not self.__connected:
+            return
+
+        self.__connected = False
+        self.__notify_callback = None
+
+        for i in self.buzzers:
+            i.leds = bytes(3 * i.led_nb)
+
+        if self.__disconnected_callback is not None:
+            self.__disconnected_callback(self)
+
+    async def start_notify(self, char_specifier: Any, callback: Callable[[Any, bytearray], Any], **kwargs: Any) -> None:
+        """Registers the notification handler, as `BleakClient.start_notify` does.
+
+        Args:
+            char_specifier (Any): Characteristic to notify on (ignored, only one exists).
+            callback (Callable): Handler called with (sender, data) for each notification.
+            **kwargs (Any): Ignored, accepted for compatibility.
+
+        Raises:
+            OSError: If the simulated link is not connected.
+        """
+
+        if not self.__connected:
+            raise OSError("Simulated gateway is not connected")
+
+        self.__notify_callback = callback
+
+    async def write_gatt_char(self, char_specifier: Any, data: bytes | bytearray | memoryview,
+                              response: None | bool = None) -> None:
+        """Writes a packet to the simulated gateway, as `BleakClient.write_gatt_char` does.
+
+        Args:
+            char_specifier (Any): Characteristic to write to (ignored, only one exists).
+            data (bytes | bytearray | memoryview): Raw packet (MAC + ID + command).
+            response (bool | None, optional): Ignored, writes are always without response.
+
+        Raises:
+            OSError: If the simulated link is not connected.
+        """
+
+        if not self.__connected:
+            raise OSError("Simulated gateway is not connected")
+
+        self.stats["writes"] += 1
+
+        asyncio.get_running_loop().call_later(self.ble_latency, self.__on_write, bytes(data))
+
+    def press(self, mac: bytes | str) -> None:
+        """Simulates a button press on a buzzer.
+
+        The buzzer sends `INTERRUPT_PCK_SEND` identical BPRS packets, like the firmware does.
+
+        Args:
+            mac (bytes | str): MAC address of the pressed buzzer.
+
+        Raises:
+            KeyError: If no simulated buzzer has this MAC address.
+        """
+
+        if isinstance(mac, str):
+            mac = bytes([int(i, 16) for i in mac.split(":")])
+
+        buzzer = self.__by_mac[mac]
+
+        data = f"BPRS {buzzer.mac_str} {buzzer.get_clock()}".encode()
+        cmd_id = buzzer.press_id
+        buzzer.press_id = (buzzer.press_id + 1) % 256
+
+        loop = asyncio.get_running_loop()
+
+        for i in range(INTERRUPT_PCK_SEND):
+            loop.call_later(i * INTERRUPT_PCK_DELAY, self.__respond, buzzer, cmd_id, data)
+
+    def __on_write(self, value: bytes) -> None:
+        """Handles a packet written to the gateway characteristic (`onWrite` in ble.cpp).
+
+        Args:
+            value (bytes): Raw packet written by the computer.
+        """
+
+        if len(value) < 7:
+            return
+
+        target, cmd_id = value[:6], value[6]
+
+        if self.batch_support and target == NULL_MAC and value[7:11] == b"MCMD":
+            self.__on_batch(value[11:BATCH_MAX_SIZE])
+            return
+
+        self.__route(target, cmd_id, value[7:247].rstrip(b"\x00"))
+
+    def __on_batch(self, records: bytes) -> None:
+        """Unpacks a batch frame (`multi_commands_handler` in firmware).
+
+        Args:
+            records (bytes): Records of the frame: data length (1 byte), target MAC (6 bytes), command ID
+                (1 byte) and data. Unpacking stops at the first truncated or invalid record.
+        """
+
+        i = 0
+
+        while i + 8 <= len(records):
+            length = records[i]
+
+            if length >= 240 or i + 8 + length > len(records):
+                break
+
+            self.__route(records[i + 1:i + 7], records[i + 7], records[i + 8:i + 8 + length].rstrip(b"\x00"))
+
+            i += 8 + length
+
+    def __route(self, target: bytes, cmd_id: int, data: bytes) -> None:
+        """Routes a command to its target buzzer(s) (`ble_route_message` in firmware).
+
+        Args:
+            target (bytes): Target MAC address.
+            cmd_id (int): Command ID.
+            data (bytes): Command and its arguments.
+        """
+
+        if target == self.gateway.mac:
+            self.__handle(self.gateway, cmd_id, data)
+
+        elif target == BROADCAST_MAC:
+            for i in self.buzzers[1:]:
+                self.__esp_now_send(self.__handle, i, cmd_id, data)
+
+            self.__handle(self.gateway, cmd_id, data)
+
+        elif target in self.__by_mac:
+            self.__esp_now_send(self.__handle, self.__by_mac[target], cmd_id, data)
+
+    def __handle(self, buzzer: VirtualBuzzer, cmd_id: int, data: bytes) -> None:
+        """Executes a command on a buzzer (`commands_handler` in firmware).
+
+        Args:
+            buzzer (VirtualBuzzer): Buzzer executing the command.
+            cmd_id (int): Command ID.
+            data (bytes): Command and its arguments.
+        """
+
+        if not buzzer.powered:
+            return
+
+        cmd, args = data[:4], data[5:]
+
+        match cmd:
+            case b"PING":
+                self.__respond(buzzer, cmd_id, f"PING {buzzer.mac_str}".encode())
+
+            case b"GCLK":
+                self.__respond(buzzer, cmd_id, f"GCLK {buzzer.mac_str} {buzzer.get_clock()}".encode())
+
+            case b"GLED":
+                self.__respond(buzzer, cmd_id, f"GLED {buzzer.led_nb}".encode())
+
+            case b"SLED":
+                buzzer.leds = args[:3 * buzzer.led_nb].ljust(3 * buzzer.led_nb, b"\x00")
+
+            case b"CLED":
+                buzzer.leds = bytes(3 * buzzer.led_nb)
+
+            case b"RCLK":
+                buzzer.reset_clock()
+
+            case b"SCLK":
+                try:
+                    buzzer.set_clock(int(args))
+
+                except ValueError:
+                    logger.debug(f"Simulated buzzer {buzzer.mac_str} received an invalid SCLK: {args}")
+
+            case b"ACLK":
+                if buzzer.is_master:
+                    asyncio.create_task(self.__auto_set_clock(buzzer, cmd_id))
+
+            case b"RELY":
+                self.__respond(buzzer, cmd_id, f"RACK {buzzer.mac_str}".encode())
+
+                # Nested wrappers would acknowledge twice
+                if args[:4] != b"RELY":
+                    self.__handle(buzzer, cmd_id, args)
+
+    async def __auto_set_clock(self, master: VirtualBuzzer, cmd_id: int) -> None:
+        """Runs the automatic clock set procedure from master (`auto_set_clock_cmd` in firmware).
+
+        Args:
+            master (VirtualBuzzer): The master buzzer.
+            cmd_id (int): Command ID of the ACLK command.
+        """
+
+        master.reset_clock()
+
+        await asyncio.sleep(0.003)
+
+        for i in self.buzzers[1:]:
+            self.__esp_now_send(self.__handle, i, 0, b"RCLK")
+
+        await asyncio.sleep(AUTO_SET_CLK_DELAY)
+
+        for _ in range(AUTO_SET_CLK_NB):
+            clock = f"SCLK {master.get_clock()}".encode()
+
+            for i in self.buzzers[1:]:
+                self.__esp_now_send(self.__handle, i, 0, clock)
+
+            await asyncio.sleep(AUTO_SET_CLK_DELAY)
+
+        self.__respond(master, cmd_id, b"ACLK success")
+
+    def __respond(self, buzzer: VirtualBuzzer, cmd_id: int, data: bytes) -> None:
+        """Sends a response to the computer, through ESP-NOW if the buzzer is not the gateway.
+
+        Args:
+            buzzer (VirtualBuzzer): Buzzer sending the response.
+            cmd_id (int): Command ID of the response.
+            data (bytes): Response data.
+        """
+
+        if buzzer.is_master:
+            self.__notify(cmd_id, data)
+
+        else:
+            self.__esp_now_send(lambda _, i, d: self.__notify(i, d), self.gateway, cmd_id, data, link=buzzer)
+
+    def __esp_now_send(self, deliver: Callable[[VirtualBuzzer, int, bytes], None], buzzer: VirtualBuzzer,
+                       cmd_id: int, data: bytes, link: None | VirtualBuzzer = None) -> None:
+        """Simulates an ESP-NOW packet, applying latency, jitter and loss.
+
+        Args:
+            deliver (Callable): Function called with (buzzer, cmd_id, data) when the packet arrives.
+            buzzer (VirtualBuzzer): Buzzer receiving the packet.
+            cmd_id (int): Command ID carried by the packet.
+            data (bytes): Packet data.
+            link (VirtualBuzzer | None, optional): Buzzer at the other end of the link from the gateway, whose
+                link latency and jitter apply. Defaults to `buzzer`.
+        """
+
+        link = buzzer if link is None else link
+
+        self.stats["esp_now_sent"] += 1
+
+        if self.__random.random() < self.esp_now_loss:
+            self.stats["esp_now_lost"] += 1
+            return
+
+        delay = self.esp_now_latency + link.link_latency \
+            + self.__random.uniform(0, self.esp_now_jitter + link.link_jitter)
+
+        asyncio.get_running_loop().call_later(delay, deliver, buzzer, cmd_id, data)
+
+    def __notify(self, cmd_id: int, data: bytes) -> None:
+        """Sends a BLE notification to the computer (`ble_send_message` in firmware).
+
+        Args:
+            cmd_id (int): Command ID of the notification.
+            data (bytes): Notification data.
+        """
+
+        asyncio.get_running_loop().call_later(self.ble_latency, self.__deliver_notification, cmd_id, data)
+
+    def __deliver_notification(self, cmd_id: int, data: bytes) -> None:
+        """Calls the registered notification handler, scheduling it if it is a coroutine.
+
+        Args:
+            cmd_id (int): Command ID of the notification.
+            data (bytes): Notification data.
+        """
+
+        if not self.__connected or self.__notify_callback is None:
+            return
+
+        self.stats["notifications"] += 1
+
+        ret = self.__notify_callback(None, bytearray(bytes([cmd_id]) + data))
+
+        if asyncio.iscoroutine(ret):
+            asyncio.create_task(ret)
@@ -0,0 +1,348 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any
+
+if TYPE_CHECKING:
+    from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+logger = logging.getLogger(__name__)
+
+
+class WritePriority(IntEnum):
+    """Priority classes of outgoing BLE writes, lowest value first.
+
+    Attributes:
+        CLOCK (int): Clock synchronization commands, which are time critical.
+        CONTROL (int): Game control commands and queries.
+        LED (int): LED cosmetics.
+    """
+
+    CLOCK = 0
+    CONTROL = 1
+    LED = 2
+
+
+COMMAND_PRIORITIES: Dict[bytes, WritePriority] = {
+    b"SCLK": WritePriority.CLOCK,
+    b"RCLK": WritePriority.CLOCK,
+    b"ACLK": WritePriority.CLOCK,
+    b"GCLK": WritePriority.CLOCK,
+    b"SLED": WritePriority.LED,
+    b"CLED": WritePriority.LED,
+}
+
+
+class WriteScheduler:
+    """Single outbound queue for every BLE write to the gateway.
+
+    Writes are sent by priority class (clock sync, then game control, then LED cosmetics), in FIFO
+    order inside a class. They are paced with a token bucket so the gateway ESP-NOW forwarding is
+    not overrun.
+
+    The BLE write returns as soon as the packet is queued, it tells nothing about how fast the gateway
+    forwards it. The pace follows the replies instead, as counted by `BluetoothCommunication.rtt_estimator`:
+    every reply raises the rate by `rate_step` up to `rate`, and replies lost (timeouts) halve it, down to
+    `min_rate` and at most once per `backoff_hold`, so one burst of losses counts as one congestion event.
+
+    If the gateway supports batch frames (`BluetoothCommunication.batch_supported`), queued writes
+    are coalesced into a single BLE write up to `BluetoothCommunication.max_write_size`.
+
+    Attributes:
+        bt_comm (BluetoothCommunication): Bluetooth communication instance owning the BLE client.
+        rate (float): Maximum sustained number of writes per second.
+        burst (int): Maximum number of writes sent back to back.
+        min_rate (float): Lowest number of writes per second replies lost can bring the pace down to.
+        rate_step (float): Writes per second the pace is raised by for every reply received.
+        backoff_hold (float): Seconds after a slowdown during which replies lost don't slow down again.
+        __queue (asyncio.PriorityQueue): Pending writes as (priority, sequence, packet, future, enqueue time,
+            batchable).
+        __sequence (itertools.count): Sequence numbers keeping FIFO order inside a priority class.
+        __worker (asyncio.Task | None): Task sending queued writes, started on first submission.
+        __tokens (float): Tokens currently available in the bucket.
+        __last_refill (float): Monotonic time of the last bucket refill.
+        __write_duration (float): Exponentially weighted average duration of a write, in seconds.
+        __current_rate (float): Current number of writes per second, within `min_rate` and `rate`.
+        __last_backoff (float): Monotonic time of the last slowdown.
+        __replies (int): Replies counted by the round trip time estimator at the last pace update.
+        __losses (int): Timeouts counted by the round trip time estimator at the last pace update.
+        __depth (Dict[WritePriority, int]): Number of queued writes per priority class.
+        __stats (Dict[WritePriority, Dict[str, float]]): Number of writes and wait times per priority class.
+        __frames (int): Number of BLE writes done, a batch frame counting as one.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, rate: float = 200.0, burst: int = 20,
+                 min_rate: float = 20.0, rate_step: float = 5.0, backoff_hold: float = 1.0) -> None:
+        """Initializes a WriteScheduler instance.
+
+        Args:
+            bt_comm (BluetoothCommunication): Bluetooth communication instance owning the BLE client.
+            rate (float, optional): Maximum sustained number of writes per second. Defaults to 200.
+            burst (int, optional): Maximum number of writes sent back to back. Defaults to 20.
+            min_rate (float, optional): Lowest number of writes per second. Defaults to 20.
+            rate_step (float, optional): Writes per second the pace is raised by for every reply.
+                Defaults to 5.
+            backoff_hold (float, optional): Seconds between two slowdowns. Defaults to 1.
+        """
+
+        self.bt_comm: BluetoothCommunication = bt_comm
+        self.rate: float = rate
+        self.burst: int = burst
+        self.min_rate: float = min_rate
+        self.rate_step: float = rate_step
+        self.backoff_hold: float = backoff_hold
+
+        self.__queue: asyncio.PriorityQueue[Tuple[int, int, bytes, asyncio.Future, float, bool]] = \
+            asyncio.PriorityQueue()
+        self.__sequence: itertools.count = itertools.count()
+        self.__worker: None | asyncio.Task = None
+
+        self.__tokens: float = burst
+        self.__last_refill: float = time.monotonic()
+        self.__write_duration: float = 0.0
+        self.__current_rate: float = rate
+        self.__last_backoff: float = 0.0
+        self.__replies: int = 0
+        self.__losses: int = 0
+
+        self.__depth: Dict[WritePriority, int] = {i: 0 for i in WritePriority}
+        self.__stats: Dict[WritePriority, Dict[str, float]] = {
+            i: {"writes": 0, "total_wait": 0.0, "max_wait": 0.0} for i in WritePriority
+        }
+        self.__frames: int = 0
+
+    @staticmethod
+    def priority_of(command: bytes) -> WritePriority:
+        """Returns the priority class of a command.
+
+        Reliable commands (e.g. b"RELY SLED") get the priority class of the command they wrap.
+
+        Args:
+            command (bytes): Command name (e.g. b"SLED").
+
+        Returns:
+            WritePriority: Priority class of this command, CONTROL if unknown.
+        """
+
+        if command[:5] == b"RELY ":
+            command = command[5:]
+
+        return COMMAND_PRIORITIES.get(command[:4], WritePriority.CONTROL)
+
+    def __enqueue(self, packet: bytes, priority: WritePriority, batchable: bool) -> asyncio.Future:
+        """Queues a packet.
+
+        Args:
+            packet (bytes): Raw packet (MAC + ID + command) to write.
+            priority (WritePriority): Priority class of this write.
+            batchable (bool): Whether this packet may be coalesced with others into a batch frame.
+
+        Returns:
+            asyncio.Future: Future completed once the packet is written to the gateway.
+        """
+
+        if self.__worker is None or self.__worker.done():
+            self.__worker = asyncio.create_task(self.__run())
+
+        future = asyncio.get_running_loop().create_future()
+
+        self.__depth[priority] += 1
+        self.__queue.put_nowait((priority, next(self.__sequence), packet, future, time.monotonic(), batchable))
+
+        return future
+
+    async def submit(self, packet: bytes, priority: WritePriority = WritePriority.CONTROL,
+                     batchable: bool = True) -> None:
+        """Queues a packet and waits until it is written to the gateway.
+
+        Args:
+            packet (bytes): Raw packet (MAC + ID + command) to write.
+            priority (WritePriority, optional): Priority class of this write. Defaults to CONTROL.
+            batchable (bool, optional): Whether this packet may be coalesced with others into a batch frame.
+                Defaults to True.
+
+        Raises:
+            Exception: Any exception raised by the BLE client while writing.
+        """
+
+        await self.__enqueue(packet, priority, batchable)
+
+    async def submit_many(self, packets: List[Tuple[bytes, WritePriority, bool]]) -> None:
+        """Queues packets at once and waits until they are all written to the gateway.
+
+        Packets of the same priority class are contiguous in the queue, so they are coalesced into as
+        few batch frames as possible.
+
+        Args:
+            packets (List[Tuple[bytes, WritePriority, bool]]): Packets to write, as (raw packet, priority
+                class, batchable).
+
+        Raises:
+            Exception: The first exception raised by the BLE client while writing.
+        """
+
+        await asyncio.gather(*[self.__enqueue(*i) for i in packets])
+
+    @property
+    def current_rate(self) -> float:
+        """float: Current number of writes per second, following the replies received and lost."""
+
+        return self.__current_rate
+
+    def __update_rate(self) -> None:
+        """Updates the pace from the replies received and lost since the last update."""
+
+        stats = self.bt_comm.rtt_estimator.stats
+
+        # Counters start over if the estimator gets replaced
+        replies = max(0, stats["samples"] - self.__replies)
+        losses = max(0, stats["timeouts"] - self.__losses)
+
+        self.__replies, self.__losses = stats["samples"], stats["timeouts"]
+
+        now = time.monotonic()
+
+        if losses > 0 and now - self.__last_backoff >= self.backoff_hold:
+            self.__last_backoff = now
+            self.__current_rate /= 2
+
+            logger.debug(f"{losses} replies lost, writes slowed down to {self.__current_rate:.0f}/s")
+
+        else:
+            self.__current_rate += replies * self.rate_step
+
+        self.__current_rate = min(self.rate, max(self.min_rate, self.__current_rate))
+
+    async def __take_token(self) -> None:
+        """Waits until the token bucket allows a write, then consumes a token."""
+
+        self.__update_rate()
+
+        # The BLE client can't take writes faster than it completes them either
+        interval = max(1 / self.__current_rate, self.__write_duration)
+
+        while True:
+            now = time.monotonic()
+
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__last_refill) / interval)
+            self.__last_refill = now
+
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.__tokens) * interval)
+
+    def __take_batch(self, first: Tuple[int, int, bytes, asyncio.Future, float, bool]) \
+            -> List[Tuple[int, int, bytes, asyncio.Future, float, bool]]:
+        """Takes queued writes which can be sent in the same frame as a given one.
+
+        Writes are taken in queue order, and taking stops at the first one which does not fit.
+
+        Args:
+            first (Tuple): Queue item already taken, sent first in the frame.
+
+        Returns:
+            List[Tuple]: Queue items to send together, starting with `first`.
+        """
+
+        batch = [first]
+
+        if not first[5] or not self.bt_comm.batch_supported:
+            return batch
+
+        # Each record is the packet prefixed with its data length (1 byte)
+        size = len(self.bt_comm.BATCH_HEADER) + len(first[2]) + 1
+        max_size = self.bt_comm.max_write_size
+
+        while not self.__queue.empty():
+            item = self.__queue.get_nowait()
+
+            if not item[5] or size + len(item[2]) + 1 > max_size:
+                self.__queue.put_nowait(item)
+                break
+
+            batch.append(item)
+            size += len(item[2]) + 1
+
+        return batch
+
+    async def __run(self) -> None:
+        """Sends queued writes forever, by priority and paced by the token bucket."""
+
+        while True:
+            item = await self.__queue.get()
+
+            await self.__take_token()
+
+            batch = self.__take_batch(item)
+            now = time.monotonic()
+
+            for priority, _, _, _, enqueued, _ in batch:
+                priority = WritePriority(priority)
+                self.__depth[priority] -= 1
+
+                wait = now - enqueued
+                stats = self.__stats[priority]
+                stats["writes"] += 1
+                stats["total_wait"] += wait
+                stats["max_wait"] = max(stats["max_wait"], wait)
+
+            if len(batch) == 1:
+                frame = item[2]
+
+            else:
+                frame = self.bt_comm.pack_batch([i[2] for i in batch])
+
+            self.__frames += 1
+            t = time.monotonic()
+
+            try:
+                await self.bt_comm.client.write_gatt_char(self.bt_comm.CHARACTERISTIC_UUID, frame, response=False)
+
+            except Exception as e:
+                for i in batch:
+                    if not i[3].done():
+                        i[3].set_exception(e)
+
+            else:
+                for i in batch:
+                    if not i[3].done():
+                        i[3].set_result(None)
+
+            self.__write_duration = 0.9 * self.__write_duration + 0.1 * (time.monotonic() - t)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns queue depth and wait time statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics per priority class name (depth, writes, mean and max wait in seconds),
+            the number of BLE writes (frames), the pacing settings and the current pace.
+        """
+
+        ret: Dict[str, Any] = {
+            "rate": self.rate,
+            "current_rate": self.__current_rate,
+            "burst": self.burst,
+            "write_duration": self.__write_duration,
+            "frames": self.__frames
+        }
+
+        for i in WritePriority:
+            stats = self.__stats[i]
+
+            ret[i.name] = {
+                "depth": self.__depth[i],
+                "writes": stats["writes"],
+                "mean_wait": stats["total_wait"] / stats["writes"] if stats["writes"] else 0.0,
+                "max_wait": stats["max_wait"]
+            }
+
+        return ret
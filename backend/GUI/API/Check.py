@@ -3,13 +3,13 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-from typing import List, Tuple, Dict, Any
+from typing import Tuple, Dict, Any
 
 from quart import Blueprint, Response, jsonify
 
 from backend.BuzzerLogic.Constants import LED_NB
 from backend.BuzzerLogic.State import State
-from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 
 
@@ -26,10 +26,9 @@ class ApiCheck:
             Bluetooth communication handler used to send commands to
             connected buzzers and retrieve their configuration.
 
-        __teams (List[Team]):
-            List of teams currently registered in the system.
-            This attribute is stored for consistency with other API
-            classes, even if not directly used by this class.
+        __teams (TeamRegistry):
+            Teams currently registered in the system.
+            Their associated buzzers are expected to answer LED queries.
 
         __state (State):
             Global application state container.
@@ -41,21 +40,21 @@ class ApiCheck:
             All routes are prefixed with ``/api/check``.
     """
 
-    def __init__(self, bt_comm: BluetoothCommunication, teams: List[Team], state: State):
+    def __init__(self, bt_comm: BluetoothCommunication, teams: TeamRegistry, state: State):
         """Initialize the check API and register routes.
 
         Args:
             bt_comm (BluetoothCommunication):
                 Bluetooth communication handler used to communicate
                 with connected buzzers.
-            teams (List[Team]):
-                List of teams currently registered in the system.
+            teams (TeamRegistry):
+                Teams currently registered in the system.
             state (State):
                 Global application state container.
         """
 
         self.__bt_comm: BluetoothCommunication = bt_comm
-        self.__teams: List[Team] = teams
+        self.__teams: TeamRegistry = teams
         self.__state: State = state
 
         self.blueprint = Blueprint("api_check", __name__, url_prefix="/api/check")
@@ -82,7 +81,8 @@ class ApiCheck:
 
         Notes:
             - A broadcast MAC address (FF:FF:FF:FF:FF:FF) is used to query
-              all connected devices.
+              all connected devices. The query ends as soon as every known
+              buzzer (connected cache and team associations) answered.
             - If **any inconsistency** is detected (i.e. at least one buzzer
               reports an unexpected number of LEDs), the endpoint returns
               **HTTP 500**.
@@ -93,8 +93,12 @@ class ApiCheck:
         ret: Dict[str, Any] = {'config': LED_NB}
         err = False
 
-        for i in await self.__bt_comm.commands.get_led_number(target_mac=b"\xff\xff\xff\xff\xff\xff"):
-            print(i)
+        # Known buzzers are expected to answer, so the broadcast can end as soon as they all did
+        expected = set(await self.__bt_comm.connected_cache.get_connected_str())
+        expected.update([self.__bt_comm.mac_to_str(i) for i in self.__teams.macs()])
+
+        for i in await self.__bt_comm.commands.get_led_number(target_mac=b"\xff\xff\xff\xff\xff\xff",
+                                                              expected=expected):
             if int(i.data[0]) != LED_NB:
                 err = True
 
@@ -0,0 +1,160 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import asyncio
+import json
+from typing import Tuple, AsyncIterator
+
+from quart import Blueprint, Response, jsonify, make_response, request
+
+from backend.BuzzerLogic.State import State
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+
+class ApiEvents:
+    """API endpoints pushing game events to the GUI with Server-Sent Events.
+
+    Attributes:
+        __bt_comm (BluetoothCommunication):
+            Bluetooth communication handler owning the event bus.
+
+        __teams (TeamRegistry):
+            Teams currently registered in the system.
+
+        __state (State):
+            Global application state container.
+
+        keep_alive (float):
+            Seconds without event after which a comment is sent, so proxies
+            keep the stream open.
+
+        blueprint (Blueprint):
+            Quart Blueprint exposing event-related API endpoints.
+            All routes are prefixed with ``/api/events``.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, teams: TeamRegistry, state: State):
+        """Initialize the events API and register routes.
+
+        Args:
+            bt_comm (BluetoothCommunication):
+                Bluetooth communication handler owning the event bus.
+            teams (TeamRegistry):
+                Teams currently registered in the system.
+            state (State):
+                Global application state container.
+        """
+
+        self.__bt_comm: BluetoothCommunication = bt_comm
+        self.__teams: TeamRegistry = teams
+        self.__state: State = state
+
+        self.keep_alive: float = 15.0
+
+        self.blueprint = Blueprint("api_events", __name__, url_prefix="/api/events")
+
+        self.blueprint.add_url_rule("", view_func=self.stream_events, methods=['GET'])
+        self.blueprint.add_url_rule("/get_stats", view_func=self.get_stats, methods=['GET'])
+
+    def __snapshot(self) -> bytes:
+        """Encodes the whole game as a snapshot event.
+
+        Built from memory only: buzzers are the ones connected at the last
+        connected cache update, they are not pinged.
+
+        Returns:
+            bytes: The snapshot, as a Server-Sent Event.
+        """
+
+        data = {
+            "state": self.__state.to_dict(),
+            "teams": [i.to_dict() for i in self.__teams],
+            "connected": self.__bt_comm.client is not None,
+            "buzzers": self.__bt_comm.connected_cache.connected
+        }
+
+        return f"id: {self.__bt_comm.events.last_id}\nevent: snapshot\ndata: {json.dumps(data)}\n\n".encode()
+
+    async def stream_events(self) -> Response:
+        """Stream game events.
+
+        A ``snapshot`` event describing the whole game is sent first, then
+        every change as it happens. When the client can't keep up, or
+        reconnects after missed events are not kept anymore, a new snapshot
+        is sent instead of the lost events.
+
+        Returns:
+            Response:
+                A ``text/event-stream`` response, never ending.
+
+        Request headers:
+            Last-Event-ID (optional): ID of the last event received, set by
+            browsers when reconnecting. Missed events are sent instead of a
+            snapshot.
+
+        Events:
+            snapshot: {"state": {...}, "teams": [...], "connected": true, "buzzers": [...]}
+            state: {"state": "CHECK", "team": "Team A"}
+            team: {"event": "updated", "team": {...}, "teams": ["Team A", "Team B"]}
+            press: {"team": "Team A", "result": {...}}
+            connection: {"connected": false}
+            buzzers: {"connected": ["00:11:22:33:44:55"]}
+        """
+
+        events = self.__bt_comm.events
+
+        last_id = request.headers.get("Last-Event-ID", "")
+        queue = events.subscribe(int(last_id) if last_id.isdigit() else None)
+
+        # Taken right after subscribing, so no change falls between the snapshot and the events
+        snapshot = self.__snapshot() if not last_id.isdigit() else None
+
+        async def stream() -> AsyncIterator[bytes]:
+            try:
+                if snapshot is not None:
+                    yield snapshot
+
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), self.keep_alive)
+
+                    except asyncio.TimeoutError:
+                        yield b": keep-alive\n\n"
+                        continue
+
+                    yield self.__snapshot() if event is None else event.sse
+
+            finally:
+                events.unsubscribe(queue)
+
+        response = await make_response(stream(), 200, {
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        })
+        response.timeout = None
+
+        return response
+
+    async def get_stats(self) -> Tuple[Response, int]:
+        """Get event bus statistics.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing the event counters and the
+                number of streams currently open.
+
+        Response JSON:
+            {
+                "published": 42,
+                "delivered": 120,
+                "overflows": 0,
+                "subscribers": 3,
+                "last_id": 42
+            }
+        """
+
+        return jsonify(self.__bt_comm.events.get_stats()), 200
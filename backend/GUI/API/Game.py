@@ -0,0 +1,119 @@
+# Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+from typing import Tuple
+
+from quart import Blueprint, Response, jsonify, request
+
+from backend.BuzzerLogic.State import State
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
+from backend.ESPCommunication.ArbitrationResult import TiePolicy
+from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
+
+
+class ApiGame:
+    """API endpoints exposing press arbitration and game rules.
+
+    Attributes:
+        __bt_comm (BluetoothCommunication):
+            Bluetooth communication handler owning the press arbiter.
+
+        __teams (TeamRegistry):
+            Teams currently registered in the system.
+
+        __state (State):
+            Global application state container, holding the last
+            arbitration result.
+
+        blueprint (Blueprint):
+            Quart Blueprint exposing game-related API endpoints.
+            All routes are prefixed with ``/api/game``.
+    """
+
+    def __init__(self, bt_comm: BluetoothCommunication, teams: TeamRegistry, state: State):
+        """Initialize the game API and register routes.
+
+        Args:
+            bt_comm (BluetoothCommunication):
+                Bluetooth communication handler owning the press arbiter.
+            teams (TeamRegistry):
+                Teams currently registered in the system.
+            state (State):
+                Global application state container.
+        """
+
+        self.__bt_comm: BluetoothCommunication = bt_comm
+        self.__teams: TeamRegistry = teams
+        self.__state: State = state
+
+        self.blueprint = Blueprint("api_game", __name__, url_prefix="/api/game")
+
+        self.blueprint.add_url_rule("/get_arbitration", view_func=self.get_arbitration, methods=['GET'])
+        self.blueprint.add_url_rule("/set_tie_policy", view_func=self.set_tie_policy, methods=['PATCH'])
+
+    async def get_arbitration(self) -> Tuple[Response, int]:
+        """Get the result of the last press arbitration and the tie policy.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing the tie policy and the last
+                arbitration result (null if no press was decided yet).
+
+        Response JSON:
+            {
+                "tie_policy": "first",
+                "team": "Team A",
+                "result": {
+                    "tie": true,
+                    "duration": 0.031,
+                    "tied": [
+                        {"mac": "00:11:22:33:44:55", "delta_ms": 0.0, "error_ms": 2.4},
+                        {"mac": "00:11:22:33:44:66", "delta_ms": 1.8, "error_ms": 2.9}
+                    ],
+                    "presses": [...]
+                }
+            }
+        """
+
+        result = self.__state.last_result
+
+        return jsonify({
+            "tie_policy": self.__bt_comm.but_callback.tie_policy.value,
+            "team": self.__state.team_check.name if self.__state.team_check is not None else None,
+            "result": result.to_dict() if result is not None else None
+        }), 200
+
+    async def set_tie_policy(self) -> Tuple[Response, int]:
+        """Set the policy applied when presses of different teams can't be told apart.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response indicating success or failure, and an HTTP
+                status code.
+
+        Request JSON:
+            {
+                "policy": "reject"
+            }
+
+        Notes:
+            - ``first``: the earliest corrected press wins anyway.
+            - ``random``: a random team among the tied ones wins.
+            - ``reject``: nobody wins, the game returns to IDLE.
+        """
+
+        payload = await request.get_json()
+
+        if "policy" not in payload.keys():
+            return jsonify({"error": f"You must define a field named policy in the body"}), 400
+
+        valid = [i.value for i in TiePolicy]
+
+        if payload["policy"] not in valid:
+            return jsonify({"error": f"Valid policies are {', '.join(valid)}"}), 400
+
+        self.__bt_comm.but_callback.tie_policy = TiePolicy(payload["policy"])
+
+        return jsonify({"status": "ok"}), 200
@@ -3,12 +3,12 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-from typing import List, Tuple
+from typing import Tuple
 
 from quart import Blueprint, Response, jsonify, request
 
 from backend.BuzzerLogic.State import State
-from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 
 
@@ -25,8 +25,8 @@ class ApiStatus:
             Bluetooth communication handler used to query connected devices
             and manage the connection cache.
 
-        __teams (List[Team]):
-            List of teams currently registered in the system. Each team
+        __teams (TeamRegistry):
+            Teams currently registered in the system. Each team
             contains scoring information, color configuration, and
             associated buzzer MAC addresses.
 
@@ -39,26 +39,34 @@ class ApiStatus:
             All routes are prefixed with ``/api/status``.
     """
 
-    def __init__(self, bt_comm: BluetoothCommunication, teams: List[Team], state: State):
+    def __init__(self, bt_comm: BluetoothCommunication, teams: TeamRegistry, state: State):
         """Initialize the status API and register routes.
 
         Args:
             bt_comm (BluetoothCommunication):
                 Bluetooth communication handler used to query connected devices.
-            teams (List[Team]):
-                List of teams currently registered in the system.
+            teams (TeamRegistry):
+                Teams currently registered in the system.
             state (State):
                 Global application state container.
         """
 
         self.__bt_comm: BluetoothCommunication = bt_comm
-        self.__teams: List[Team] = teams
+        self.__teams: TeamRegistry = teams
         self.__state: State = state
 
         self.blueprint = Blueprint("api_status", __name__, url_prefix="/api/status")
 
         self.blueprint.add_url_rule("/get_connected", view_func=self.get_connected, methods=['GET'])
         self.blueprint.add_url_rule("/get_state", view_func=self.get_state, methods=['GET'])
+        self.blueprint.add_url_rule("/get_scheduler_stats", view_func=self.get_scheduler_stats, methods=['GET'])
+        self.blueprint.add_url_rule("/get_press_stats", view_func=self.get_press_stats, methods=['GET'])
+        self.blueprint.add_url_rule("/get_clock_sync", view_func=self.get_clock_sync, methods=['GET'])
+        self.blueprint.add_url_rule("/get_led_shadow_stats", view_func=self.get_led_shadow_stats, methods=['GET'])
+        self.blueprint.add_url_rule("/get_connected_cache_stats", view_func=self.get_connected_cache_stats,
+                                    methods=['GET'])
+        self.blueprint.add_url_rule("/get_rtt", view_func=self.get_rtt, methods=['GET'])
+        self.blueprint.add_url_rule("/get_reliable_stats", view_func=self.get_reliable_stats, methods=['GET'])
 
     async def get_connected(self) -> Tuple[Response, int]:
         """Get currently connected Bluetooth devices.
@@ -79,7 +87,10 @@ class ApiStatus:
 
         if self.__bt_comm.client is not None:
             if no_cache:
-                await self.__bt_comm.connected_cache.update_cache(force=True)
+                # Buzzers associated to a team are expected to answer, so the broadcast can end early
+                expected = [self.__bt_comm.mac_to_str(i) for i in self.__teams.macs()]
+
+                await self.__bt_comm.connected_cache.update_cache(force=True, expected=expected)
 
             connected = await self.__bt_comm.connected_cache.get_connected_str()
 
@@ -100,3 +111,204 @@ class ApiStatus:
         """
 
         return jsonify({'state': str(self.__state.current_state).split(".")[1]}), 200
+
+    async def get_scheduler_stats(self) -> Tuple[Response, int]:
+        """Get the outbound BLE write scheduler statistics.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing the pacing settings, the current
+                pace and, per priority class, the queue depth and wait times
+                (in seconds).
+
+        Response JSON:
+            {
+                "rate": 200,
+                "current_rate": 150,
+                "burst": 20,
+                "write_duration": 0.002,
+                "frames": 48,
+                "CLOCK": {"depth": 0, "writes": 12, "mean_wait": 0.0001, "max_wait": 0.001},
+                "CONTROL": {...},
+                "LED": {...}
+            }
+        """
+
+        return jsonify(self.__bt_comm.write_scheduler.get_stats()), 200
+
+    async def get_press_stats(self) -> Tuple[Response, int]:
+        """Get button press arbitration statistics.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing press counters, arbitration window
+                bounds and press to decision latencies (in seconds).
+
+        Response JSON:
+            {
+                "presses": 12,
+                "ignored": 2,
+                "duplicates": 12,
+                "decisions": 4,
+                "early_decisions": 3,
+                "ties": 1,
+                "max_window": 0.15,
+                "latency_bound": 0.015,
+                "sync_error": 0.002,
+                "latency_mean": 0.0203,
+                "latency_p50": 0.0198,
+                "latency_max": 0.0273
+            }
+        """
+
+        return jsonify(self.__bt_comm.but_callback.get_stats()), 200
+
+    async def get_clock_sync(self) -> Tuple[Response, int]:
+        """Get the estimated clock offset, drift and error bound of every buzzer.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing the clock model of every sampled
+                buzzer, the sampling counters and the synchronization state.
+
+        Response JSON:
+            {
+                "buzzers": {
+                    "00:11:22:33:44:55": {
+                        "offset_ms": -1520.4,
+                        "drift_ppm": 12.5,
+                        "error_ms": 2.1,
+                        "samples": 64
+                    }
+                },
+                "stats": {"rounds": 120, "samples": 480, "resets": 2},
+                "sync": {
+                    "checks": 120,
+                    "syncs": 1,
+                    "deferred": 0,
+                    "suspended": false,
+                    "clock_spread": 6.3,
+                    "max_skew": 20.0
+                }
+            }
+        """
+
+        clock_estimator = self.__bt_comm.clock_estimator
+
+        return jsonify({
+            'buzzers': clock_estimator.get_estimates(),
+            'stats': clock_estimator.stats,
+            'sync': self.__bt_comm.clock_sync.get_stats()
+        }), 200
+
+    async def get_led_shadow_stats(self) -> Tuple[Response, int]:
+        """Get LED write counters of the shadow skipping identical frames.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing the number of LED frames sent,
+                skipped (already shown by the buzzer) and shadow invalidations.
+
+        Response JSON:
+            {
+                "sent": 42,
+                "skipped": 17,
+                "invalidations": 9
+            }
+        """
+
+        return jsonify(self.__bt_comm.led_shadow.stats), 200
+
+    async def get_connected_cache_stats(self) -> Tuple[Response, int]:
+        """Get counters of the connected buzzers cache.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing cache hits (fresh or expired
+                roster served right away), misses (reads which waited for a
+                ping), broadcast pings sent or shared and their durations
+                (in seconds).
+
+        Response JSON:
+            {
+                "hits": 40,
+                "stale_hits": 3,
+                "misses": 1,
+                "refreshes": 4,
+                "broadcasts": 2,
+                "unicasts": 3,
+                "shared": 2,
+                "failures": 0,
+                "discovered": 5,
+                "lost": 1,
+                "refresh_mean": 0.52,
+                "refresh_max": 1.01,
+                "connected": 4,
+                "silent": 0,
+                "refreshing": false
+            }
+        """
+
+        return jsonify(self.__bt_comm.connected_cache.get_stats()), 200
+
+    async def get_rtt(self) -> Tuple[Response, int]:
+        """Get the round trip time estimate and response timeout of every buzzer.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing, per buzzer, the smoothed round
+                trip time, its variation, the timeout used for its responses
+                and percentiles of the last round trip times (in ms), with
+                the sample and timeout counters.
+
+        Response JSON:
+            {
+                "buzzers": {
+                    "00:11:22:33:44:55": {
+                        "srtt_ms": 14.2,
+                        "rttvar_ms": 1.8,
+                        "timeout_ms": 50.0,
+                        "p50_ms": 13.9,
+                        "p90_ms": 16.4,
+                        "p99_ms": 21.0,
+                        "samples": 128
+                    }
+                },
+                "stats": {"samples": 960, "timeouts": 2},
+                "initial_timeout_ms": 750.0
+            }
+        """
+
+        rtt_estimator = self.__bt_comm.rtt_estimator
+
+        return jsonify({
+            'buzzers': rtt_estimator.get_estimates(),
+            'stats': rtt_estimator.stats,
+            'initial_timeout_ms': rtt_estimator.initial_timeout * 1000
+        }), 200
+
+    async def get_reliable_stats(self) -> Tuple[Response, int]:
+        """Get counters of the acknowledged delivery of commands expecting no response.
+
+        Returns:
+            Tuple[Response, int]:
+                A JSON response containing whether commands are sent
+                reliably by default, the number of commands sent,
+                retransmitted, acknowledged, skipped because a newer one set
+                the same state, and buzzers which never acknowledged.
+
+        Response JSON:
+            {
+                "enabled": true,
+                "sent": 120,
+                "retransmits": 7,
+                "acked": 118,
+                "superseded": 2,
+                "given_up": 0,
+                "in_flight": 1
+            }
+        """
+
+        reliable = self.__bt_comm.reliable
+
+        return jsonify({'enabled': reliable.enabled, **reliable.get_stats()}), 200
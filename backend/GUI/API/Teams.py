@@ -4,12 +4,13 @@
 # https://opensource.org/licenses/MIT
 
 import re
-from typing import List, Tuple, Dict, Literal, cast
+from typing import Tuple, Dict, Literal, Any, cast
 
 from quart import Blueprint, Response, jsonify, request
 
 from backend.BuzzerLogic.State import State
 from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 from backend.ESPCommunication.LEDManager import Color
 
@@ -17,20 +18,20 @@ HEX_COLOR_RE = re.compile(r"^#?[0-9a-fA-F]{6}$")
 
 
 class ApiTeams:
-    def __init__(self, bt_comm: BluetoothCommunication, teams: List[Team], state: State):
+    def __init__(self, bt_comm: BluetoothCommunication, teams: TeamRegistry, state: State):
         """Initialize the teams API and register routes.
 
         Args:
             bt_comm (BluetoothCommunication):
                 Bluetooth communication handler used to query connected devices.
-            teams (List[Team]):
-                List of teams currently registered in the system.
+            teams (TeamRegistry):
+                Teams currently registered in the system.
             state (State):
                 Global application state container.
         """
 
         self.__bt_comm: BluetoothCommunication = bt_comm
-        self.__teams: List[Team] = teams
+        self.__teams: TeamRegistry = teams
         self.__state: State = state
 
         self.blueprint = Blueprint("api_teams", __name__, url_prefix="/api/teams")
@@ -66,17 +67,7 @@ class ApiTeams:
             }
         """
 
-        teams: Dict[str, any] = {}
-
-        for i in self.__teams:
-            teams.update({i.name: {
-                'name': i.name,
-                'point': i.point,
-                'point_limit': i.point_limit,
-                'primary_color': i.primary_color.to_str_value(),
-                'secondary_color': i.secondary_color.to_str_value(),
-                'associated_buzzers': [self.__bt_comm.mac_to_str(j) for j in i.associated_buzzers]
-            }})
+        teams: Dict[str, any] = {i.name: i.to_dict() for i in self.__teams}
 
         return jsonify(teams), 200
 
@@ -128,22 +119,18 @@ class ApiTeams:
             if not self.is_valid_hex_color(payload[i]):
                 return jsonify({"error": f"{i} must be given in #RRGGBB form"}), 400
 
-        if payload["team_name"] in [i.name for i in self.__teams]:
+        if payload["team_name"] in self.__teams:
             return jsonify({"error": f"Team {payload["team_name"]} already exists"}), 400
 
         team_name: str = str(payload["team_name"])
         primary_color: Color = Color().from_hex(payload["primary_color"].lstrip("#"))
         secondary_color: Color = Color().from_hex(payload["secondary_color"].lstrip("#"))
 
-        if len(self.__teams) == 0:
-            point_limit: Literal[5, 8, 10, 16] = 8
-
-        else:
-            point_limit: Literal[5, 8, 10, 16] = self.__teams[0].point_limit
+        point_limit: Literal[5, 8, 10, 16] = self.__teams.point_limit
 
         team = Team(name=team_name, primary_color=primary_color, secondary_color=secondary_color,
                     bt_comm=self.__bt_comm, point_limit=point_limit)
-        self.__teams.append(team)
+        self.__teams.add(team)
 
         return jsonify({"status": "ok"}), 200
 
@@ -173,8 +160,7 @@ class ApiTeams:
 
         limit: Literal[5, 8, 10, 16] = cast(Literal[5, 8, 10, 16], payload["limit"])
 
-        for i in self.__teams:
-            i.point_limit = limit
+        self.__teams.set_point_limit(limit)
 
         return jsonify({"status": "ok"}), 200
 
@@ -189,8 +175,7 @@ class ApiTeams:
                 A JSON response indicating success, and an HTTP status code.
         """
 
-        for i in self.__teams:
-            i.point = 0
+        self.__teams.reset_points()
 
         await self.__bt_comm.commands.clear_leds()
 
@@ -215,10 +200,10 @@ class ApiTeams:
         if "team_name" not in payload.keys():
             return jsonify({"error": f"You must define a field named team_name in the body"}), 400
 
-        if payload["team_name"] not in [i.name for i in self.__teams]:
+        if payload["team_name"] not in self.__teams:
             return jsonify({"error": f"Team {payload["team_name"]} does not exist"}), 400
 
-        self.__teams = [i for i in self.__teams if i.name != payload["team_name"]]
+        self.__teams.remove(payload["team_name"])
 
         return jsonify({"status": "ok"}), 200
 
@@ -245,22 +230,11 @@ class ApiTeams:
             if i not in payload.keys():
                 return jsonify({"error": f"You must define a field named {i} in the body"}), 400
 
-        team_names = [i.name for i in self.__teams]
-
-        if payload["old_name"] not in team_names:
-            return jsonify({"error": f"Team {payload["old_name"]} does not exist"}), 400
-
-        if payload["new_name"] in team_names:
-            return jsonify({"error": f"Team {payload["new_name"]} already exists"}), 400
-
-        for i in self.__teams.copy():
-            if i.name == payload["old_name"]:
-                i.name = payload["new_name"]
-                self.__teams.append(i)
-
-                break
+        try:
+            self.__teams.rename(payload["old_name"], payload["new_name"])
 
-        self.__teams = [i for i in self.__teams if i.name != payload["old_name"]]
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         return jsonify({"status": "ok"}), 200
 
@@ -293,56 +267,53 @@ class ApiTeams:
         if "team_name" not in payload.keys():
             return jsonify({"error": f"You must define a field named team_name in the body"}), 400
 
-        team: Team | None = None
-
-        for i in self.__teams:
-            if payload["team_name"] == i.name:
-                team = i
-                break
+        team: Team | None = self.__teams.get(payload["team_name"])
 
         if team is None:
             return jsonify({"error": f"Team {payload["team_name"]} does not exist"}), 400
 
+        changes: Dict[str, Any] = {}
+
         if "associated_buzzers" in payload.keys():
-            await self.__bt_comm.connected_cache.update_cache(force=False)
             connected = await self.__bt_comm.connected_cache.get_connected_str()
 
-            for i in payload["associated_buzzers"]:
-                for j in self.__teams:
-                    if j.name != payload["team_name"] and i in j.associated_buzzers:
-                        return jsonify({"error": f"Buzzer {i} is already associated to team {j.name}"}), 400
+            # The roster may be stale, a buzzer connected meanwhile is only found by a new ping
+            if any(i not in connected for i in payload["associated_buzzers"]):
+                await self.__bt_comm.connected_cache.update_cache(force=True, expected=payload["associated_buzzers"])
+                connected = self.__bt_comm.connected_cache.connected
 
-                    if i not in connected:
-                        return jsonify({"error": f"Buzzer {i} is not connected"}), 400
+            for i in payload["associated_buzzers"]:
+                if i not in connected:
+                    return jsonify({"error": f"Buzzer {i} is not connected"}), 400
 
-            team.associated_buzzers = payload["associated_buzzers"]
+            changes["associated_buzzers"] = payload["associated_buzzers"]
 
         if "point" in payload.keys():
             if isinstance(payload["point"], int) and 0 <= payload["point"] <= team.point_limit:
-                team.point = payload["point"]
+                changes["point"] = payload["point"]
 
             else:
                 return jsonify({"error": f"Point must be an integer from 0 to point_limit ({team.point_limit})"}), 400
 
         if "primary_color" in payload.keys():
             if self.is_valid_hex_color(payload["primary_color"]):
-                primary = Color().from_hex(payload["primary_color"])
+                changes["primary_color"] = Color().from_hex(payload["primary_color"])
 
             else:
                 return jsonify({"error": f"Primary color must be a 6 character long hexadecimal number"}), 400
 
-            team.primary_color = primary
-
         if "secondary_color" in payload.keys():
             if self.is_valid_hex_color(payload["secondary_color"]):
-                secondary = Color().from_hex(payload["secondary_color"])
+                changes["secondary_color"] = Color().from_hex(payload["secondary_color"])
 
             else:
                 return jsonify({"error": f"Secondary color must be a 6 character long hexadecimal number"}), 400
 
-            team.secondary_color = secondary
+        # Applied at once, so a rejected request changes nothing
+        try:
+            self.__teams.update(payload["team_name"], **changes)
 
-        self.__teams = [i for i in self.__teams if i.name != payload["team_name"]]
-        self.__teams.append(team)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         return jsonify({"status": "ok"}), 200
@@ -9,6 +9,7 @@ from quart import Blueprint, jsonify, Response
 
 from backend.BuzzerLogic.State import State
 from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 from backend.ESPCommunication.LEDManager import Color
 
@@ -47,6 +48,7 @@ class Test:
         self.blueprint.add_url_rule("/swait", view_func=self.wait_press)
         self.blueprint.add_url_rule("/confirm", view_func=self.confirm_press)
         self.blueprint.add_url_rule("/deny", view_func=self.deny_press)
+        self.blueprint.add_url_rule("/sim_press/<mac>", view_func=self.simulated_press)
 
         self.teams = [Team(name="BLUE", primary_color=Color(0, 0, 255), secondary_color=Color(0, 255, 255), bt_comm=self.__bt_comm,
                            point_limit=5),
@@ -55,7 +57,7 @@ class Test:
 
         self.teams[0].associated_buzzers = [b"\x78\x1c\x3c\x2d\x57\x94"]
         self.teams[1].associated_buzzers = [b"\x78\x1c\x3c\x2d\x33\x94"]
-        self.state = State(self.teams, self.__bt_comm)
+        self.state = State(TeamRegistry(self.__bt_comm, self.teams), self.__bt_comm)
 
     async def test(self) -> Tuple[Response, int]:
         """Handles GET requests to the `/` route.
@@ -91,5 +93,26 @@ class Test:
         await self.state.deny_press()
         return jsonify({'__state': 'denied'}), 200
 
+    async def simulated_press(self, mac: str) -> Tuple[Response, int]:
+        """Presses a button on a simulated buzzer.
+
+        Args:
+            mac (str): MAC address of the simulated buzzer, in the form 00:11:22:33:44:55.
+
+        Returns:
+            Tuple[Response, int]: A JSON response and HTTP status code (400 if no simulation is running).
+        """
+
+        if self.__bt_comm.simulated_gateway is None:
+            return jsonify({'error': 'No simulated gateway in use'}), 400
+
+        try:
+            self.__bt_comm.simulated_gateway.press(mac)
+
+        except (KeyError, ValueError):
+            return jsonify({'error': f'No simulated buzzer with MAC {mac}'}), 400
+
+        return jsonify({'pressed': mac}), 200
+
 # TODO: Team selector
 # TODO: proper interface
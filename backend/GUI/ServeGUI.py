@@ -13,9 +13,11 @@ from hypercorn.config import Config
 from quart import Quart
 
 from backend.BuzzerLogic.State import State
-from backend.BuzzerLogic.Team import Team
+from backend.BuzzerLogic.TeamRegistry import TeamRegistry
 from backend.ESPCommunication.BluetoothCommunication import BluetoothCommunication
 from backend.GUI.API.Check import ApiCheck
+from backend.GUI.API.Events import ApiEvents
+from backend.GUI.API.Game import ApiGame
 from backend.GUI.API.Light import ApiLights
 from backend.GUI.API.Status import ApiStatus
 from backend.GUI.API.Teams import ApiTeams
@@ -32,7 +34,7 @@ class ServeGUI:
 
     Attributes:
         quart_app (Quart): The Quart application instance.
-        __teams (List[Team]): Unordered list of __teams participating in the current game session.
+        __teams (TeamRegistry): Teams participating in the current game session, shared by the state and every API.
         __buzz_state (State): Central game __state manager responsible for tracking
             the current game phase (IDLE, WAIT, CHECK), controlling team LEDs,
             and handling buzzer input validation (confirmation or rejection).
@@ -53,7 +55,7 @@ class ServeGUI:
         self.__bt_comm: BluetoothCommunication = bt_comm
         self.__bind: List[str] = []
 
-        self.__teams: List[Team] = []
+        self.__teams: TeamRegistry = TeamRegistry(self.__bt_comm)
         self.__buzz_state: State = State(self.__teams, self.__bt_comm)
 
         self.__load_config()
@@ -101,6 +103,12 @@ class ServeGUI:
         lights_class = ApiLights(self.__bt_comm, self.__teams, self.__buzz_state)
         self.quart_app.register_blueprint(lights_class.blueprint)
 
+        game_class = ApiGame(self.__bt_comm, self.__teams, self.__buzz_state)
+        self.quart_app.register_blueprint(game_class.blueprint)
+
+        events_class = ApiEvents(self.__bt_comm, self.__teams, self.__buzz_state)
+        self.quart_app.register_blueprint(events_class.blueprint)
+
         config = Config()
         config.bind = self.__bind
         config.shutdown_timeout = 1
@@ -28,6 +28,8 @@ async def main() -> None:
 
     await bt_comm.connect_until_complete()
 
+    asyncio.create_task(bt_comm.clock_sync.run())
+
     # TODO: Clean CLI / small GUI with flask
 
 
@@ -18,6 +18,9 @@
 #define CHARACTERISTIC_UUID "bb651b13-47ff-4cd5-a3bc-6eb184a5a7b1"
 #define BLE_NAME "BUZZERS-INSAGORA"
 
+// Max write size: MTU (517) - ATT header (3)
+#define BLE_WRITE_MAX_SIZE 514
+
 bool is_master;
 
 NimBLEServer *pServer;
@@ -86,18 +89,25 @@ public:
 
     void onWrite(NimBLECharacteristic *pCharacteristic, NimBLEConnInfo &connInfo)
     {
-        char value[246];
+        char value[BLE_WRITE_MAX_SIZE];
         memset(value, 0, sizeof(value));
         std::string raw = pCharacteristic->getValue();
         int length = raw.size();
-        if (length > 246)
-            length = 246;
+        if (length > BLE_WRITE_MAX_SIZE)
+            length = BLE_WRITE_MAX_SIZE;
         memcpy(value, raw.data(), length);
 
 #ifdef DEBUG
         Serial.printf("[BLE] WRITE FROM %s: %s\n", connInfo.getAddress().toString().c_str(), value);
 #endif
 
+        // Batch frame: null target, MCMD command, then one record per command
+        if (length >= 11 && memcmp(value, nullAddress, 6) == 0 && memcmp(&value[7], "MCMD", 4) == 0)
+        {
+            multi_commands_handler((uint8_t *)&value[11], length - 11);
+            return;
+        }
+
         ESPNowMessage msg;
 
         memcpy(msg.target, value, 6);
@@ -109,19 +119,7 @@ public:
 
         msg.fwd_ble = 0;
 
-        if (memcmp(msg.target, macAddress, 6) == 0)
-        {
-            commands_handler(&msg);
-        }
-        else if (memcmp(msg.target, broadcastAddress, 6) == 0)
-        {
-            esp_now_send_message(&msg);
-            commands_handler(&msg);
-        }
-        else
-        {
-            esp_now_send_message(&msg);
-        }
+        ble_route_message(&msg);
     }
 
     void onStatus(NimBLECharacteristic *pCharacteristic, int code) {}
@@ -177,6 +175,23 @@ void activate_ble()
     advertise_ble();
 }
 
+void ble_route_message(ESPNowMessage *msg)
+{
+    if (memcmp(msg->target, macAddress, 6) == 0)
+    {
+        commands_handler(msg);
+    }
+    else if (memcmp(msg->target, broadcastAddress, 6) == 0)
+    {
+        esp_now_send_message(msg);
+        commands_handler(msg);
+    }
+    else
+    {
+        esp_now_send_message(msg);
+    }
+}
+
 void advertise_ble()
 {
     NimBLEAdvertising *pAdvertising = NimBLEDevice::getAdvertising();
@@ -15,5 +15,6 @@ extern bool is_master;
 void activate_ble();
 void advertise_ble();
 void ble_send_message(const ESPNowMessage *msg);
+void ble_route_message(ESPNowMessage *msg);
 
 #endif
@@ -0,0 +1,41 @@
+/*
+ * Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+ *
+ * This software is released under the MIT License.
+ * https://opensource.org/licenses/MIT
+ */
+
+#include <Arduino.h>
+#include "esp-now.h"
+#include "command-handler.h"
+#include "cmd-reliable.h"
+
+void reliable_ack_cmd(ESPNowMessage msg)
+{
+    ESPNowMessage res;
+    snprintf(res.data, sizeof(res.data), "RACK %s", macStr);
+    memset(&res.target, 0, sizeof(res.target));
+
+    res.cmd_id = msg.cmd_id;
+    res.fwd_ble = 1;
+    esp_now_send_message(&res);
+}
+
+// Acknowledges a wrapped command (RELY [command]) with its command ID, then runs it
+// Retransmissions run the command again, so only idempotent commands should be wrapped
+void reliable_handler(ESPNowMessage *msg)
+{
+    command_task_maker(reliable_ack_cmd, msg);
+
+    ESPNowMessage inner = *msg;
+
+    // The wrapped command may hold binary data (SLED), the whole buffer is shifted
+    memmove(inner.data, &msg->data[5], sizeof(inner.data) - 5);
+    memset(&inner.data[sizeof(inner.data) - 5], 0, 5);
+
+    // Nested wrappers would acknowledge twice
+    if (memcmp(inner.data, "RELY", 4) == 0)
+        return;
+
+    commands_handler(&inner);
+}
@@ -0,0 +1,16 @@
+/*
+ * Copyright (c) 2026 picasso2005 <clementduran0@gmail.com>
+ *
+ * This software is released under the MIT License.
+ * https://opensource.org/licenses/MIT
+ */
+
+#ifndef CMD_RELIABLE_H
+#define CMD_RELIABLE_H
+
+#include "esp-now.h"
+
+void reliable_ack_cmd(ESPNowMessage msg);
+void reliable_handler(ESPNowMessage *msg);
+
+#endif
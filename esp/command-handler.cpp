@@ -9,12 +9,14 @@
 #include <stdlib.h>
 #include <FreeRTOSConfig.h>
 #include "esp-now.h"
+#include "ble.h"
 #include "command-handler.h"
 #include "pins.h"
 
 #include "cmd-ping.h"
 #include "cmd-led.h"
 #include "cmd-clock.h"
+#include "cmd-reliable.h"
 
 void commands_handler(ESPNowMessage *msg)
 {
@@ -34,6 +36,35 @@ void commands_handler(ESPNowMessage *msg)
         command_task_maker(set_clock_cmd, msg, configMAX_PRIORITIES - 1); // High priority command
     else if (memcmp(msg->data, "ACLK", 4) == 0)                           // Automatic set clock based on master
         command_task_maker(auto_set_clock_cmd, msg);
+    else if (memcmp(msg->data, "RELY", 4) == 0) // Reliable command, acknowledged by RACK
+        reliable_handler(msg);
+}
+
+// Unpacks a batch frame (MCMD) written by the computer
+// Each record is: data length (1 byte), target MAC (6 bytes), command ID (1 byte), data
+void multi_commands_handler(const uint8_t *records, int length)
+{
+    int i = 0;
+
+    while (i + 8 <= length)
+    {
+        uint8_t data_length = records[i];
+
+        if (data_length >= sizeof(ESPNowMessage::data) || i + 8 + data_length > length)
+            break;
+
+        ESPNowMessage msg;
+        memset(&msg, 0, sizeof(msg));
+
+        memcpy(msg.target, &records[i + 1], 6);
+        msg.cmd_id = records[i + 7];
+        memcpy(msg.data, &records[i + 8], data_length);
+        msg.fwd_ble = 0;
+
+        ble_route_message(&msg);
+
+        i += 8 + data_length;
+    }
 }
 
 void command_task(void *pvParameters)
@@ -17,6 +17,7 @@ typedef struct
 } CommandTaskParams;
 
 void commands_handler(ESPNowMessage *msg);
+void multi_commands_handler(const uint8_t *records, int length);
 
 void command_task(CommandTaskParams *params);
 void command_task_maker(void (*func)(ESPNowMessage), ESPNowMessage *message);
@@ -21,6 +21,7 @@ typedef struct __attribute__((packed))
 } ESPNowMessage;
 
 const uint8_t broadcastAddress[6] = {0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF};
+const uint8_t nullAddress[6] = {0x00, 0x00, 0x00, 0x00, 0x00, 0x00};
 
 extern uint8_t macAddress[6];
 extern char macStr[18];